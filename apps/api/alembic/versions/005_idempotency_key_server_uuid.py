@@ -0,0 +1,32 @@
+"""Generate idempotency key ids server-side.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Default idempotency_keys.id to gen_random_uuid()."""
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.alter_column(
+        'idempotency_keys',
+        'id',
+        server_default=sa.text('gen_random_uuid()'),
+    )
+
+
+def downgrade():
+    """Remove the server-side id default."""
+    op.alter_column('idempotency_keys', 'id', server_default=None)
+    # pgcrypto is left installed; other objects may depend on it
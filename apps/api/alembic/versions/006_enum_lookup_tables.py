@@ -0,0 +1,93 @@
+"""Replace native enum columns with SMALLINT lookup-table references.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-11-10 00:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_label = None
+depends_on = None
+
+# (lookup table, table, old enum column, new id column, enum type, values in id order)
+LOOKUPS = [
+    ('page_statuses', 'knowledge_pages', 'status', 'status_id', 'pagestatus',
+     ['draft', 'published', 'archived']),
+    ('entity_types', 'mentions', 'entity_type', 'entity_type_id', 'entitytype',
+     ['brand', 'competitor', 'other']),
+    ('dns_statuses', 'hosted_domains', 'dns_status', 'dns_status_id', 'dnsstatus',
+     ['pending', 'verified', 'failed']),
+]
+
+# Single-column indexes on the old enum columns (recreated on downgrade)
+OLD_INDEXES = {
+    'knowledge_pages': 'ix_knowledge_pages_status',
+    'mentions': 'ix_mentions_entity_type',
+}
+
+
+def upgrade():
+    """Create and seed lookup tables, then move each column to a SMALLINT FK."""
+    for lookup, table, old_col, new_col, enum_name, values in LOOKUPS:
+        lookup_table = op.create_table(
+            lookup,
+            sa.Column('id', sa.SmallInteger(), primary_key=True, autoincrement=False),
+            sa.Column('name', sa.String(length=20), nullable=False, unique=True),
+        )
+        op.bulk_insert(
+            lookup_table,
+            [{'id': i, 'name': name} for i, name in enumerate(values, start=1)],
+        )
+
+        op.add_column(table, sa.Column(new_col, sa.SmallInteger(), nullable=True))
+        # Native enums stored member names (e.g. 'PUBLISHED'); lookup names are the values
+        op.execute(
+            f"UPDATE {table} SET {new_col} = l.id FROM {lookup} l "
+            f"WHERE l.name = lower({table}.{old_col}::text)"
+        )
+        op.alter_column(table, new_col, nullable=False)
+        op.create_foreign_key(f'fk_{table}_{new_col}', table, lookup, [new_col], ['id'])
+
+        # Dropping the column also drops any index that references it
+        op.drop_column(table, old_col)
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+    op.create_index(op.f('ix_knowledge_pages_status_id'), 'knowledge_pages', ['status_id'], unique=False)
+    op.create_index(op.f('ix_mentions_entity_type_id'), 'mentions', ['entity_type_id'], unique=False)
+    op.create_index(
+        'ix_knowledge_pages_brand_id_status', 'knowledge_pages', ['brand_id', 'status_id'], unique=False
+    )
+
+
+def downgrade():
+    """Restore the native enum columns."""
+    op.drop_index('ix_knowledge_pages_brand_id_status', table_name='knowledge_pages')
+    op.drop_index(op.f('ix_mentions_entity_type_id'), table_name='mentions')
+    op.drop_index(op.f('ix_knowledge_pages_status_id'), table_name='knowledge_pages')
+
+    for lookup, table, old_col, new_col, enum_name, values in LOOKUPS:
+        enum_type = sa.Enum(*[value.upper() for value in values], name=enum_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+
+        op.add_column(table, sa.Column(old_col, enum_type, nullable=True))
+        op.execute(
+            f"UPDATE {table} SET {old_col} = upper(l.name)::{enum_name} FROM {lookup} l "
+            f"WHERE l.id = {table}.{new_col}"
+        )
+        op.alter_column(table, old_col, nullable=False)
+
+        op.drop_constraint(f'fk_{table}_{new_col}', table, type_='foreignkey')
+        op.drop_column(table, new_col)
+        op.drop_table(lookup)
+
+        if table in OLD_INDEXES:
+            op.create_index(OLD_INDEXES[table], table, [old_col], unique=False)
+
+    op.create_index(
+        'ix_knowledge_pages_brand_id_status', 'knowledge_pages', ['brand_id', 'status'], unique=False
+    )
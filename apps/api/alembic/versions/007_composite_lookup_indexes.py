@@ -0,0 +1,50 @@
+"""Replace single-column lookup indexes with composites matching query shapes.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-11-10 00:20:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_label = None
+depends_on = None
+
+# Single-column indexes no query filters on by themselves
+DROPPED_INDEXES = [
+    ('ix_brands_primary_domain', 'brands', 'primary_domain'),
+    ('ix_hosted_domains_apex_domain', 'hosted_domains', 'apex_domain'),
+    ('ix_hosted_site_bindings_subdomain', 'hosted_site_bindings', 'subdomain'),
+    ('ix_knowledge_pages_slug', 'knowledge_pages', 'slug'),
+    ('ix_knowledge_pages_subdomain', 'knowledge_pages', 'subdomain'),
+]
+
+
+def upgrade():
+    """Drop single-column indexes and add composites."""
+    for index_name, _table, _column in DROPPED_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    op.create_index(
+        'ix_hosted_domains_org_id_apex_domain', 'hosted_domains', ['org_id', 'apex_domain'], unique=False
+    )
+    # Fails if duplicate (hosted_domain_id, subdomain) bindings exist - dedupe first
+    op.create_unique_constraint(
+        'uq_binding_subdomain', 'hosted_site_bindings', ['hosted_domain_id', 'subdomain']
+    )
+    op.create_index(
+        'ix_knowledge_pages_subdomain_path', 'knowledge_pages', ['subdomain', 'path'], unique=False
+    )
+
+
+def downgrade():
+    """Restore single-column indexes."""
+    op.drop_index('ix_knowledge_pages_subdomain_path', table_name='knowledge_pages')
+    op.drop_constraint('uq_binding_subdomain', 'hosted_site_bindings', type_='unique')
+    op.drop_index('ix_hosted_domains_org_id_apex_domain', table_name='hosted_domains')
+
+    for index_name, table, column in DROPPED_INDEXES:
+        op.create_index(index_name, table, [column], unique=False)
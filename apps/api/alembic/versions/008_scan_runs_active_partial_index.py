@@ -0,0 +1,32 @@
+"""Partial index on active scan runs.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-11-11 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Index only queued/running scan runs and drop the full status index."""
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_runs_active "
+            "ON scan_runs (created_at) WHERE status IN ('QUEUED', 'RUNNING')"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_runs_status")
+
+
+def downgrade():
+    """Restore the full status index."""
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_runs_status ON scan_runs (status)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_runs_active")
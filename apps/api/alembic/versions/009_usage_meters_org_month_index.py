@@ -0,0 +1,33 @@
+"""Unique covering index on usage_meters (org_id, month).
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-11-11 00:10:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the month-only index with a unique (org_id, month) covering index."""
+    # Fails if an org already has duplicate rows for a month - merge them first
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_usage_org_month "
+            "ON usage_meters (org_id, month) "
+            "INCLUDE (prompts_used, pages_hosted, overage_cents)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_usage_meters_month")
+
+
+def downgrade():
+    """Restore the month-only index."""
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_usage_meters_month ON usage_meters (month)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_usage_org_month")
@@ -0,0 +1,34 @@
+"""BRIN index on org_monthly_usage.period_start.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-11-11 00:20:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Swap the period_start B-tree for a BRIN index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_omu_period_brin "
+            "ON org_monthly_usage USING brin (period_start) WITH (pages_per_range = 32)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_org_monthly_usage_period_start")
+
+
+def downgrade():
+    """Restore the period_start B-tree."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_org_monthly_usage_period_start "
+            "ON org_monthly_usage (period_start)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_omu_period_brin")
@@ -0,0 +1,51 @@
+"""Use (org_id, period_start) as the org_monthly_usage primary key.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-11-11 00:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Drop the UUID surrogate key and the indexes duplicating the natural key."""
+    op.drop_index('ix_org_monthly_usage_org_period', table_name='org_monthly_usage')
+    op.drop_index(op.f('ix_org_monthly_usage_org_id'), table_name='org_monthly_usage')
+    op.drop_constraint('uq_usage_org_period', 'org_monthly_usage', type_='unique')
+    op.drop_constraint('org_monthly_usage_pkey', 'org_monthly_usage', type_='primary')
+    op.drop_column('org_monthly_usage', 'id')
+
+    op.create_primary_key('org_monthly_usage_pkey', 'org_monthly_usage', ['org_id', 'period_start'])
+    # One-off physical reorder so rows for an org sit together
+    op.execute("CLUSTER org_monthly_usage USING org_monthly_usage_pkey")
+
+
+def downgrade():
+    """Restore the UUID surrogate key."""
+    op.drop_constraint('org_monthly_usage_pkey', 'org_monthly_usage', type_='primary')
+    op.add_column(
+        'org_monthly_usage',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text('gen_random_uuid()'),
+        ),
+    )
+    op.create_primary_key('org_monthly_usage_pkey', 'org_monthly_usage', ['id'])
+    op.alter_column('org_monthly_usage', 'id', server_default=None)
+
+    op.create_unique_constraint('uq_usage_org_period', 'org_monthly_usage', ['org_id', 'period_start'])
+    op.create_index(op.f('ix_org_monthly_usage_org_id'), 'org_monthly_usage', ['org_id'], unique=False)
+    op.create_index(
+        'ix_org_monthly_usage_org_period', 'org_monthly_usage', ['org_id', 'period_start'], unique=False
+    )
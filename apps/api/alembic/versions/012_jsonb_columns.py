@@ -0,0 +1,46 @@
+"""Convert JSON columns to JSONB and GIN-index scan_runs.model_matrix_json.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-11-11 00:40:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_label = None
+depends_on = None
+
+JSONB_COLUMNS = [
+    ("plans", "limits_json"),
+    ("prompt_set_items", "variables_json"),
+    ("scan_runs", "model_matrix_json"),
+    ("scan_results", "parsed_json"),
+]
+
+
+def upgrade():
+    """Store JSON payloads as binary JSONB."""
+    for table, column in JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+        )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_runs_models_gin "
+            "ON scan_runs USING gin (model_matrix_json)"
+        )
+
+
+def downgrade():
+    """Revert JSONB columns to JSON."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_runs_models_gin")
+
+    for table, column in JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON USING {column}::json"
+        )
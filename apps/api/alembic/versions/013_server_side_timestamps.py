@@ -0,0 +1,51 @@
+"""Server-side TIMESTAMPTZ created_at/updated_at defaults.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-11-11 00:50:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_label = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [
+    ("orgs", "created_at"),
+    ("org_members", "created_at"),
+    ("plans", "created_at"),
+    ("usage_meters", "created_at"),
+    ("usage_meters", "updated_at"),
+    ("org_monthly_usage", "created_at"),
+    ("org_monthly_usage", "updated_at"),
+    ("prompt_templates", "created_at"),
+    ("prompt_sets", "created_at"),
+    ("prompt_set_items", "created_at"),
+    ("scan_runs", "created_at"),
+    ("scan_results", "created_at"),
+    ("users", "created_at"),
+    ("api_keys", "created_at"),
+]
+
+
+def upgrade():
+    """Store timestamps as TIMESTAMPTZ (existing values are UTC) defaulting to now()."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} TYPE TIMESTAMPTZ USING {column} AT TIME ZONE 'UTC', "
+            f"ALTER COLUMN {column} SET DEFAULT now()"
+        )
+
+
+def downgrade():
+    """Revert to naive UTC timestamps without a server default."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} DROP DEFAULT, "
+            f"ALTER COLUMN {column} TYPE TIMESTAMP USING {column} AT TIME ZONE 'UTC'"
+        )
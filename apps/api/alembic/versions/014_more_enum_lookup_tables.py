@@ -0,0 +1,87 @@
+"""Move scan status, org role and plan tier enums to SMALLINT lookup tables.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-11-11 01:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_label = None
+depends_on = None
+
+# (lookup table, table, old enum column, new id column, enum type, values in id order)
+LOOKUPS = [
+    ('scan_statuses', 'scan_runs', 'status', 'status_id', 'scanstatus',
+     ['queued', 'running', 'done', 'failed']),
+    ('org_roles', 'org_members', 'role', 'role_id', 'orgrole',
+     ['owner', 'admin', 'member']),
+    ('plan_tiers', 'orgs', 'plan_tier', 'plan_tier_id', 'plantier',
+     ['starter', 'pro', 'business', 'enterprise']),
+]
+
+
+def upgrade():
+    """Create and seed lookup tables, then move each column to a SMALLINT FK."""
+    for lookup, table, old_col, new_col, enum_name, values in LOOKUPS:
+        lookup_table = op.create_table(
+            lookup,
+            sa.Column('id', sa.SmallInteger(), primary_key=True, autoincrement=False),
+            sa.Column('name', sa.String(length=20), nullable=False, unique=True),
+        )
+        op.bulk_insert(
+            lookup_table,
+            [{'id': i, 'name': name} for i, name in enumerate(values, start=1)],
+        )
+
+        op.add_column(table, sa.Column(new_col, sa.SmallInteger(), nullable=True))
+        op.execute(
+            f"UPDATE {table} SET {new_col} = l.id FROM {lookup} l "
+            f"WHERE l.name = lower({table}.{old_col}::text)"
+        )
+        op.alter_column(table, new_col, nullable=False)
+        op.create_foreign_key(f'fk_{table}_{new_col}', table, lookup, [new_col], ['id'])
+
+        # Dropping the column also drops any index that references it
+        op.drop_column(table, old_col)
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+    op.create_index(op.f('ix_orgs_plan_tier_id'), 'orgs', ['plan_tier_id'], unique=False)
+    op.create_index('ix_scan_runs_brand_id_status', 'scan_runs', ['brand_id', 'status_id'], unique=False)
+    op.create_index(
+        'ix_scan_runs_active', 'scan_runs', ['created_at'], unique=False,
+        postgresql_where=sa.text('status_id IN (1, 2)'),
+    )
+
+
+def downgrade():
+    """Restore the native enum columns."""
+    op.drop_index('ix_scan_runs_active', table_name='scan_runs')
+    op.drop_index('ix_scan_runs_brand_id_status', table_name='scan_runs')
+    op.drop_index(op.f('ix_orgs_plan_tier_id'), table_name='orgs')
+
+    for lookup, table, old_col, new_col, enum_name, values in LOOKUPS:
+        enum_type = sa.Enum(*[value.upper() for value in values], name=enum_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+
+        op.add_column(table, sa.Column(old_col, enum_type, nullable=True))
+        op.execute(
+            f"UPDATE {table} SET {old_col} = upper(l.name)::{enum_name} FROM {lookup} l "
+            f"WHERE l.id = {table}.{new_col}"
+        )
+        op.alter_column(table, old_col, nullable=False)
+
+        op.drop_constraint(f'fk_{table}_{new_col}', table, type_='foreignkey')
+        op.drop_column(table, new_col)
+        op.drop_table(lookup)
+
+    op.create_index(op.f('ix_orgs_plan_tier'), 'orgs', ['plan_tier'], unique=False)
+    op.create_index('ix_scan_runs_brand_id_status', 'scan_runs', ['brand_id', 'status'], unique=False)
+    op.create_index(
+        'ix_scan_runs_active', 'scan_runs', ['created_at'], unique=False,
+        postgresql_where=sa.text("status IN ('QUEUED', 'RUNNING')"),
+    )
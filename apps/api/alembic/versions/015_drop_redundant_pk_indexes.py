@@ -0,0 +1,49 @@
+"""Drop single-column id indexes that duplicate the primary key.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-11-11 01:10:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_label = None
+depends_on = None
+
+TABLES = [
+    'audit_logs',
+    'brands',
+    'competitors',
+    'hosted_domains',
+    'hosted_site_bindings',
+    'knowledge_pages',
+    'mentions',
+    'orgs',
+    'org_members',
+    'plans',
+    'usage_meters',
+    'prompt_templates',
+    'prompt_sets',
+    'prompt_set_items',
+    'scan_runs',
+    'scan_results',
+    'users',
+    'api_keys',
+]
+
+
+def upgrade():
+    """Drop ix_<table>_id; the primary key index already covers id lookups."""
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_id")
+
+
+def downgrade():
+    """Recreate the ix_<table>_id indexes."""
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_id ON {table} (id)")
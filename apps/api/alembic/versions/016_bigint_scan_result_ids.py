@@ -0,0 +1,38 @@
+"""Widen scan_results and mentions ids to BIGINT.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-11-11 01:20:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Promote the ids (and their sequences) to 64-bit."""
+    op.execute("ALTER TABLE scan_results ALTER COLUMN id TYPE BIGINT")
+    op.execute("ALTER SEQUENCE scan_results_id_seq AS BIGINT")
+    op.execute(
+        "ALTER TABLE mentions "
+        "ALTER COLUMN id TYPE BIGINT, "
+        "ALTER COLUMN scan_result_id TYPE BIGINT"
+    )
+    op.execute("ALTER SEQUENCE mentions_id_seq AS BIGINT")
+
+
+def downgrade():
+    """Narrow the ids back to 32-bit (fails if any id exceeds INT_MAX)."""
+    op.execute("ALTER SEQUENCE mentions_id_seq AS INTEGER")
+    op.execute(
+        "ALTER TABLE mentions "
+        "ALTER COLUMN id TYPE INTEGER, "
+        "ALTER COLUMN scan_result_id TYPE INTEGER"
+    )
+    op.execute("ALTER SEQUENCE scan_results_id_seq AS INTEGER")
+    op.execute("ALTER TABLE scan_results ALTER COLUMN id TYPE INTEGER")
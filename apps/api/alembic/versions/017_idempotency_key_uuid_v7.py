@@ -0,0 +1,57 @@
+"""Generate idempotency key ids as time-ordered UUIDv7.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-11-11 01:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Add uuid_generate_v7() and use it for idempotency_keys.id."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    op.alter_column(
+        'idempotency_keys',
+        'id',
+        server_default=sa.text('uuid_generate_v7()'),
+    )
+
+
+def downgrade():
+    """Go back to random UUIDv4 ids."""
+    op.alter_column(
+        'idempotency_keys',
+        'id',
+        server_default=sa.text('gen_random_uuid()'),
+    )
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
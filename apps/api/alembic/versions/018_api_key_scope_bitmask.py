@@ -0,0 +1,45 @@
+"""Store api_keys.scopes as a SMALLINT bitmask.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-11-11 01:40:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_label = None
+depends_on = None
+
+# Scope name -> bit, matching ApiKey.SCOPE_*
+SCOPE_BITS = [('read', 1), ('write', 2), ('admin', 4)]
+
+
+def upgrade():
+    """Convert comma-separated scope names to a bitmask."""
+    bits = " | ".join(
+        f"(CASE WHEN '{name}' = ANY(regexp_split_to_array(scopes, '\\s*,\\s*')) "
+        f"THEN {bit} ELSE 0 END)"
+        for name, bit in SCOPE_BITS
+    )
+    op.execute(
+        "ALTER TABLE api_keys "
+        "ALTER COLUMN scopes DROP DEFAULT, "
+        f"ALTER COLUMN scopes TYPE SMALLINT USING ({bits}), "
+        "ALTER COLUMN scopes SET DEFAULT 1"
+    )
+
+
+def downgrade():
+    """Convert the bitmask back to comma-separated scope names."""
+    names = ", ".join(
+        f"CASE WHEN scopes & {bit} <> 0 THEN '{name}' END" for name, bit in SCOPE_BITS
+    )
+    op.execute(
+        "ALTER TABLE api_keys "
+        "ALTER COLUMN scopes DROP DEFAULT, "
+        f"ALTER COLUMN scopes TYPE TEXT USING concat_ws(',', {names}), "
+        "ALTER COLUMN scopes SET DEFAULT 'read'"
+    )
@@ -0,0 +1,34 @@
+"""Partial unique index on orgs.stripe_customer_id.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-11-11 01:50:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Index only orgs that have a Stripe customer."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_orgs_stripe_cust_active "
+            "ON orgs (stripe_customer_id) WHERE stripe_customer_id IS NOT NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_orgs_stripe_customer_id")
+
+
+def downgrade():
+    """Restore the full unique index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_orgs_stripe_customer_id "
+            "ON orgs (stripe_customer_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_orgs_stripe_cust_active")
@@ -0,0 +1,34 @@
+"""Composite (scan_run_id, model_name) index on scan_results.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2025-11-11 02:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Index results by run (and model) and drop the model_name-only index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_results_run_model "
+            "ON scan_results (scan_run_id, model_name)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_results_model_name")
+
+
+def downgrade():
+    """Restore the model_name index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_results_model_name "
+            "ON scan_results (model_name)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_results_run_model")
@@ -0,0 +1,102 @@
+"""Trigger-maintained result and mention counters on scan_runs.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2025-11-11 02:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Add the counter columns, backfill them and install the insert triggers."""
+    op.add_column(
+        'scan_runs',
+        sa.Column('result_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'scan_runs',
+        sa.Column('mention_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    op.execute(
+        """
+        UPDATE scan_runs r
+        SET result_count = c.results, mention_count = c.mentions
+        FROM (
+            SELECT sr.scan_run_id, count(DISTINCT sr.id) AS results, count(m.id) AS mentions
+            FROM scan_results sr
+            LEFT JOIN mentions m ON m.scan_result_id = sr.id
+            GROUP BY sr.scan_run_id
+        ) c
+        WHERE r.id = c.scan_run_id
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION scan_runs_count_results() RETURNS trigger AS $$
+        BEGIN
+            UPDATE scan_runs r
+            SET result_count = r.result_count + n.cnt
+            FROM (
+                SELECT scan_run_id, count(*) AS cnt FROM new_rows GROUP BY scan_run_id
+            ) n
+            WHERE r.id = n.scan_run_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_scan_results_count
+        AFTER INSERT ON scan_results
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION scan_runs_count_results()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION scan_runs_count_mentions() RETURNS trigger AS $$
+        BEGIN
+            UPDATE scan_runs r
+            SET mention_count = r.mention_count + n.cnt
+            FROM (
+                SELECT sr.scan_run_id, count(*) AS cnt
+                FROM new_rows m
+                JOIN scan_results sr ON sr.id = m.scan_result_id
+                GROUP BY sr.scan_run_id
+            ) n
+            WHERE r.id = n.scan_run_id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_mentions_count
+        AFTER INSERT ON mentions
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION scan_runs_count_mentions()
+        """
+    )
+
+
+def downgrade():
+    """Drop the triggers and counter columns."""
+    op.execute("DROP TRIGGER IF EXISTS trg_mentions_count ON mentions")
+    op.execute("DROP TRIGGER IF EXISTS trg_scan_results_count ON scan_results")
+    op.execute("DROP FUNCTION IF EXISTS scan_runs_count_mentions()")
+    op.execute("DROP FUNCTION IF EXISTS scan_runs_count_results()")
+    op.drop_column('scan_runs', 'mention_count')
+    op.drop_column('scan_runs', 'result_count')
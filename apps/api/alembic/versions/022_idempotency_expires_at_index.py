@@ -0,0 +1,29 @@
+"""Index idempotency_keys.expires_at for the expiry sweep.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2025-11-11 02:20:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Create the expires_at index declared on the model."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_idempotency_keys_expires_at "
+            "ON idempotency_keys (expires_at)"
+        )
+
+
+def downgrade():
+    """Drop the expires_at index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_idempotency_keys_expires_at")
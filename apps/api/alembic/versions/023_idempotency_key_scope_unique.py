@@ -0,0 +1,40 @@
+"""Scope idempotency key uniqueness to (key, org, resource type).
+
+Revision ID: 023
+Revises: 022
+Create Date: 2025-11-11 02:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the global unique key index with a scoped unique constraint."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_idempotency_key_scope "
+            "ON idempotency_keys (idempotency_key, org_id, resource_type)"
+        )
+        op.execute(
+            "ALTER TABLE idempotency_keys "
+            "ADD CONSTRAINT uq_idempotency_key_scope UNIQUE USING INDEX uq_idempotency_key_scope"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_idempotency_keys_idempotency_key")
+
+
+def downgrade():
+    """Restore the global unique index on idempotency_key."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_idempotency_keys_idempotency_key "
+            "ON idempotency_keys (idempotency_key)"
+        )
+        op.execute(
+            "ALTER TABLE idempotency_keys DROP CONSTRAINT IF EXISTS uq_idempotency_key_scope"
+        )
@@ -0,0 +1,39 @@
+"""Server-side TIMESTAMPTZ created_at for audit logs and idempotency keys.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2025-11-11 02:40:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '024'
+down_revision = '023'
+branch_label = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [
+    ("audit_logs", "created_at"),
+    ("idempotency_keys", "created_at"),
+]
+
+
+def upgrade():
+    """Store timestamps as TIMESTAMPTZ (existing values are UTC) defaulting to now()."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} TYPE TIMESTAMPTZ USING {column} AT TIME ZONE 'UTC', "
+            f"ALTER COLUMN {column} SET DEFAULT now()"
+        )
+
+
+def downgrade():
+    """Revert to naive UTC timestamps without a server default."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} DROP DEFAULT, "
+            f"ALTER COLUMN {column} TYPE TIMESTAMP USING {column} AT TIME ZONE 'UTC'"
+        )
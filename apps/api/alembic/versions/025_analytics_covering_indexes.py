@@ -0,0 +1,48 @@
+"""Covering indexes for the competitor analysis aggregate.
+
+Replaces the (brand_id, status_id) and entity_type_id indexes, which are
+prefixes of the new ones.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2025-11-11 02:50:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '025'
+down_revision = '024'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Build the covering indexes, then drop the indexes they supersede."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_runs_brand_status_created "
+            "ON scan_runs (brand_id, status_id, created_at) INCLUDE (id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_mentions_entity_metrics "
+            "ON mentions (entity_type_id, entity_name, scan_result_id) "
+            "INCLUDE (sentiment, position_index, confidence, id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_runs_brand_id_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_mentions_entity_type_id")
+
+
+def downgrade():
+    """Restore the narrower indexes and drop the covering ones."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_runs_brand_id_status "
+            "ON scan_runs (brand_id, status_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_mentions_entity_type_id "
+            "ON mentions (entity_type_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_mentions_entity_metrics")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_runs_brand_status_created")
@@ -0,0 +1,30 @@
+"""Store idempotency_keys.response_body as JSONB.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2025-11-11 03:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '026'
+down_revision = '025'
+branch_label = None
+depends_on = None
+
+
+def upgrade():
+    """Convert the cached JSON text to JSONB."""
+    op.execute(
+        "ALTER TABLE idempotency_keys "
+        "ALTER COLUMN response_body TYPE JSONB USING response_body::jsonb"
+    )
+
+
+def downgrade():
+    """Convert response_body back to JSON text."""
+    op.execute(
+        "ALTER TABLE idempotency_keys "
+        "ALTER COLUMN response_body TYPE TEXT USING response_body::text"
+    )
@@ -1,9 +1,9 @@
 """Analytics endpoints."""
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,7 +30,7 @@ async def get_dashboard_stats(
     db: Session = Depends(get_db),
 ):
     """Get dashboard statistics for a brand."""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -60,16 +60,17 @@ async def get_dashboard_stats(
     prev_month_start = now - timedelta(days=60)
     last_week_start = now - timedelta(days=7)
 
-    # Get scan runs for this brand
-    scan_run_ids = [sr.id for sr in brand.scan_runs]
+    # Scan run ids for this brand, as a subquery (Brand.scan_runs is lazy="raise")
+    scan_run_ids = select(ScanRun.id).where(ScanRun.brand_id == brand.id)
 
-    # Total mentions (current period)
+    # Total mentions (current period), summed from the per-run rollups. Periods
+    # are bounded per run: all of a run's mentions count in the period the run
+    # was created in, even if some were recorded after the boundary
     total_mentions = (
-        db.query(func.count(Mention.id))
-        .join(ScanResult)
+        db.query(func.sum(ScanRun.mention_count))
         .filter(
-            ScanResult.scan_run_id.in_(scan_run_ids),
-            Mention.created_at >= last_month_start,
+            ScanRun.brand_id == brand.id,
+            ScanRun.created_at >= last_month_start,
         )
         .scalar()
         or 0
@@ -77,12 +78,11 @@ async def get_dashboard_stats(
 
     # Previous period mentions
     prev_mentions = (
-        db.query(func.count(Mention.id))
-        .join(ScanResult)
+        db.query(func.sum(ScanRun.mention_count))
         .filter(
-            ScanResult.scan_run_id.in_(scan_run_ids),
-            Mention.created_at >= prev_month_start,
-            Mention.created_at < last_month_start,
+            ScanRun.brand_id == brand.id,
+            ScanRun.created_at >= prev_month_start,
+            ScanRun.created_at < last_month_start,
         )
         .scalar()
         or 0
@@ -221,17 +221,8 @@ async def get_dashboard_stats(
 
     recent_scan_responses = []
     for scan in recent_scans:
-        # Get mention count for this scan
-        mention_count = (
-            db.query(func.count(Mention.id))
-            .join(ScanResult)
-            .filter(ScanResult.scan_run_id == scan.id)
-            .scalar()
-            or 0
-        )
-
         # Calculate time ago
-        time_diff = now - scan.created_at
+        time_diff = now.replace(tzinfo=timezone.utc) - scan.created_at
         if time_diff.days > 0:
             time_ago = f"{time_diff.days} day{'s' if time_diff.days > 1 else ''} ago"
         elif time_diff.seconds // 3600 > 0:
@@ -246,7 +237,7 @@ async def get_dashboard_stats(
                 id=scan.id,
                 name=f"Scan #{scan.id}",
                 models_tested=len(scan.model_matrix_json) if scan.model_matrix_json else 0,
-                mentions_found=mention_count,
+                mentions_found=scan.mention_count,
                 time_ago=time_ago,
             )
         )
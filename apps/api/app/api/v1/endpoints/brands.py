@@ -53,10 +53,9 @@ async def create_brand(
     )
 
     db.add(brand)
-    db.commit()
-    db.refresh(brand)
+    db.flush()  # Assigns brand.id for the audit row
 
-    # Audit log
+    # Audit log, committed in the same transaction as the brand
     audit_ctx = get_audit_context(request, current_user, org_member.org_id)
     AuditLogger.log_create(
         db=db,
@@ -66,6 +65,9 @@ async def create_brand(
         **audit_ctx,
     )
 
+    db.commit()
+    db.refresh(brand)
+
     return brand
 
 
@@ -76,7 +78,7 @@ async def get_brand(
     db: Session = Depends(get_db),
 ):
     """Get brand by ID."""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -140,8 +142,8 @@ async def list_brands(
         cursor_id = cursor_data.get("id")
         cursor_created_at = cursor_data.get("created_at")
         if cursor_id and cursor_created_at:
-            from datetime import datetime
-            created_at_dt = datetime.fromisoformat(cursor_created_at)
+            # created_at is a naive UTC column
+            created_at_dt = cursor_created_at.replace(tzinfo=None)
             query = query.filter(
                 (Brand.created_at < created_at_dt) | 
                 ((Brand.created_at == created_at_dt) & (Brand.id < cursor_id))
@@ -159,7 +161,7 @@ async def list_brands(
     next_cursor = None
     if has_more and brands:
         last_brand = brands[-1]
-        next_cursor = encode_cursor(last_brand.id, last_brand.created_at.isoformat())
+        next_cursor = encode_cursor(last_brand.id, last_brand.created_at)
 
     return PaginatedResponse(items=brands, next_cursor=next_cursor, has_more=has_more)
 
@@ -173,7 +175,7 @@ async def update_brand(
     db: Session = Depends(get_db),
 ):
     """Update brand (requires admin role)."""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -209,10 +211,7 @@ async def update_brand(
         changes["primary_domain"] = {"old": brand.primary_domain, "new": brand_data.primary_domain}
         brand.primary_domain = brand_data.primary_domain
 
-    db.commit()
-    db.refresh(brand)
-
-    # Audit log
+    # Audit log, committed in the same transaction as the update
     if changes:
         audit_ctx = get_audit_context(request, current_user, org_member.org_id)
         AuditLogger.log_update(
@@ -223,6 +222,9 @@ async def update_brand(
             **audit_ctx,
         )
 
+    db.commit()
+    db.refresh(brand)
+
     return brand
 
 
@@ -238,7 +240,7 @@ async def add_competitor(
     db: Session = Depends(get_db),
 ):
     """Add competitor to brand."""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -282,7 +284,7 @@ async def list_competitors(
     db: Session = Depends(get_db),
 ):
     """List competitors for a brand."""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -3,10 +3,12 @@ from datetime import datetime
 from typing import List
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_user
+from app.config import settings
 from app.database import get_db
 from app.deps.quotas import require_page_slot
 from app.models.brand import Brand
@@ -25,6 +27,9 @@ from app.services.impact_analyzer import ImpactAnalyzer
 
 router = APIRouter()
 
+# Caches page impact analyses; connects lazily on first use
+impact_cache = Redis.from_url(settings.REDIS_URL)
+
 
 @router.post("", response_model=KnowledgePageResponse, status_code=status.HTTP_201_CREATED)
 async def create_knowledge_page(
@@ -35,7 +40,7 @@ async def create_knowledge_page(
 ):
     """Create a new knowledge page (starts generation)."""
     # Verify brand exists and user has access
-    brand = db.query(Brand).filter(Brand.id == page_data.brand_id).first()
+    brand = db.get(Brand, page_data.brand_id)
 
     if not brand:
         raise HTTPException(
@@ -111,7 +116,7 @@ async def get_knowledge_page(
         )
 
     # Verify access
-    brand = db.query(Brand).filter(Brand.id == page.brand_id).first()
+    brand = db.get(Brand, page.brand_id)
     org_member = (
         db.query(OrgMember)
         .filter(
@@ -142,7 +147,7 @@ async def list_knowledge_pages(
     
     Returns pages ordered by created_at (newest first).
     """
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -159,8 +164,8 @@ async def list_knowledge_pages(
         cursor_id = cursor_data.get("id")
         cursor_created_at = cursor_data.get("created_at")
         if cursor_id and cursor_created_at:
-            from datetime import datetime
-            created_at_dt = datetime.fromisoformat(cursor_created_at)
+            # created_at is a naive UTC column
+            created_at_dt = cursor_created_at.replace(tzinfo=None)
             query = query.filter(
                 (KnowledgePage.created_at < created_at_dt) | 
                 ((KnowledgePage.created_at == created_at_dt) & (KnowledgePage.id < cursor_id))
@@ -178,7 +183,7 @@ async def list_knowledge_pages(
     next_cursor = None
     if has_more and pages:
         last_page = pages[-1]
-        next_cursor = encode_cursor(last_page.id, last_page.created_at.isoformat())
+        next_cursor = encode_cursor(last_page.id, last_page.created_at)
 
     return PaginatedResponse(
         items=pages,
@@ -204,7 +209,7 @@ async def update_knowledge_page(
         )
 
     # Verify access
-    brand = db.query(Brand).filter(Brand.id == page.brand_id).first()
+    brand = db.get(Brand, page.brand_id)
     org_member = (
         db.query(OrgMember)
         .filter(
@@ -251,7 +256,7 @@ async def publish_knowledge_page(
         )
 
     # Verify access
-    brand = db.query(Brand).filter(Brand.id == page.brand_id).first()
+    brand = db.get(Brand, page.brand_id)
     org_member = (
         db.query(OrgMember)
         .filter(
@@ -329,7 +334,7 @@ async def get_page_impact(
     # Check org membership here
     
     # Get impact analysis
-    analyzer = ImpactAnalyzer(db)
+    analyzer = ImpactAnalyzer(db, redis_client=impact_cache)
     impact = await analyzer.get_page_impact(
         page_id=page_id,
         before_days=before_days,
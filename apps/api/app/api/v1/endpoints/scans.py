@@ -2,7 +2,8 @@
 from typing import List
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 
 from app.auth import get_current_user
 from app.database import get_db
@@ -39,7 +40,7 @@ async def create_scan_run(
     without creating a duplicate scan or consuming additional credits.
     """
     # Verify brand exists and user has access
-    brand = db.query(Brand).filter(Brand.id == scan_data.brand_id).first()
+    brand = db.get(Brand, scan_data.brand_id)
 
     if not brand:
         raise HTTPException(
@@ -79,18 +80,22 @@ async def create_scan_run(
     
     # Reserve all credits at once
     if scan_data.models:
-        from app.services.quotas import get_or_create_usage, get_plan, assert_within_limit
+        from app.services.quotas import increment_usage, get_plan, assert_within_limit
         from app.models.org import Org
         
         org = db.query(Org).filter(Org.id == brand.org_id).first()
         plan = get_plan(org)
-        usage = get_or_create_usage(db, org)
         
-        # Check if we have enough credits for all scans
-        assert_within_limit(usage.scans_used + total_credits_needed, plan["scans"], "Scan")
+        # Reserve the credits in one upsert
+        usage = increment_usage(db, org, scans=total_credits_needed)
+        
+        # Check if we have enough credits for all scans; roll back to release them
+        try:
+            assert_within_limit(usage.scans_used, plan["scans"], "Scan")
+        except HTTPException:
+            db.rollback()
+            raise
         
-        # Reserve the credits
-        usage.scans_used += total_credits_needed
         db.commit()
 
     # Create scan run
@@ -109,9 +114,10 @@ async def create_scan_run(
     try:
         from app.services.job_queue import JobQueueService
         job_service = JobQueueService()
+        # Job key defaults to the scan run id; retried requests were already
+        # answered from the Idempotency-Key cache above
         job_service.enqueue_scan(
             scan_run_id=scan_run.id,
-            idempotency_key=idempotency_key,
             request_id=request.headers.get("X-Request-ID"),
             user_id=current_user.id,
             org_id=brand.org_id,
@@ -124,8 +130,7 @@ async def create_scan_run(
     # Store idempotency key if provided
     idempotency_key = request.headers.get("Idempotency-Key")
     if idempotency_key:
-        from app.schemas.scan import ScanRunResponse as ResponseSchema
-        response_dict = ResponseSchema.from_orm(scan_run).dict()
+        response_dict = ScanRunResponse.model_validate(scan_run).model_dump(mode="json")
         store_idempotency_key(
             idempotency_key=idempotency_key,
             db=db,
@@ -146,7 +151,12 @@ async def get_scan_run(
     db: Session = Depends(get_db),
 ):
     """Get scan run by ID with results."""
-    scan_run = db.query(ScanRun).filter(ScanRun.id == scan_id).first()
+    scan_run = (
+        db.query(ScanRun)
+        .options(selectinload(ScanRun.results))
+        .filter(ScanRun.id == scan_id)
+        .first()
+    )
 
     if not scan_run:
         raise HTTPException(
@@ -155,7 +165,7 @@ async def get_scan_run(
         )
 
     # Verify access
-    brand = db.query(Brand).filter(Brand.id == scan_run.brand_id).first()
+    brand = db.get(Brand, scan_run.brand_id)
     org_member = (
         db.query(OrgMember)
         .filter(
@@ -186,7 +196,7 @@ async def list_scan_runs(
     
     Returns scan runs ordered by created_at (newest first).
     """
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -211,7 +221,11 @@ async def list_scan_runs(
         )
 
     # Build query with pagination
-    query = db.query(ScanRun).filter(ScanRun.brand_id == brand_id).order_by(ScanRun.created_at.desc(), ScanRun.id.desc())
+    query = (
+        db.query(ScanRun)
+        .filter(ScanRun.brand_id == brand_id)
+        .order_by(ScanRun.created_at.desc(), ScanRun.id.desc())
+    )
     
     # Apply cursor if provided
     cursor_data = decode_cursor(pagination.cursor)
@@ -219,11 +233,9 @@ async def list_scan_runs(
         cursor_id = cursor_data.get("id")
         cursor_created_at = cursor_data.get("created_at")
         if cursor_id and cursor_created_at:
-            from datetime import datetime
-            created_at_dt = datetime.fromisoformat(cursor_created_at)
             query = query.filter(
-                (ScanRun.created_at < created_at_dt) | 
-                ((ScanRun.created_at == created_at_dt) & (ScanRun.id < cursor_id))
+                (ScanRun.created_at < cursor_created_at) | 
+                ((ScanRun.created_at == cursor_created_at) & (ScanRun.id < cursor_id))
             )
 
     # Fetch limit + 1 to determine if more results exist
@@ -238,7 +250,7 @@ async def list_scan_runs(
     next_cursor = None
     if has_more and scan_runs:
         last_scan = scan_runs[-1]
-        next_cursor = encode_cursor(last_scan.id, last_scan.created_at.isoformat())
+        next_cursor = encode_cursor(last_scan.id, last_scan.created_at)
 
     return PaginatedResponse(
         items=scan_runs,
@@ -255,7 +267,7 @@ async def list_mentions(
     db: Session = Depends(get_db),
 ):
     """List mentions for a brand."""
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
 
     if not brand:
         raise HTTPException(
@@ -263,8 +275,8 @@ async def list_mentions(
             detail="Brand not found",
         )
 
-    # Get all scan runs for this brand
-    scan_run_ids = [sr.id for sr in brand.scan_runs]
+    # Scan run ids for this brand, as a subquery (Brand.scan_runs is lazy="raise")
+    scan_run_ids = select(ScanRun.id).where(ScanRun.brand_id == brand.id)
 
     # Get mentions
     from app.models.scan import ScanResult
@@ -12,6 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from typing import Optional
 from datetime import datetime
+from functools import partial
+import asyncio
+import gzip
 
 from app.database import get_db
 from app.models.knowledge_page import KnowledgePage
@@ -28,6 +31,11 @@ page_renderer = PageRenderer()
 page_cache = PageCache()
 schema_validator = SchemaValidator()
 
+# Rendering is CPU-bound and grows with the content (~1ms per 40KB); pages
+# at least this large render in a worker thread so they don't stall the
+# event loop. Smaller ones render inline, as a thread hop costs ~60us.
+RENDER_IN_THREAD_CHARS = 32 * 1024
+
 
 def extract_subdomain(request: Request) -> Optional[str]:
     """
@@ -58,10 +66,43 @@ def extract_subdomain(request: Request) -> Optional[str]:
     return None
 
 
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows a gzip-encoded response.
+    
+    Honours q-values, so "gzip;q=0" refuses gzip; a wildcard applies when
+    gzip isn't listed.
+    
+    Args:
+        accept_encoding: Accept-Encoding header value
+        
+    Returns:
+        True if gzip is acceptable
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
 async def serve_page_internal(
     subdomain: str,
     path: str,
-    db: AsyncSession
+    db: AsyncSession,
+    accept_gzip: bool = False
 ) -> Response:
     """
     Internal function to serve a published knowledge page.
@@ -70,6 +111,7 @@ async def serve_page_internal(
         subdomain: Page subdomain (e.g., "acme")
         path: Page path (e.g., "/product-guide")
         db: Database session
+        accept_gzip: Whether the client accepts gzip-encoded responses
         
     Returns:
         HTML page with full SEO tags
@@ -79,68 +121,77 @@ async def serve_page_internal(
     if not path:
         path = "index"
     
-    # Try to get from cache first
-    cached_html = await page_cache.get_page(subdomain, path)
-    if cached_html:
-        return Response(
-            content=cached_html,
-            media_type="text/html",
-            headers={
-                "X-Cache": "HIT",
-                "Cache-Control": "public, max-age=3600"
-            }
-        )
+    rendered = False
     
-    # Query database for page
-    query = (
-        select(KnowledgePage)
-        .where(
-            and_(
-                KnowledgePage.subdomain == subdomain,
-                KnowledgePage.path == path,
-                KnowledgePage.status == 'published'
+    async def render_page() -> bytes:
+        nonlocal rendered
+        rendered = True
+        
+        # Query database for page
+        query = (
+            select(KnowledgePage)
+            .where(
+                and_(
+                    KnowledgePage.subdomain == subdomain,
+                    KnowledgePage.path == path,
+                    KnowledgePage.status == 'published'
+                )
             )
         )
-    )
-    
-    result = await db.execute(query)
-    page = result.scalar_one_or_none()
-    
-    if not page:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Page not found: {subdomain}/{path}"
-        )
+        
+        result = await db.execute(query)
+        page = result.scalar_one_or_none()
+        
+        if not page:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Page not found: {subdomain}/{path}"
+            )
+        
+        # Build canonical URL from subdomain and path
+        canonical_url = page.canonical_url or f"https://{subdomain}.prompter.site/{path}"
+        
+        # Get page HTML (if already rendered) or render it
+        if page.html:
+            html = page.html.encode()
+        else:
+            # Render from MDX if HTML not available
+            render = partial(
+                page_renderer.render_html,
+                title=page.title,
+                content_html=page.mdx,  # In production, convert MDX to HTML
+                meta_description=None,  # Will be auto-generated
+                canonical_url=canonical_url,
+                schema_json=page.schema_json,
+                og_image=None,
+                published_at=page.published_at,
+                updated_at=page.updated_at
+            )
+            if len(page.mdx or "") >= RENDER_IN_THREAD_CHARS:
+                html = await asyncio.to_thread(render)
+            else:
+                html = render()
+        
+        return html
     
-    # Build canonical URL from subdomain and path
-    canonical_url = page.canonical_url or f"https://{subdomain}.prompter.site/{path}"
+    # Served from cache, or rendered once while concurrent misses wait
+    body = await page_cache.get_or_set_page(subdomain, path, render_page)
     
-    # Get page HTML (if already rendered) or render it
-    if page.html:
-        html = page.html
+    headers = {
+        "X-Cache": "MISS" if rendered else "HIT",
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding"
+    }
+    # The cache holds pages gzipped; send them as-is when the client allows
+    if accept_gzip:
+        headers["Content-Encoding"] = "gzip"
     else:
-        # Render from MDX if HTML not available
-        html = page_renderer.render_html(
-            title=page.title,
-            content_html=page.mdx,  # In production, convert MDX to HTML
-            meta_description=None,  # Will be auto-generated
-            canonical_url=canonical_url,
-            schema_json=page.schema_json,
-            og_image=None,
-            published_at=page.published_at,
-            updated_at=page.updated_at
-        )
-    
-    # Cache the HTML
-    await page_cache.set_page(subdomain, path, html)
+        body = gzip.decompress(body)
     
     return Response(
-        content=html,
+        content=body,
         media_type="text/html",
-        headers={
-            "X-Cache": "MISS",
-            "Cache-Control": "public, max-age=3600"
-        }
+        headers=headers
     )
 
 
@@ -180,7 +231,8 @@ async def serve_page_by_host(
         return await get_robots_by_host(request)
     
     # Serve the page
-    return await serve_page_internal(subdomain, path, db)
+    accept_gzip = accepts_gzip(request.headers.get("accept-encoding", ""))
+    return await serve_page_internal(subdomain, path, db, accept_gzip=accept_gzip)
 
 
 async def get_sitemap_by_host(
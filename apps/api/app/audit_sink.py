@@ -0,0 +1,159 @@
+"""
+Buffered audit log sink.
+
+Audit events are queued in-process and written to ``audit_logs`` in batches by a
+background consumer started from the application lifespan, so audited requests
+don't pay for their own INSERT round-trip. When the buffer is full the producer
+is told so and writes the row itself, which slows it down instead of losing the
+event.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.database import SessionLocal
+from app.models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+QUEUE_MAXSIZE = 10_000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.25  # seconds
+
+_queue: Optional[asyncio.Queue] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_consumer: Optional[asyncio.Task] = None
+
+
+def is_running() -> bool:
+    """Return True if the background consumer is accepting events."""
+    return _consumer is not None and not _consumer.done()
+
+
+def _put(event: Dict[str, Any]) -> None:
+    """Enqueue an event from another thread, dropping it if the buffer filled meanwhile."""
+    try:
+        _queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning(
+            "Audit queue full - dropping event",
+            extra={
+                "action": str(event.get("action")),
+                "resource_type": event.get("resource_type"),
+                "resource_id": event.get("resource_id"),
+            },
+        )
+
+
+def emit_nowait(event: Dict[str, Any]) -> bool:
+    """
+    Queue an audit event without blocking.
+
+    Safe to call from the event loop or from a threadpool worker.
+
+    Args:
+        event: Column values for a single ``AuditLog`` row
+
+    Returns:
+        True if the event was queued; False if the sink isn't running or its
+        buffer is full, in which case the caller should write the row itself
+    """
+    if not is_running() or _queue.full():
+        return False
+
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if running_loop is _loop:
+        _queue.put_nowait(event)
+    else:
+        _loop.call_soon_threadsafe(_put, event)
+    return True
+
+
+async def emit(event: Dict[str, Any]) -> None:
+    """Queue an audit event, waiting for buffer space if the consumer is behind."""
+    if is_running() and asyncio.get_running_loop() is _loop:
+        await _queue.put(event)
+    elif not emit_nowait(event):
+        logger.warning("Audit sink unavailable - dropping event")
+
+
+def _write_batch(rows: List[Dict[str, Any]]) -> None:
+    """Insert a batch of audit rows with a single multi-row INSERT."""
+    db = SessionLocal()
+    try:
+        db.execute(insert(AuditLog), rows)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to write {len(rows)} audit log entries: {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+async def _consume(queue: asyncio.Queue) -> None:
+    """Drain the queue in batches of up to BATCH_SIZE events or FLUSH_INTERVAL seconds."""
+    loop = asyncio.get_running_loop()
+    batch: List[Dict[str, Any]] = []
+
+    try:
+        while True:
+            batch.append(await queue.get())
+            deadline = loop.time() + FLUSH_INTERVAL
+
+            while len(batch) < BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            rows, batch = batch, []
+            await asyncio.to_thread(_write_batch, rows)
+
+    except asyncio.CancelledError:
+        # Flush whatever is still buffered before shutting down
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        for start in range(0, len(batch), BATCH_SIZE):
+            _write_batch(batch[start:start + BATCH_SIZE])
+        raise
+
+
+async def start() -> None:
+    """Create the queue and start the background consumer."""
+    global _queue, _loop, _consumer
+
+    if is_running():
+        return
+
+    _loop = asyncio.get_running_loop()
+    _queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    _consumer = asyncio.create_task(_consume(_queue), name="audit-sink")
+    logger.info("Audit sink started")
+
+
+async def stop() -> None:
+    """Stop the consumer, flushing any remaining events."""
+    global _queue, _loop, _consumer
+
+    if _consumer is None:
+        return
+
+    _consumer.cancel()
+    try:
+        await _consumer
+    except asyncio.CancelledError:
+        pass
+
+    _queue = None
+    _loop = None
+    _consumer = None
+    logger.info("Audit sink stopped")
@@ -77,6 +77,10 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 60
     RATE_LIMIT_BURST: int = 120
 
+    # Audit Logging
+    AUDIT_ENABLED: bool = True  # Set to False to skip all audit writes (e.g. bulk migrations)
+    AUDIT_SAMPLE_RATE_READ: float = 1.0  # Fraction of READ events recorded (0.0-1.0)
+
     # Feature Flags
     ENABLE_SUBDOMAIN_ROUTING: bool = True
     ENABLE_PAGE_GENERATION: bool = True
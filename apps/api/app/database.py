@@ -1,12 +1,22 @@
 """Database connection and session management."""
-from typing import Generator
+import logging
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson (non-str dict keys allowed, as with json)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
@@ -14,6 +24,10 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Compiled SQL cache; the default of 500 is too small for our model count
+    query_cache_size=1200,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
@@ -25,6 +39,20 @@ Base = declarative_base()
 Base.__allow_unmapped__ = True
 
 
+if settings.DEBUG:
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _warn_uncacheable_statement(orm_execute_state: ORMExecuteState) -> None:
+        """Flag ORM statements that bypass the compiled query cache (dev only)."""
+        if not orm_execute_state.is_orm_statement:
+            return
+        if orm_execute_state.statement._generate_cache_key() is None:
+            logger.warning(
+                "ORM statement is not cacheable and will be recompiled on every call",
+                extra={"statement": str(orm_execute_state.statement)},
+            )
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
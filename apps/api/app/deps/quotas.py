@@ -11,10 +11,10 @@ from app.models.user import User
 from app.services.quotas import (
     assert_within_limit,
     get_brand_count,
-    get_or_create_usage,
     get_plan,
     get_prompt_count,
     get_usage_summary,
+    increment_usage,
     month_anchor,
 )
 
@@ -71,7 +71,7 @@ def require_prompt_slot(
     Raises:
         HTTPException: 429 Too Many Requests if prompt limit exceeded
     """
-    brand = db.query(Brand).filter(Brand.id == brand_id).first()
+    brand = db.get(Brand, brand_id)
     if not brand:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -99,7 +99,9 @@ def require_scan_credit(
     """
     Check if organization has scan credits available and reserve them.
     
-    Uses SELECT FOR UPDATE to prevent double-spend under concurrent requests.
+    Credits are reserved with a single atomic upsert and released by rolling
+    back if the limit would be exceeded, preventing double-spend under
+    concurrent requests.
     
     Args:
         org_id: Organization ID
@@ -129,20 +131,22 @@ def require_scan_credit(
     
     plan = get_plan(org)
     
-    # Lock the usage row to prevent concurrent double-spend
-    usage = get_or_create_usage(db, org, lock_for_update=True)
+    # Reserve the credits (row stays locked until commit/rollback)
+    usage = increment_usage(db, org, scans=credits_needed)
+    scans_used = usage.scans_used
     
-    # Check limit
-    assert_within_limit(usage.scans_used + credits_needed, plan["scans"], "Scan")
+    # Check limit; roll back to release the reservation
+    try:
+        assert_within_limit(scans_used, plan["scans"], "Scan")
+    except HTTPException:
+        db.rollback()
+        raise
     
-    # Reserve the credits
-    usage.scans_used += credits_needed
     db.commit()
-    db.refresh(usage)
     
     return (
         {
-            "used": usage.scans_used,
+            "used": scans_used,
             "limit": plan["scans"],
         },
         credits_needed,
@@ -156,7 +160,9 @@ def require_page_slot(
     """
     Check if organization can generate another AI page.
     
-    Uses SELECT FOR UPDATE to prevent double-spend under concurrent requests.
+    The slot is reserved with a single atomic upsert and released by rolling
+    back if the limit would be exceeded, preventing double-spend under
+    concurrent requests.
     
     Args:
         org_id: Organization ID
@@ -177,18 +183,21 @@ def require_page_slot(
     
     plan = get_plan(org)
     
-    # Lock the usage row to prevent concurrent double-spend
-    usage = get_or_create_usage(db, org, lock_for_update=True)
+    # Reserve the slot (row stays locked until commit/rollback)
+    usage = increment_usage(db, org, pages=1)
+    pages_generated = usage.ai_pages_generated
     
-    assert_within_limit(usage.ai_pages_generated, plan["ai_pages"], "AI page generation")
+    # Check the pre-reservation count; roll back to release the slot
+    try:
+        assert_within_limit(pages_generated - 1, plan["ai_pages"], "AI page generation")
+    except HTTPException:
+        db.rollback()
+        raise
     
-    # Reserve the slot
-    usage.ai_pages_generated += 1
     db.commit()
-    db.refresh(usage)
     
     return {
-        "used": usage.ai_pages_generated,
+        "used": pages_generated,
         "limit": plan["ai_pages"],
     }
 
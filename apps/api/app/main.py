@@ -4,22 +4,16 @@ import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-import sentry_sdk
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app import audit_sink
 from app.api.v1.router import api_router
 from app.config import settings
 from app.database import get_db
@@ -31,6 +25,7 @@ from app.exceptions import (
     http_exception_handler,
     validation_exception_handler,
 )
+from app.middleware.health_bypass import HealthCheckBypassMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -39,8 +34,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Readiness probe query, built once so SQLAlchemy's statement cache always hits
+_PING_SQL = text("SELECT 1")
+
 # Initialize Sentry with comprehensive error tracking
+# (SDK imported lazily so cold starts without a DSN skip loading it)
 if settings.SENTRY_DSN:
+    import sentry_sdk
+
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
         environment=settings.SENTRY_ENVIRONMENT,
@@ -60,7 +61,14 @@ if settings.SENTRY_DSN:
     logger.info(f"Sentry initialized for environment: {settings.SENTRY_ENVIRONMENT}")
 
 # Initialize OpenTelemetry for distributed tracing
+# (imported lazily - the OTel packages are only needed when an exporter is configured)
 if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+    from opentelemetry import trace
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
     resource = Resource.create({
         "service.name": settings.OTEL_SERVICE_NAME,
         "service.version": settings.APP_VERSION,
@@ -76,8 +84,10 @@ if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     logger.info("Starting Prompter API...")
+    await audit_sink.start()
     yield
     logger.info("Shutting down Prompter API...")
+    await audit_sink.stop()
 
 
 # Create FastAPI application
@@ -86,6 +96,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="AI Visibility Platform API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -129,11 +140,11 @@ app.add_middleware(
 # Request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    """Add processing time header to responses."""
-    start_time = time.time()
+    """Add processing time header (in seconds) to responses."""
+    start_ns = time.monotonic_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    elapsed_ns = time.monotonic_ns() - start_ns
+    response.headers["X-Process-Time"] = f"{elapsed_ns / 1e9:.6f}"
     return response
 
 
@@ -146,18 +157,32 @@ app.add_exception_handler(Exception, generic_exception_handler)
 
 
 # Health check endpoints
-@app.get("/healthz")
+# Served from a bare app with no middleware stack; HealthCheckBypassMiddleware
+# routes probe paths to it before any other middleware runs.
+HEALTH_CHECK_PATHS = ("/healthz", "/readyz", "/health")
+
+health_app = FastAPI(
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+    default_response_class=ORJSONResponse,
+)
+# Share overrides so get_db overrides (e.g. in tests) apply to the probes too
+health_app.dependency_overrides = app.dependency_overrides
+
+
+@health_app.get("/healthz")
 async def healthz():
     """Liveness probe - checks if the application is running."""
     return {"ok": True, "status": "alive", "version": settings.APP_VERSION}
 
 
-@app.get("/readyz")
+@health_app.get("/readyz")
 async def readyz(db: Session = Depends(get_db)):
     """Readiness probe - checks if the application can serve traffic (includes DB check)."""
     try:
         # Test database connection
-        db.execute(text("SELECT 1"))
+        db.execute(_PING_SQL)
         return {
             "ok": True,
             "status": "ready",
@@ -166,7 +191,7 @@ async def readyz(db: Session = Depends(get_db)):
         }
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "ok": False,
@@ -178,18 +203,28 @@ async def readyz(db: Session = Depends(get_db)):
         )
 
 
-@app.get("/health")
+@health_app.get("/health")
 async def health_check():
     """Legacy health check endpoint (deprecated, use /healthz instead)."""
     return {"status": "healthy", "version": settings.APP_VERSION}
 
 
+# Registered last so it wraps every other middleware
+app.add_middleware(HealthCheckBypassMiddleware, health_app=health_app, paths=HEALTH_CHECK_PATHS)
+
+
 # Include API router
 app.include_router(api_router, prefix="/v1")
 
 # Instrument with OpenTelemetry
 if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
-    FastAPIInstrumentor.instrument_app(app)
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    # Probes are excluded so they don't create a span per hit
+    FastAPIInstrumentor.instrument_app(
+        app,
+        excluded_urls=",".join(f"{path}$" for path in HEALTH_CHECK_PATHS),
+    )
 
 if __name__ == "__main__":
     import uvicorn
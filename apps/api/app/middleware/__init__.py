@@ -1,10 +1,12 @@
 """Middleware modules."""
 
+from app.middleware.health_bypass import HealthCheckBypassMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 
 __all__ = [
+    "HealthCheckBypassMiddleware",
     "RateLimitMiddleware",
     "RequestIDMiddleware",
     "SecurityHeadersMiddleware",
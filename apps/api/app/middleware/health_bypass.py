@@ -0,0 +1,30 @@
+"""Health probe bypass middleware."""
+from typing import Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class HealthCheckBypassMiddleware:
+    """
+    Route health probes straight to a bare ASGI app.
+
+    Kubernetes probes make up a large share of traffic but need none of the
+    request ID, rate limiting, CORS or timing middleware. Registered as the
+    outermost middleware, this hands matching paths to ``health_app`` before
+    the rest of the stack runs.
+
+    Implemented as pure ASGI (not BaseHTTPMiddleware) so non-probe requests
+    pass through with a single dict lookup.
+    """
+
+    def __init__(self, app: ASGIApp, health_app: ASGIApp, paths: Iterable[str]):
+        self.app = app
+        self.health_app = health_app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            await self.health_app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
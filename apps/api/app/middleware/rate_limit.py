@@ -3,14 +3,27 @@ import logging
 import time
 from typing import Callable, Optional
 
+import orjson
 import redis
-from fastapi import HTTPException, Request, Response, status
+from fastapi import Request, Response, status
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.config import settings
+from app.schemas.error import ErrorCode
 
 logger = logging.getLogger(__name__)
 
+# 429 body is identical for every rejected request, so serialize it once
+_RATE_LIMIT_BODY = orjson.dumps(
+    {
+        "error": {
+            "code": ErrorCode.RATE_LIMIT_EXCEEDED,
+            "message": "Rate limit exceeded. Please try again later.",
+            "details": {"limit": settings.RATE_LIMIT_REQUESTS_PER_MINUTE},
+        }
+    }
+)
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -57,37 +70,32 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Check rate limit
         try:
             allowed, remaining, reset_time = self._check_rate_limit(rate_limit_key)
-
-            # Add rate limit headers to response
-            response = await call_next(request)
-            response.headers["X-RateLimit-Limit"] = str(settings.RATE_LIMIT_REQUESTS_PER_MINUTE)
-            response.headers["X-RateLimit-Remaining"] = str(remaining)
-            response.headers["X-RateLimit-Reset"] = str(reset_time)
-
-            if not allowed:
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail={
-                        "error": {
-                            "code": "RATE_LIMIT_EXCEEDED",
-                            "message": "Rate limit exceeded. Please try again later.",
-                            "details": {
-                                "limit": settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
-                                "reset_at": reset_time,
-                            },
-                        }
-                    },
-                )
-
-            return response
-
-        except HTTPException:
-            raise
         except Exception as e:
             logger.error(f"Rate limiting error: {e}")
             # On error, allow request through (fail open)
             return await call_next(request)
 
+        rate_limit_headers = {
+            "X-RateLimit-Limit": str(settings.RATE_LIMIT_REQUESTS_PER_MINUTE),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset_time),
+        }
+
+        if not allowed:
+            # Reject without running the handler or building an exception
+            rate_limit_headers["Retry-After"] = str(max(0, reset_time - int(time.time())))
+            return Response(
+                content=_RATE_LIMIT_BODY,
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                media_type="application/json",
+                headers=rate_limit_headers,
+            )
+
+        # Add rate limit headers to response
+        response = await call_next(request)
+        response.headers.update(rate_limit_headers)
+        return response
+
     def _get_rate_limit_key(self, request: Request) -> Optional[str]:
         """
         Extract rate limit key from request.
@@ -1,20 +1,22 @@
 """Database models."""
 from app.models.audit_log import AuditLog
 from app.models.brand import Brand, Competitor
-from app.models.hosted_domain import HostedDomain, HostedSiteBinding
+from app.models.hosted_domain import DnsStatusLookup, HostedDomain, HostedSiteBinding
 from app.models.idempotency import IdempotencyKey
-from app.models.knowledge_page import KnowledgePage
-from app.models.mention import Mention
-from app.models.org import Org, OrgMember
+from app.models.knowledge_page import KnowledgePage, PageStatusLookup
+from app.models.mention import EntityTypeLookup, Mention
+from app.models.org import Org, OrgMember, OrgRoleLookup, PlanTierLookup
 from app.models.plan import OrgMonthlyUsage, Plan, UsageMeter
 from app.models.prompt import PromptSet, PromptSetItem, PromptTemplate
-from app.models.scan import ScanResult, ScanRun
+from app.models.scan import ScanResult, ScanRun, ScanStatusLookup
 from app.models.user import ApiKey, User
 
 __all__ = [
     "User",
     "Org",
     "OrgMember",
+    "OrgRoleLookup",
+    "PlanTierLookup",
     "Brand",
     "Competitor",
     "PromptTemplate",
@@ -22,10 +24,14 @@ __all__ = [
     "PromptSetItem",
     "ScanRun",
     "ScanResult",
+    "ScanStatusLookup",
     "Mention",
+    "EntityTypeLookup",
     "KnowledgePage",
+    "PageStatusLookup",
     "HostedDomain",
     "HostedSiteBinding",
+    "DnsStatusLookup",
     "Plan",
     "UsageMeter",
     "OrgMonthlyUsage",
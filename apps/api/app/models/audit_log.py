@@ -1,8 +1,7 @@
 """Audit log model for tracking user actions."""
 import enum
-from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSON
 
 from app.database import Base
@@ -32,7 +31,7 @@ class AuditLog(Base):
 
     __tablename__ = "audit_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     
@@ -49,7 +48,9 @@ class AuditLog(Base):
     
     # Metadata
     metadata_json = Column(JSON, nullable=True)  # Legacy field, kept for compatibility
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
 
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, action={self.action.value}, resource={self.resource_type}#{self.resource_id})>"
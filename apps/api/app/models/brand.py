@@ -20,21 +20,51 @@ class Brand(Base):
 
     __tablename__ = "brands"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     website = Column(String(500), nullable=False)
-    primary_domain = Column(String(255), nullable=True, index=True)
+    primary_domain = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     org: "Org" = relationship("Org", back_populates="brands")
-    competitors: List["Competitor"] = relationship("Competitor", back_populates="brand")
-    prompt_sets: List["PromptSet"] = relationship("PromptSet", back_populates="brand")
-    scan_runs: List["ScanRun"] = relationship("ScanRun", back_populates="brand")
-    knowledge_pages: List["KnowledgePage"] = relationship("KnowledgePage", back_populates="brand")
+    # Small collections load in one IN query; large ones must be loaded explicitly
+    # (e.g. selectinload(Brand.scan_runs)) so they can't cause accidental N+1s
+    competitors: List["Competitor"] = relationship(
+        "Competitor",
+        back_populates="brand",
+        lazy="selectin",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    prompt_sets: List["PromptSet"] = relationship(
+        "PromptSet",
+        back_populates="brand",
+        lazy="selectin",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    scan_runs: List["ScanRun"] = relationship(
+        "ScanRun",
+        back_populates="brand",
+        lazy="raise",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    knowledge_pages: List["KnowledgePage"] = relationship(
+        "KnowledgePage",
+        back_populates="brand",
+        lazy="raise",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
     hosted_site_bindings: List["HostedSiteBinding"] = relationship(
-        "HostedSiteBinding", back_populates="brand"
+        "HostedSiteBinding",
+        back_populates="brand",
+        lazy="selectin",
+        cascade="all, delete",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -46,7 +76,7 @@ class Competitor(Base):
 
     __tablename__ = "competitors"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     brand_id = Column(Integer, ForeignKey("brands.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     website = Column(String(500), nullable=False)
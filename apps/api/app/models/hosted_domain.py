@@ -3,10 +3,22 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.lookup import LookupEnum, seed_lookup_table
 
 if TYPE_CHECKING:
     from app.models.brand import Brand
@@ -21,22 +33,48 @@ class DnsStatus(str, Enum):
     FAILED = "failed"
 
 
+class DnsStatusLookup(Base):
+    """Lookup table for DnsStatus (ids follow DnsStatus declaration order)."""
+
+    __tablename__ = "dns_statuses"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(20), unique=True, nullable=False)
+
+
+event.listen(DnsStatusLookup.__table__, "after_create", seed_lookup_table(DnsStatus))
+
+
 class HostedDomain(Base):
     """Hosted domain model - custom domains for hosting pages."""
 
     __tablename__ = "hosted_domains"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
-    apex_domain = Column(String(255), nullable=False, index=True)
+    apex_domain = Column(String(255), nullable=False)
     wildcard_enabled = Column(Boolean, nullable=False, default=False)
-    dns_status = Column(SQLEnum(DnsStatus), nullable=False, default=DnsStatus.PENDING)
+    dns_status = Column(
+        "dns_status_id",
+        LookupEnum(DnsStatus),
+        ForeignKey("dns_statuses.id"),
+        nullable=False,
+        default=DnsStatus.PENDING,
+    )
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     org: "Org" = relationship("Org", back_populates="hosted_domains")
     site_bindings: List["HostedSiteBinding"] = relationship(
-        "HostedSiteBinding", back_populates="hosted_domain"
+        "HostedSiteBinding",
+        back_populates="hosted_domain",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Domains are always looked up within an org
+        Index("ix_hosted_domains_org_id_apex_domain", "org_id", "apex_domain"),
     )
 
     def __repr__(self) -> str:
@@ -48,12 +86,12 @@ class HostedSiteBinding(Base):
 
     __tablename__ = "hosted_site_bindings"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     brand_id = Column(Integer, ForeignKey("brands.id", ondelete="CASCADE"), nullable=False)
     hosted_domain_id = Column(
         Integer, ForeignKey("hosted_domains.id", ondelete="CASCADE"), nullable=False
     )
-    subdomain = Column(String(255), nullable=False, index=True)  # e.g., "acme"
+    subdomain = Column(String(255), nullable=False)  # e.g., "acme"
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -62,6 +100,11 @@ class HostedSiteBinding(Base):
         "HostedDomain", back_populates="site_bindings"
     )
 
+    __table_args__ = (
+        # One binding per subdomain of a hosted domain; also serves subdomain lookups
+        UniqueConstraint("hosted_domain_id", "subdomain", name="uq_binding_subdomain"),
+    )
+
     def __repr__(self) -> str:
         return f"<HostedSiteBinding(id={self.id}, subdomain={self.subdomain})>"
 
@@ -1,12 +1,47 @@
 """Idempotency key tracking for safe retries."""
 from datetime import datetime, timedelta
-from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.database import Base
 
+# Time-ordered UUIDv7: 48-bit millisecond timestamp prefix over gen_random_uuid()'s
+# random bits, with the version nibble bumped from 4 to 7
+UUID_V7_FUNCTION = DDL(
+    """
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid
+    $$ LANGUAGE sql VOLATILE
+    """
+)
+
 
 class IdempotencyKey(Base):
     """Track idempotency keys to prevent duplicate operations.
@@ -18,14 +53,17 @@ class IdempotencyKey(Base):
     """
     __tablename__ = "idempotency_keys"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    idempotency_key = Column(String(255), nullable=False, unique=True, index=True)
+    # Generated by Postgres; time-ordered so inserts append to the right of the PK btree
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()"))
+    idempotency_key = Column(String(255), nullable=False)
     org_id = Column(Integer, nullable=False, index=True)  # Scope keys to org
     resource_type = Column(String(50), nullable=False)  # e.g. "scan", "page"
     resource_id = Column(Integer, nullable=True)  # ID of created resource
-    response_body = Column(Text, nullable=True)  # JSON response to return
+    response_body = Column(JSONB, nullable=True)  # JSON response to return
     status_code = Column(Integer, nullable=False, default=201)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
     expires_at = Column(
         DateTime,
         default=lambda: datetime.utcnow() + timedelta(hours=24),
@@ -33,6 +71,20 @@ class IdempotencyKey(Base):
         index=True
     )
 
+    __table_args__ = (
+        # Keys are scoped per org and resource type; also the ON CONFLICT target
+        # for store_idempotency_key and the index behind check_idempotency_key
+        UniqueConstraint(
+            "idempotency_key", "org_id", "resource_type", name="uq_idempotency_key_scope"
+        ),
+    )
+
     def __repr__(self):
         return f"<IdempotencyKey {self.idempotency_key} org={self.org_id} resource={self.resource_type}/{self.resource_id}>"
 
+
+event.listen(
+    IdempotencyKey.__table__,
+    "before_create",
+    UUID_V7_FUNCTION.execute_if(dialect="postgresql"),
+)
@@ -3,11 +3,23 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.lookup import LookupEnum, seed_lookup_table
 
 if TYPE_CHECKING:
     from app.models.brand import Brand
@@ -21,16 +33,35 @@ class PageStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+class PageStatusLookup(Base):
+    """Lookup table for PageStatus (ids follow PageStatus declaration order)."""
+
+    __tablename__ = "page_statuses"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(20), unique=True, nullable=False)
+
+
+event.listen(PageStatusLookup.__table__, "after_create", seed_lookup_table(PageStatus))
+
+
 class KnowledgePage(Base):
     """Knowledge page model - SEO and AI-optimized content."""
 
     __tablename__ = "knowledge_pages"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     brand_id = Column(Integer, ForeignKey("brands.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(500), nullable=False)
-    slug = Column(String(255), nullable=False, index=True)
-    status = Column(SQLEnum(PageStatus), nullable=False, default=PageStatus.DRAFT, index=True)
+    slug = Column(String(255), nullable=False)
+    status = Column(
+        "status_id",
+        LookupEnum(PageStatus),
+        ForeignKey("page_statuses.id"),
+        nullable=False,
+        default=PageStatus.DRAFT,
+        index=True,
+    )
     html = Column(Text, nullable=True)  # Rendered HTML
     mdx = Column(Text, nullable=True)  # Source MDX
     schema_json = Column(JSON, nullable=True)  # JSON-LD structured data
@@ -38,13 +69,18 @@ class KnowledgePage(Base):
     published_at = Column(DateTime, nullable=True)
     canonical_url = Column(String(500), nullable=True)
     path = Column(String(500), nullable=True)  # URL path
-    subdomain = Column(String(255), nullable=True, index=True)  # e.g., "acme"
+    subdomain = Column(String(255), nullable=True)  # e.g., "acme"
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     brand: "Brand" = relationship("Brand", back_populates="knowledge_pages")
 
+    __table_args__ = (
+        # Hosted page and sitemap lookups filter on subdomain (+ path)
+        Index("ix_knowledge_pages_subdomain_path", "subdomain", "path"),
+    )
+
     def __repr__(self) -> str:
         return f"<KnowledgePage(id={self.id}, title={self.title}, status={self.status})>"
 
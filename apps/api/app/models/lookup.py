@@ -0,0 +1,59 @@
+"""Lookup-table backed enum columns."""
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from sqlalchemy import SmallInteger, Table
+from sqlalchemy.types import TypeDecorator
+
+
+def lookup_rows(enum_class: Type[Enum]) -> List[Dict[str, Any]]:
+    """
+    Rows for an enum's lookup table.
+
+    Ids follow declaration order starting at 1, so new members must only ever
+    be appended to the enum.
+    """
+    return [{"id": i, "name": member.value} for i, member in enumerate(enum_class, start=1)]
+
+
+class LookupEnum(TypeDecorator):
+    """
+    Store a Python Enum as a SMALLINT id referencing a lookup table.
+
+    Model attributes still read and write enum members (or their string
+    values), so query sites like ``Model.status == "published"`` keep working
+    while the row only carries a 2-byte id.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._ids = {member: i for i, member in enumerate(enum_class, start=1)}
+        self._members = {i: member for member, i in self._ids.items()}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        return self._ids[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
+
+def seed_lookup_table(enum_class: Type[Enum]) -> Callable[..., None]:
+    """
+    Build an ``after_create`` listener that fills a lookup table.
+
+    Keeps ``Base.metadata.create_all()`` databases (dev, tests) consistent with
+    the rows inserted by the migrations.
+    """
+
+    def _seed(target: Table, connection: Any, **kw: Any) -> None:
+        connection.execute(target.insert(), lookup_rows(enum_class))
+
+    return _seed
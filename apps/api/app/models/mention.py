@@ -3,11 +3,24 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    event,
+)
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.lookup import LookupEnum, seed_lookup_table
 
 if TYPE_CHECKING:
     from app.models.scan import ScanResult
@@ -21,17 +34,36 @@ class EntityType(str, Enum):
     OTHER = "other"
 
 
+class EntityTypeLookup(Base):
+    """Lookup table for EntityType (ids follow EntityType declaration order)."""
+
+    __tablename__ = "entity_types"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(20), unique=True, nullable=False)
+
+
+event.listen(EntityTypeLookup.__table__, "after_create", seed_lookup_table(EntityType))
+
+
 class Mention(Base):
     """Mention model - extracted brand/competitor reference."""
 
     __tablename__ = "mentions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # 64-bit: several mentions per scan result
+    id = Column(BigInteger, primary_key=True)
     scan_result_id = Column(
-        Integer, ForeignKey("scan_results.id", ondelete="CASCADE"), nullable=False
+        BigInteger, ForeignKey("scan_results.id", ondelete="CASCADE"), nullable=False
     )
     entity_name = Column(String(255), nullable=False, index=True)
-    entity_type = Column(SQLEnum(EntityType), nullable=False, default=EntityType.OTHER, index=True)
+    entity_type = Column(
+        "entity_type_id",
+        LookupEnum(EntityType),
+        ForeignKey("entity_types.id"),
+        nullable=False,
+        default=EntityType.OTHER,
+    )
     sentiment = Column(Float, nullable=True)  # -1.0 to 1.0
     position_index = Column(Integer, nullable=True)  # Position in response (0-based)
     confidence = Column(Float, nullable=True)  # 0.0 to 1.0
@@ -41,10 +73,49 @@ class Mention(Base):
     # Relationships
     scan_result: "ScanResult" = relationship("ScanResult", back_populates="mentions")
 
+    __table_args__ = (
+        # Per-entity aggregates read only index pages: the key finds an entity's
+        # mentions, INCLUDE carries the averaged columns and id for count()
+        Index(
+            "ix_mentions_entity_metrics",
+            "entity_type_id",
+            "entity_name",
+            "scan_result_id",
+            postgresql_include=["sentiment", "position_index", "confidence", "id"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Mention(id={self.id}, entity={self.entity_name}, type={self.entity_type})>"
 
 
-# Import for SQLEnum
-from sqlalchemy import Enum as SQLEnum
+# Statement-level, so a batched INSERT bumps each run's counter once
+MENTION_COUNT_TRIGGER = DDL(
+    """
+    CREATE OR REPLACE FUNCTION scan_runs_count_mentions() RETURNS trigger AS $$
+    BEGIN
+        UPDATE scan_runs r
+        SET mention_count = r.mention_count + n.cnt
+        FROM (
+            SELECT sr.scan_run_id, count(*) AS cnt
+            FROM new_rows m
+            JOIN scan_results sr ON sr.id = m.scan_result_id
+            GROUP BY sr.scan_run_id
+        ) n
+        WHERE r.id = n.scan_run_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER trg_mentions_count
+    AFTER INSERT ON mentions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION scan_runs_count_mentions();
+    """
+)
 
+event.listen(
+    Mention.__table__,
+    "after_create",
+    MENTION_COUNT_TRIGGER.execute_if(dialect="postgresql"),
+)
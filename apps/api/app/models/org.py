@@ -1,12 +1,12 @@
 """Organization models."""
-from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, SmallInteger, String, event, func, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.lookup import LookupEnum, seed_lookup_table
 
 if TYPE_CHECKING:
     from app.models.brand import Brand
@@ -33,33 +33,95 @@ class PlanTier(str, Enum):
     ENTERPRISE = "enterprise"
 
 
+class OrgRoleLookup(Base):
+    """Lookup table for OrgRole (ids follow OrgRole declaration order)."""
+
+    __tablename__ = "org_roles"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(20), unique=True, nullable=False)
+
+
+event.listen(OrgRoleLookup.__table__, "after_create", seed_lookup_table(OrgRole))
+
+
+class PlanTierLookup(Base):
+    """Lookup table for PlanTier (ids follow PlanTier declaration order)."""
+
+    __tablename__ = "plan_tiers"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(20), unique=True, nullable=False)
+
+
+event.listen(PlanTierLookup.__table__, "after_create", seed_lookup_table(PlanTier))
+
+
 class Org(Base):
     """Organization model."""
 
     __tablename__ = "orgs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     slug = Column(String(255), unique=True, nullable=False, index=True)
     plan_tier = Column(
-        SQLEnum(PlanTier), nullable=False, default=PlanTier.STARTER, index=True
+        "plan_tier_id",
+        LookupEnum(PlanTier),
+        ForeignKey("plan_tiers.id"),
+        nullable=False,
+        default=PlanTier.STARTER,
+        index=True,
     )
     seats_limit = Column(Integer, nullable=True)  # NULL means unlimited (Business+)
     billing_cycle_anchor = Column(Integer, nullable=False, default=1)  # Day of month (1-31) when billing cycle starts
     current_period_start = Column(DateTime, nullable=True)  # Start of current billing period
     current_period_end = Column(DateTime, nullable=True)  # End of current billing period
-    stripe_customer_id = Column(String(255), unique=True, nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    stripe_customer_id = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    members: List["OrgMember"] = relationship("OrgMember", back_populates="org")
-    brands: List["Brand"] = relationship("Brand", back_populates="org")
+    # Children go via the FKs' ON DELETE CASCADE; passive_deletes skips loading them first
+    members: List["OrgMember"] = relationship(
+        "OrgMember", back_populates="org", cascade="all, delete", passive_deletes=True
+    )
+    brands: List["Brand"] = relationship(
+        "Brand", back_populates="org", cascade="all, delete", passive_deletes=True
+    )
     prompt_templates: List["PromptTemplate"] = relationship(
-        "PromptTemplate", back_populates="org"
+        "PromptTemplate",
+        back_populates="org",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    # Cold collections - never needed while serializing a request
+    hosted_domains: List["HostedDomain"] = relationship(
+        "HostedDomain",
+        back_populates="org",
+        lazy="raise",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    usage_meters: List["UsageMeter"] = relationship(
+        "UsageMeter", back_populates="org", cascade="all, delete", passive_deletes=True
+    )
+    api_keys: List["ApiKey"] = relationship(
+        "ApiKey",
+        back_populates="org",
+        lazy="raise",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Only paying orgs have a Stripe customer; webhook lookups never search for NULL
+        Index(
+            "ix_orgs_stripe_cust_active",
+            "stripe_customer_id",
+            unique=True,
+            postgresql_where=text("stripe_customer_id IS NOT NULL"),
+        ),
     )
-    hosted_domains: List["HostedDomain"] = relationship("HostedDomain", back_populates="org")
-    usage_meters: List["UsageMeter"] = relationship("UsageMeter", back_populates="org")
-    api_keys: List["ApiKey"] = relationship("ApiKey", back_populates="org")
 
     def __repr__(self) -> str:
         return f"<Org(id={self.id}, name={self.name}, slug={self.slug})>"
@@ -70,11 +132,17 @@ class OrgMember(Base):
 
     __tablename__ = "org_members"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    role = Column(SQLEnum(OrgRole), nullable=False, default=OrgRole.MEMBER)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    role = Column(
+        "role_id",
+        LookupEnum(OrgRole),
+        ForeignKey("org_roles.id"),
+        nullable=False,
+        default=OrgRole.MEMBER,
+    )
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     org: "Org" = relationship("Org", back_populates="members")
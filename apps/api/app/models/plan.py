@@ -1,11 +1,10 @@
 """Plan and usage tracking models."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
-from sqlalchemy import BigInteger, CheckConstraint, Column, Date, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSON, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, CheckConstraint, Column, Date, DateTime, ForeignKey, Index, Integer, String, func, select
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import Session, relationship
 
 from app.database import Base
 
@@ -18,12 +17,12 @@ class Plan(Base):
 
     __tablename__ = "plans"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     code = Column(String(50), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
     price_monthly = Column(Integer, nullable=False)  # In cents
-    limits_json = Column(JSON, nullable=False)  # {"prompts_per_month": 100, "pages": 5, ...}
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    limits_json = Column(JSONB, nullable=False)  # {"prompts_per_month": 100, "pages": 5, ...}
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     def __repr__(self) -> str:
         return f"<Plan(id={self.id}, code={self.code}, name={self.name})>"
@@ -34,18 +33,31 @@ class UsageMeter(Base):
 
     __tablename__ = "usage_meters"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
-    month = Column(String(7), nullable=False, index=True)  # YYYY-MM format
+    month = Column(String(7), nullable=False)  # YYYY-MM format
     prompts_used = Column(Integer, nullable=False, default=0)
     pages_hosted = Column(Integer, nullable=False, default=0)
     overage_cents = Column(Integer, nullable=False, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     org: "Org" = relationship("Org", back_populates="usage_meters")
 
+    __table_args__ = (
+        # One row per org per month. The unique index doubles as the
+        # ON CONFLICT (org_id, month) target, and INCLUDE lets the hot
+        # "usage for org X in month M" read be an index-only scan.
+        Index(
+            "uq_usage_org_month",
+            "org_id",
+            "month",
+            unique=True,
+            postgresql_include=["prompts_used", "pages_hosted", "overage_cents"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<UsageMeter(id={self.id}, org_id={self.org_id}, month={self.month})>"
 
@@ -55,6 +67,7 @@ class OrgMonthlyUsage(Base):
     
     Tracks usage per organization billing period (not calendar month).
     Period starts from billing_cycle_anchor day each month.
+    Keyed by (org_id, period_start) - no surrogate id.
     
     Uses BIGINT for counters to handle high-volume customers.
     CHECK constraints prevent negative values (no refunds).
@@ -62,25 +75,126 @@ class OrgMonthlyUsage(Base):
 
     __tablename__ = "org_monthly_usage"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False, index=True)
-    period_start = Column(DateTime, nullable=False, index=True)  # Start of billing period
+    # Natural key: one row per org per billing period
+    org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), primary_key=True)
+    period_start = Column(DateTime, primary_key=True)  # Start of billing period
     period_end = Column(DateTime, nullable=False, index=True)  # End of billing period
     scans_used = Column(BigInteger, nullable=False, default=0)
     prompts_used = Column(BigInteger, nullable=False, default=0)
     ai_pages_generated = Column(BigInteger, nullable=False, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     __table_args__ = (
-        UniqueConstraint("org_id", "period_start", name="uq_usage_org_period"),
         CheckConstraint("scans_used >= 0", name="ck_scans_non_negative"),
         CheckConstraint("prompts_used >= 0", name="ck_prompts_non_negative"),
         CheckConstraint("ai_pages_generated >= 0", name="ck_pages_non_negative"),
-        # Composite index for efficient lookups (primary query pattern)
-        Index("ix_org_monthly_usage_org_period", "org_id", "period_start"),
+        # period_start is append-only and correlates with insert order, so a BRIN
+        # index serves range scans at a fraction of a B-tree's size
+        Index(
+            "ix_omu_period_brin",
+            "period_start",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
+    @classmethod
+    def bump(
+        cls,
+        db: Session,
+        org_id: int,
+        period_start: datetime,
+        period_end: datetime,
+        *,
+        scans: int = 0,
+        prompts: int = 0,
+        pages: int = 0,
+    ) -> "OrgMonthlyUsage":
+        """
+        Atomically add to a period's counters, creating the row if needed.
+
+        Issues a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING, so there
+        is no read-modify-write race and no separate SELECT. The updated row
+        stays locked until the transaction ends.
+
+        Returns:
+            The usage row with post-increment totals
+        """
+        stmt = pg_insert(cls).values(
+            org_id=org_id,
+            period_start=period_start,
+            period_end=period_end,
+            scans_used=scans,
+            prompts_used=prompts,
+            ai_pages_generated=pages,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.org_id, cls.period_start],
+            set_={
+                "scans_used": cls.scans_used + stmt.excluded.scans_used,
+                "prompts_used": cls.prompts_used + stmt.excluded.prompts_used,
+                "ai_pages_generated": cls.ai_pages_generated + stmt.excluded.ai_pages_generated,
+                "updated_at": func.now(),
+            },
+        ).returning(cls)
+
+        return db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
+    @classmethod
+    def get_or_create(
+        cls,
+        db: Session,
+        org_id: int,
+        period_start: datetime,
+        period_end: datetime,
+        *,
+        lock_for_update: bool = False,
+    ) -> "OrgMonthlyUsage":
+        """
+        Get a period's usage row, creating it with zero counters if needed.
+
+        Once the period's row exists this is a single SELECT. Creation is an
+        INSERT ... ON CONFLICT DO NOTHING RETURNING, so a concurrent creator
+        can't make it fail; whoever loses the race reads the winner's row.
+        A row this transaction inserted is already locked until it ends.
+
+        Args:
+            lock_for_update: If True, locks an existing row with SELECT FOR UPDATE
+
+        Returns:
+            The usage row for the period
+        """
+        query = select(cls).where(cls.org_id == org_id, cls.period_start == period_start)
+        if lock_for_update:
+            query = query.with_for_update()
+
+        usage = db.scalars(query).first()
+        if usage is not None:
+            return usage
+
+        stmt = (
+            pg_insert(cls)
+            .values(
+                org_id=org_id,
+                period_start=period_start,
+                period_end=period_end,
+                scans_used=0,
+                prompts_used=0,
+                ai_pages_generated=0,
+            )
+            .on_conflict_do_nothing(index_elements=[cls.org_id, cls.period_start])
+            .returning(cls)
+        )
+        usage = db.scalars(stmt, execution_options={"populate_existing": True}).first()
+        if usage is not None:
+            return usage
+
+        # Created concurrently since the first SELECT
+        return db.scalars(query).one()
+
     def __repr__(self) -> str:
         return f"<OrgMonthlyUsage(org_id={self.org_id}, period={self.period_start} to {self.period_end})>"
 
@@ -1,9 +1,8 @@
 """Prompt template and prompt set models."""
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -19,19 +18,22 @@ class PromptTemplate(Base):
 
     __tablename__ = "prompt_templates"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=True)
     label = Column(String(255), nullable=False)
     text = Column(Text, nullable=False)
     locale = Column(String(10), nullable=False, default="en")
     vertical = Column(String(100), nullable=True, index=True)  # SaaS, ecommerce, etc.
     is_system = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     org: "Org" = relationship("Org", back_populates="prompt_templates")
     prompt_set_items: List["PromptSetItem"] = relationship(
-        "PromptSetItem", back_populates="prompt_template"
+        "PromptSetItem",
+        back_populates="prompt_template",
+        cascade="all, delete",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -43,16 +45,27 @@ class PromptSet(Base):
 
     __tablename__ = "prompt_sets"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     brand_id = Column(Integer, ForeignKey("brands.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     brand: "Brand" = relationship("Brand", back_populates="prompt_sets")
-    items: List["PromptSetItem"] = relationship("PromptSetItem", back_populates="prompt_set")
-    scan_runs: List["ScanRun"] = relationship("ScanRun", back_populates="prompt_set")
+    items: List["PromptSetItem"] = relationship(
+        "PromptSetItem",
+        back_populates="prompt_set",
+        lazy="selectin",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    scan_runs: List["ScanRun"] = relationship(
+        "ScanRun",
+        back_populates="prompt_set",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
 
     def __repr__(self) -> str:
         return f"<PromptSet(id={self.id}, name={self.name})>"
@@ -63,15 +76,15 @@ class PromptSetItem(Base):
 
     __tablename__ = "prompt_set_items"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     prompt_set_id = Column(
         Integer, ForeignKey("prompt_sets.id", ondelete="CASCADE"), nullable=False
     )
     prompt_template_id = Column(
         Integer, ForeignKey("prompt_templates.id", ondelete="CASCADE"), nullable=False
     )
-    variables_json = Column(JSON, nullable=True)  # Template variable substitutions
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    variables_json = Column(JSONB, nullable=True)  # Template variable substitutions
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     prompt_set: "PromptSet" = relationship("PromptSet", back_populates="items")
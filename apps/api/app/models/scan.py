@@ -1,13 +1,28 @@
 """Scan run and scan result models."""
-from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List
-
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    event,
+    func,
+    insert,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, relationship
 
 from app.database import Base
+from app.models.lookup import LookupEnum, seed_lookup_table
 
 if TYPE_CHECKING:
     from app.models.brand import Brand
@@ -24,28 +39,79 @@ class ScanStatus(str, Enum):
     FAILED = "failed"
 
 
+class ScanStatusLookup(Base):
+    """Lookup table for ScanStatus (ids follow ScanStatus declaration order)."""
+
+    __tablename__ = "scan_statuses"
+
+    id = Column(SmallInteger, primary_key=True)
+    name = Column(String(20), unique=True, nullable=False)
+
+
+event.listen(ScanStatusLookup.__table__, "after_create", seed_lookup_table(ScanStatus))
+
+
 class ScanRun(Base):
     """Scan run model - a batch of prompts across multiple models."""
 
     __tablename__ = "scan_runs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     brand_id = Column(Integer, ForeignKey("brands.id", ondelete="CASCADE"), nullable=False)
     prompt_set_id = Column(
         Integer, ForeignKey("prompt_sets.id", ondelete="CASCADE"), nullable=False
     )
-    status = Column(SQLEnum(ScanStatus), nullable=False, default=ScanStatus.QUEUED, index=True)
+    status = Column(
+        "status_id",
+        LookupEnum(ScanStatus),
+        ForeignKey("scan_statuses.id"),
+        nullable=False,
+        default=ScanStatus.QUEUED,
+    )
     model_matrix_json = Column(
-        JSON, nullable=False
+        JSONB, nullable=False
     )  # List of models to test: ["gpt-4", "claude-3", ...]
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Rollups maintained by triggers on scan_results / mentions; read these instead of counting.
+    # The triggers are AFTER INSERT only: deleting individual results or mentions
+    # (rather than the whole run) leaves these counts too high
+    result_count = Column(Integer, nullable=False, server_default="0")
+    mention_count = Column(Integer, nullable=False, server_default="0")
 
     # Relationships
     brand: "Brand" = relationship("Brand", back_populates="scan_runs")
     prompt_set: "PromptSet" = relationship("PromptSet", back_populates="scan_runs")
-    results: List["ScanResult"] = relationship("ScanResult", back_populates="scan_run")
+    # Never loaded implicitly: queries that need the results opt in with selectinload()
+    results: List["ScanResult"] = relationship(
+        "ScanResult",
+        back_populates="scan_run",
+        lazy="raise",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Covers the analytics filter (brand, status, period) and carries id for the
+        # join to scan_results, so it's answered by an index-only scan
+        Index(
+            "ix_scan_runs_brand_status_created",
+            "brand_id",
+            "status_id",
+            "created_at",
+            postgresql_include=["id"],
+        ),
+        # Only queued/running rows are dispatched; DONE/FAILED history stays out of the index.
+        # Lookup ids: 1 = queued, 2 = running.
+        Index(
+            "ix_scan_runs_active",
+            "created_at",
+            postgresql_where=text("status_id IN (1, 2)"),
+        ),
+        # Containment lookups like model_matrix_json @> '["gpt-4"]'
+        Index("ix_scan_runs_models_gin", "model_matrix_json", postgresql_using="gin"),
+    )
 
     def __repr__(self) -> str:
         return f"<ScanRun(id={self.id}, status={self.status})>"
@@ -56,18 +122,76 @@ class ScanResult(Base):
 
     __tablename__ = "scan_results"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # 64-bit: every run adds models x prompts rows
+    id = Column(BigInteger, primary_key=True)
     scan_run_id = Column(Integer, ForeignKey("scan_runs.id", ondelete="CASCADE"), nullable=False)
-    model_name = Column(String(100), nullable=False, index=True)
+    model_name = Column(String(100), nullable=False)
     prompt_text = Column(Text, nullable=False)
     raw_response = Column(Text, nullable=False)
-    parsed_json = Column(JSON, nullable=True)  # Structured extraction results
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    parsed_json = Column(JSONB, nullable=True)  # Structured extraction results
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     scan_run: "ScanRun" = relationship("ScanRun", back_populates="results")
-    mentions: List["Mention"] = relationship("Mention", back_populates="scan_result")
+    mentions: List["Mention"] = relationship(
+        "Mention",
+        back_populates="scan_result",
+        lazy="raise",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Per-run lookups and joins, optionally narrowed to a model
+        Index("ix_scan_results_run_model", "scan_run_id", "model_name"),
+    )
+
+    @classmethod
+    def bulk_create(cls, db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert many results with batched multi-row INSERT ... RETURNING.
+
+        Args:
+            db: Database session
+            rows: Column values for each result
+
+        Returns:
+            New result IDs, in the same order as ``rows``
+        """
+        if not rows:
+            return []
+
+        stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        return list(db.scalars(stmt, rows))
 
     def __repr__(self) -> str:
         return f"<ScanResult(id={self.id}, model={self.model_name})>"
 
+
+# Statement-level, so a batched INSERT bumps each run's counter once
+SCAN_RESULT_COUNT_TRIGGER = DDL(
+    """
+    CREATE OR REPLACE FUNCTION scan_runs_count_results() RETURNS trigger AS $$
+    BEGIN
+        UPDATE scan_runs r
+        SET result_count = r.result_count + n.cnt
+        FROM (
+            SELECT scan_run_id, count(*) AS cnt FROM new_rows GROUP BY scan_run_id
+        ) n
+        WHERE r.id = n.scan_run_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER trg_scan_results_count
+    AFTER INSERT ON scan_results
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION scan_runs_count_results();
+    """
+)
+
+event.listen(
+    ScanResult.__table__,
+    "after_create",
+    SCAN_RESULT_COUNT_TRIGGER.execute_if(dialect="postgresql"),
+)
@@ -1,8 +1,7 @@
 """User and authentication models."""
-from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, SmallInteger, String, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -16,14 +15,16 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     auth_provider_id = Column(String(255), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    org_members: List["OrgMember"] = relationship("OrgMember", back_populates="user")
+    org_members: List["OrgMember"] = relationship(
+        "OrgMember", back_populates="user", cascade="all, delete", passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email})>"
@@ -34,17 +35,26 @@ class ApiKey(Base):
 
     __tablename__ = "api_keys"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Scope bits stored in ``scopes``
+    SCOPE_READ = 1
+    SCOPE_WRITE = 2
+    SCOPE_ADMIN = 4
+
+    id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
     key_hash = Column(String(255), unique=True, nullable=False, index=True)
     label = Column(String(255), nullable=False)
-    scopes = Column(Text, nullable=False, default="read")  # comma-separated
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    scopes = Column(SmallInteger, nullable=False, default=SCOPE_READ)  # Bitmask of SCOPE_*
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_used_at = Column(DateTime, nullable=True)
 
     # Relationships
     org = relationship("Org", back_populates="api_keys")
 
+    def has_scope(self, scope: int) -> bool:
+        """Return True if every bit in ``scope`` is granted to this key."""
+        return self.scopes & scope == scope
+
     def __repr__(self) -> str:
         return f"<ApiKey(id={self.id}, label={self.label})>"
 
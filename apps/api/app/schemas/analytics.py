@@ -1,12 +1,14 @@
 """Analytics schemas."""
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RecentScanResponse(BaseModel):
     """Recent scan summary."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
     models_tested: int
@@ -25,6 +27,8 @@ class UsageMetric(BaseModel):
 class UsageResponse(BaseModel):
     """Usage summary response."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     scans: UsageMetric
     prompts: UsageMetric
     ai_pages: UsageMetric
@@ -35,6 +39,8 @@ class UsageResponse(BaseModel):
 class DashboardStatsResponse(BaseModel):
     """Dashboard statistics response."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     visibility_score: float
     visibility_growth: float
     visibility_score_version: str  # Version of the score calculation formula
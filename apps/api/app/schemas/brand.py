@@ -1,8 +1,34 @@
 """Brand schemas with strict validation."""
+import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, HttpUrl
+
+
+# Compiled once at import: optional scheme, then the host, then an optional path
+_DOMAIN_RE = re.compile(r"^\s*(?:[a-z][a-z0-9+.-]*://)?([^/\s]*)(?:/\S*)?\s*$", re.IGNORECASE)
+_DOMAIN_VALID_RE = re.compile(
+    r"^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]*[a-z0-9])?)+$"
+)
+
+
+def _normalize_domain(v: Any) -> Any:
+    """Reduce a URL or domain to its lower-cased host; blank becomes None."""
+    if not isinstance(v, str):
+        return v
+    m = _DOMAIN_RE.match(v)
+    if m is None:
+        raise ValueError("Invalid domain")
+    host = m.group(1).lower()
+    if not host:
+        return None
+    if _DOMAIN_VALID_RE.match(host) is None:
+        raise ValueError("Invalid domain")
+    return host
+
+
+Domain = Annotated[Optional[str], BeforeValidator(_normalize_domain)]
 
 
 class CompetitorBase(BaseModel):
@@ -13,14 +39,6 @@ class CompetitorBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200, description="Competitor name")
     website: HttpUrl = Field(..., description="Competitor website URL")
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v):
-        """Validate competitor name."""
-        if not v or not v.strip():
-            raise ValueError("Competitor name cannot be empty")
-        return v.strip()
-
 
 class CompetitorCreate(CompetitorBase):
     """Competitor creation schema."""
@@ -31,7 +49,7 @@ class CompetitorCreate(CompetitorBase):
 class CompetitorResponse(CompetitorBase):
     """Competitor response schema."""
 
-    model_config = ConfigDict(from_attributes=True, extra="forbid")
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     brand_id: int
@@ -45,39 +63,13 @@ class BrandBase(BaseModel):
 
     name: str = Field(..., min_length=1, max_length=200, description="Brand name")
     website: HttpUrl = Field(..., description="Brand website URL")
-    primary_domain: Optional[str] = Field(None, max_length=255, description="Primary domain for hosting")
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v):
-        """Validate brand name."""
-        if not v or not v.strip():
-            raise ValueError("Brand name cannot be empty")
-        return v.strip()
-
-    @field_validator("primary_domain")
-    @classmethod
-    def validate_domain(cls, v):
-        """Validate domain format."""
-        if v is not None and v.strip():
-            v = v.strip().lower()
-            # Basic domain validation
-            if not v or len(v) > 255:
-                raise ValueError("Invalid domain")
-            # Remove protocol if present
-            if "://" in v:
-                v = v.split("://", 1)[1]
-            # Remove path if present
-            if "/" in v:
-                v = v.split("/", 1)[0]
-            return v
-        return None
 
 
 class BrandCreate(BrandBase):
     """Brand creation schema."""
 
     org_id: int = Field(..., gt=0, description="Organization ID")
+    primary_domain: Domain = Field(None, max_length=255, description="Primary domain for hosting")
 
 
 class BrandUpdate(BaseModel):
@@ -87,16 +79,17 @@ class BrandUpdate(BaseModel):
 
     name: Optional[str] = Field(None, min_length=1, max_length=200)
     website: Optional[HttpUrl] = None
-    primary_domain: Optional[str] = Field(None, max_length=255)
+    primary_domain: Domain = Field(None, max_length=255)
 
 
 class BrandResponse(BrandBase):
     """Brand response schema."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     org_id: int
+    primary_domain: Optional[str] = None
     created_at: datetime
     competitors: List[CompetitorResponse] = []
 
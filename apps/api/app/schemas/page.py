@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from app.models.knowledge_page import PageStatus
 
@@ -17,14 +17,6 @@ class KnowledgePageCreate(BaseModel):
     urls_to_crawl: Optional[List[HttpUrl]] = Field(None, max_length=10, description="URLs to crawl for content")
     vertical: str = Field(default="saas", min_length=1, max_length=50, description="Industry vertical")
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v):
-        """Validate title."""
-        if not v or not v.strip():
-            raise ValueError("Title cannot be empty")
-        return v.strip()
-
 
 class KnowledgePageUpdate(BaseModel):
     """Knowledge page update schema with strict validation."""
@@ -35,37 +27,21 @@ class KnowledgePageUpdate(BaseModel):
     mdx: Optional[str] = Field(None, max_length=100000)  # 100KB limit
     canonical_url: Optional[HttpUrl] = None
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v):
-        """Validate title if provided."""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError("Title cannot be empty")
-        return v.strip() if v else None
-
 
 class KnowledgePagePublish(BaseModel):
     """Knowledge page publish schema with strict validation."""
 
     model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", strict=True)
 
+    # The pattern already rejects upper-case and leading/trailing hyphens
     subdomain: str = Field(..., min_length=1, max_length=63, pattern=r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
 
-    @field_validator("subdomain")
-    @classmethod
-    def validate_subdomain(cls, v):
-        """Validate subdomain format."""
-        v = v.lower().strip()
-        if not v:
-            raise ValueError("Subdomain cannot be empty")
-        if v.startswith("-") or v.endswith("-"):
-            raise ValueError("Subdomain cannot start or end with hyphen")
-        return v
-
 
 class KnowledgePageResponse(BaseModel):
     """Knowledge page response schema."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     brand_id: int
     title: str
@@ -79,9 +55,6 @@ class KnowledgePageResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class KnowledgePageDetailResponse(KnowledgePageResponse):
     """Detailed knowledge page response with content."""
@@ -1,12 +1,19 @@
 """Pagination schemas and utilities."""
 import base64
-import json
+import struct
+from datetime import datetime, timedelta, timezone
 from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field, field_validator
 
 T = TypeVar("T")
 
+# Cursor payload: big-endian int64 id, optionally followed by int64 created_at
+# in microseconds since the epoch (UTC)
+_CURSOR_ID = struct.Struct(">q")
+_CURSOR_ID_CREATED_AT = struct.Struct(">qq")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class PaginationParams(BaseModel):
     """
@@ -24,16 +31,12 @@ class PaginationParams(BaseModel):
     @field_validator("cursor")
     @classmethod
     def validate_cursor(cls, v):
-        """Validate and decode cursor."""
+        """Validate cursor (endpoints decode it with decode_cursor)."""
         if v is None:
             return None
-        try:
-            # Cursors are base64-encoded JSON
-            decoded = base64.b64decode(v).decode("utf-8")
-            cursor_data = json.loads(decoded)
-            return cursor_data
-        except Exception:
+        if decode_cursor(v) is None:
             raise ValueError("Invalid cursor format")
+        return v
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -56,26 +59,27 @@ class PaginatedResponse(BaseModel, Generic[T]):
         from_attributes = True
 
 
-def encode_cursor(last_id: int, last_created_at: Optional[str] = None) -> str:
+def encode_cursor(last_id: int, last_created_at: Optional[datetime] = None) -> str:
     """
     Encode cursor from last item.
     
     Args:
         last_id: ID of last item in current page
-        last_created_at: created_at timestamp of last item (for time-based sorting)
+        last_created_at: created_at timestamp of last item (for time-based sorting);
+            naive datetimes are taken to be UTC
     
     Returns:
-        Base64-encoded cursor string
+        URL-safe base64 cursor string (unpadded)
     """
-    cursor_data = {"id": last_id}
-    if last_created_at:
-        cursor_data["created_at"] = last_created_at
-
-    cursor_json = json.dumps(cursor_data)
-    cursor_bytes = cursor_json.encode("utf-8")
-    cursor_b64 = base64.b64encode(cursor_bytes).decode("utf-8")
+    if last_created_at is None:
+        payload = _CURSOR_ID.pack(last_id)
+    else:
+        if last_created_at.tzinfo is None:
+            last_created_at = last_created_at.replace(tzinfo=timezone.utc)
+        micros = (last_created_at - _EPOCH) // timedelta(microseconds=1)
+        payload = _CURSOR_ID_CREATED_AT.pack(last_id, micros)
 
-    return cursor_b64
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
 
 
 def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
@@ -83,19 +87,23 @@ def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
     Decode cursor string.
     
     Args:
-        cursor: Base64-encoded cursor string
+        cursor: Cursor string from encode_cursor
     
     Returns:
-        Decoded cursor data dict or None
+        Dict with "id" and, if encoded, "created_at" (UTC datetime); None if invalid
     """
     if not cursor:
         return None
 
     try:
-        cursor_bytes = base64.b64decode(cursor)
-        cursor_json = cursor_bytes.decode("utf-8")
-        cursor_data = json.loads(cursor_json)
-        return cursor_data
-    except Exception:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (ValueError, TypeError):
         return None
 
+    if len(payload) == _CURSOR_ID_CREATED_AT.size:
+        last_id, micros = _CURSOR_ID_CREATED_AT.unpack(payload)
+        return {"id": last_id, "created_at": _EPOCH + timedelta(microseconds=micros)}
+    if len(payload) == _CURSOR_ID.size:
+        (last_id,) = _CURSOR_ID.unpack(payload)
+        return {"id": last_id}
+    return None
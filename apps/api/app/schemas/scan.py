@@ -1,12 +1,16 @@
 """Scan schemas with strict validation."""
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from app.models.scan import ScanStatus
 
 
+# Model keys must start with a supported provider prefix
+ModelKey = Annotated[str, StringConstraints(pattern=r"^(gpt-|gemini|perplexity|claude|llama)")]
+
+
 class ScanRunCreate(BaseModel):
     """Scan run creation schema with strict validation."""
 
@@ -14,27 +18,14 @@ class ScanRunCreate(BaseModel):
 
     brand_id: int = Field(..., gt=0, description="Brand ID to scan")
     prompt_set_id: int = Field(..., gt=0, description="Prompt set ID to use")
-    models: List[str] = Field(..., min_length=1, max_length=10, description="List of model keys to test")
-
-    @field_validator("models")
-    @classmethod
-    def validate_models(cls, v):
-        """Validate model list."""
-        if not v or len(v) == 0:
-            raise ValueError("At least one model must be specified")
-        
-        # Validate each model key
-        valid_prefixes = ["gpt-", "gemini", "perplexity", "claude", "llama"]
-        for model in v:
-            if not any(model.startswith(prefix) for prefix in valid_prefixes):
-                raise ValueError(f"Invalid model key: {model}")
-        
-        return v
+    models: List[ModelKey] = Field(..., min_length=1, max_length=10, description="List of model keys to test")
 
 
 class ScanRunResponse(BaseModel):
     """Scan run response schema."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     brand_id: int
     prompt_set_id: int
@@ -44,13 +35,12 @@ class ScanRunResponse(BaseModel):
     finished_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ScanResultResponse(BaseModel):
     """Scan result response schema."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     scan_run_id: int
     model_name: str
@@ -59,13 +49,12 @@ class ScanResultResponse(BaseModel):
     parsed_json: Optional[Dict[str, Any]] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class MentionResponse(BaseModel):
     """Mention response schema."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     scan_result_id: int
     entity_name: str
@@ -76,9 +65,6 @@ class MentionResponse(BaseModel):
     cited_urls_json: Optional[List[str]] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ScanRunDetailResponse(ScanRunResponse):
     """Detailed scan run response with results."""
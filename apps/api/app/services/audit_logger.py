@@ -1,11 +1,15 @@
 """Audit logging service."""
 import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
+import random
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app import audit_sink
+from app.config import settings
 from app.models.audit_log import AuditLog, AuditAction
 
 logger = logging.getLogger(__name__)
@@ -35,9 +39,12 @@ class AuditLogger:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
         request_id: Optional[str] = None,
-    ) -> AuditLog:
+    ) -> Optional[AuditLog]:
         """
         Log an audit event.
+
+        When written inline the row is only flushed, so the caller's commit
+        persists it together with the audited change.
         
         Args:
             db: Database session
@@ -52,37 +59,60 @@ class AuditLogger:
             request_id: Request ID for correlation
         
         Returns:
-            Created audit log entry
+            Created audit log entry, or None if the event was queued for the
+            background sink, or skipped because auditing is disabled or the
+            READ event was sampled out
         """
+        if AuditLogger._skip(action):
+            return None
+
         try:
-            audit_log = AuditLog(
-                user_id=user_id,
-                org_id=org_id,
-                action=action,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                details=details or {},
-                ip_address=ip_address,
-                user_agent=user_agent,
-                request_id=request_id,
-                created_at=datetime.utcnow(),
-            )
-
-            db.add(audit_log)
-            db.commit()
-            db.refresh(audit_log)
-
-            logger.info(
-                f"Audit: {action.value} {resource_type}#{resource_id} by user#{user_id} org#{org_id}",
-                extra={
-                    "user_id": user_id,
-                    "org_id": org_id,
-                    "action": action.value,
-                    "resource_type": resource_type,
-                    "resource_id": resource_id,
-                    "request_id": request_id,
-                },
-            )
+            row = {
+                "user_id": user_id,
+                "org_id": org_id,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "details": details or {},
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "request_id": request_id,
+                # Stamped here: a queued row may be inserted well after the
+                # event (backlog, shutdown drain), so the server default
+                # would record the insert time instead
+                "created_at": datetime.now(timezone.utc),
+            }
+
+            if audit_sink.emit_nowait(row):
+                # Batched by the background sink; no row is available yet
+                audit_log = None
+            else:
+                # Sink not running or saturated: write inline rather than drop
+                # Flushed in a savepoint, not committed: the row commits or rolls
+                # back with the caller's work, and a failed write only rolls back
+                # the savepoint, leaving the caller's transaction usable
+                audit_log = AuditLog(**row)
+                with db.begin_nested():
+                    db.add(audit_log)
+
+            # Formatting and the extra dict are skipped when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Audit: %s %s#%s by user#%s org#%s",
+                    action.value,
+                    resource_type,
+                    resource_id,
+                    user_id,
+                    org_id,
+                    extra={
+                        "user_id": user_id,
+                        "org_id": org_id,
+                        "action": action.value,
+                        "resource_type": resource_type,
+                        "resource_id": resource_id,
+                        "request_id": request_id,
+                    },
+                )
 
             return audit_log
 
@@ -91,6 +121,63 @@ class AuditLogger:
             # Don't fail the main operation if audit logging fails
             return None
 
+    @staticmethod
+    def log_many(db: Session, records: List[Dict[str, Any]]) -> None:
+        """
+        Log several audit events with a single multi-row INSERT.
+
+        Each record takes the same keys as log()'s keyword arguments. Events
+        the background sink can't take are written inline in one statement
+        and, as with log(), left for the caller's commit.
+
+        Args:
+            db: Database session
+            records: Audit events, e.g. collected over a bulk operation
+        """
+        rows = []
+        for record in records:
+            if AuditLogger._skip(record["action"]):
+                continue
+            row = {
+                "user_id": record["user_id"],
+                "org_id": record["org_id"],
+                "action": record["action"],
+                "resource_type": record["resource_type"],
+                "resource_id": record.get("resource_id"),
+                "details": record.get("details") or {},
+                "ip_address": record.get("ip_address"),
+                "user_agent": record.get("user_agent"),
+                "request_id": record.get("request_id"),
+                "created_at": datetime.now(timezone.utc),
+            }
+            if not audit_sink.emit_nowait(row):
+                rows.append(row)
+
+        if not rows:
+            return
+
+        try:
+            # In a savepoint, as in log(): a failed INSERT leaves the caller's
+            # transaction usable
+            with db.begin_nested():
+                db.execute(insert(AuditLog), rows)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Audit: wrote %d events inline", len(rows))
+        except Exception as e:
+            logger.error(f"Failed to write audit logs: {e}", exc_info=True)
+            # Don't fail the main operation if audit logging fails
+
+    @staticmethod
+    def _skip(action: AuditAction) -> bool:
+        """Whether an event is dropped by the kill switch or READ sampling."""
+        if not settings.AUDIT_ENABLED:
+            return True
+        return (
+            action == AuditAction.READ
+            and settings.AUDIT_SAMPLE_RATE_READ < 1.0
+            and random.random() >= settings.AUDIT_SAMPLE_RATE_READ
+        )
+
     @staticmethod
     def log_create(
         db: Session,
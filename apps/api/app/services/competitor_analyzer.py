@@ -4,15 +4,28 @@ Competitor Analyzer Service
 Analyzes competitive landscape and market share.
 """
 
-from typing import List, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_
+from operator import itemgetter
+from sqlalchemy import select, func, and_, literal, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.mention import Mention
+from app.models.mention import EntityType, Mention
 from app.models.scan import ScanResult, ScanRun
 from app.models.brand import Brand, Competitor
 
+# Analyses are read-heavy and only move as scans finish, so serve repeats from memory briefly
+ANALYSIS_CACHE_TTL = 60  # seconds
+ANALYSIS_CACHE_SIZE = 256
+
+# (brand_id, days) -> (expires_at monotonic time, analysis), least recently used first
+_analysis_cache: "OrderedDict[Tuple[str, int], Tuple[float, Dict]]" = OrderedDict()
+
+# Built once rather than a lambda per sort
+_BY_MENTIONS = itemgetter("mentions")
+
 
 class CompetitorAnalyzer:
     """Analyzes competitive positioning and market share."""
@@ -61,69 +74,63 @@ class CompetitorAnalyzer:
                 "period": {"start": "...", "end": "...", "days": 30},
                 "total_mentions": 220
             }
+            
+            Results are cached per (brand_id, days) for ANALYSIS_CACHE_TTL
+            seconds and shared between callers, so treat them as read-only.
         """
+        key = (str(brand_id), days)
+        now = time.monotonic()
+        
+        cached = _analysis_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _analysis_cache.move_to_end(key)
+            return cached[1]
+        
+        analysis = await self._compute_analysis(brand_id, days)
+        
+        _analysis_cache[key] = (now + ANALYSIS_CACHE_TTL, analysis)
+        _analysis_cache.move_to_end(key)
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+        
+        return analysis
+    
+    async def _compute_analysis(self, brand_id: str, days: int) -> Dict:
+        """Run the competitor analysis queries (uncached)."""
         # Calculate date range
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
-        # Get brand info
-        brand = await self._get_brand(brand_id)
-        if not brand:
-            raise ValueError(f"Brand {brand_id} not found")
-        
-        # Get brand metrics
-        brand_metrics = await self._get_entity_metrics(
+        # Brand and competitor metrics in a single round-trip
+        brand_metrics, competitors_data, total_mentions = await self._get_all_entity_metrics(
             brand_id=brand_id,
-            entity_type="brand",
-            entity_name=brand.name,
             start_date=start_date,
             end_date=end_date
         )
+        if brand_metrics is None:
+            raise ValueError(f"Brand {brand_id} not found")
         
-        # Get competitor metrics
-        competitors_data = await self._get_all_competitors_metrics(
-            brand_id=brand_id,
-            start_date=start_date,
-            end_date=end_date
-        )
+        # Sort competitors by mentions (descending)
+        competitors_data.sort(key=_BY_MENTIONS, reverse=True)
         
-        # Calculate total mentions
-        total_mentions = brand_metrics["mentions"] + sum(
-            c["mentions"] for c in competitors_data
-        )
+        all_entities = [brand_metrics] + competitors_data
         
         # Calculate market share
-        if total_mentions > 0:
-            brand_metrics["market_share_pct"] = round(
-                (brand_metrics["mentions"] / total_mentions) * 100, 2
+        for entity in all_entities:
+            entity["market_share_pct"] = (
+                round((entity["mentions"] / total_mentions) * 100, 2) if total_mentions > 0 else 0.0
             )
-            for comp in competitors_data:
-                comp["market_share_pct"] = round(
-                    (comp["mentions"] / total_mentions) * 100, 2
-                )
-        else:
-            brand_metrics["market_share_pct"] = 0.0
-            for comp in competitors_data:
-                comp["market_share_pct"] = 0.0
         
-        # Create rankings
-        all_entities = [brand_metrics] + competitors_data
+        # Create rankings from one pass over the entities; dicts are built only for output
+        rows = [
+            (e["name"], e["mentions"], e["avg_sentiment"], e["avg_position"])
+            for e in all_entities
+        ]
         
         rankings = {
-            "by_mentions": sorted(
-                [{"name": e["name"], "value": e["mentions"]} for e in all_entities],
-                key=lambda x: x["value"],
-                reverse=True
-            ),
-            "by_sentiment": sorted(
-                [{"name": e["name"], "value": e["avg_sentiment"]} for e in all_entities],
-                key=lambda x: x["value"],
-                reverse=True
-            ),
-            "by_position": sorted(
-                [{"name": e["name"], "value": e["avg_position"]} for e in all_entities],
-                key=lambda x: x["value"]  # Lower position is better
-            )
+            "by_mentions": self._ranking(rows, 1, reverse=True),
+            "by_sentiment": self._ranking(rows, 2, reverse=True),
+            "by_position": self._ranking(rows, 3),  # Lower position is better
         }
         
         return {
@@ -138,46 +145,114 @@ class CompetitorAnalyzer:
             "total_mentions": total_mentions
         }
     
-    async def _get_brand(self, brand_id: str) -> Optional[Brand]:
-        """Get brand by ID."""
-        query = select(Brand).where(Brand.id == brand_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
-    
-    async def _get_entity_metrics(
+    async def _get_all_entity_metrics(
         self,
         brand_id: str,
-        entity_type: str,
-        entity_name: str,
         start_date: datetime,
         end_date: datetime
-    ) -> Dict:
-        """Get metrics for a specific entity."""
-        query = (
+    ) -> Tuple[Optional[Dict], List[Dict], int]:
+        """
+        Get metrics for a brand and all its competitors with one query.
+        
+        The brand and competitor names are selected inside the statement and
+        left-joined to the period's mentions, so entities without mentions
+        still come back (with zeroed metrics) and no separate name lookup is
+        needed first.
+        
+        Args:
+            brand_id: Brand ID
+            start_date: Period start
+            end_date: Period end
+            
+        Returns:
+            Tuple of (brand metrics, competitor metrics, total mentions across
+            them); brand metrics are None if the brand doesn't exist
+        """
+        entity_type = Mention.entity_type.expression.type
+        entities = union_all(
+            select(
+                literal(EntityType.BRAND, entity_type).label('entity_type'),
+                Brand.name.label('entity_name')
+            ).where(Brand.id == brand_id),
+            select(
+                literal(EntityType.COMPETITOR, entity_type).label('entity_type'),
+                Competitor.name.label('entity_name')
+            ).where(Competitor.brand_id == brand_id)
+        ).subquery('entities')
+        
+        mentions = (
             select(
-                func.count(Mention.id).label('mention_count'),
-                func.avg(Mention.sentiment).label('avg_sentiment'),
-                func.avg(Mention.position_index).label('avg_position'),
-                func.avg(Mention.confidence).label('avg_confidence')
+                Mention.id,
+                Mention.entity_type.label('entity_type'),
+                Mention.entity_name,
+                Mention.sentiment,
+                Mention.position_index,
+                Mention.confidence
             )
             .join(ScanResult, Mention.scan_result_id == ScanResult.id)
             .join(ScanRun, ScanResult.scan_run_id == ScanRun.id)
             .where(
                 and_(
                     ScanRun.brand_id == brand_id,
-                    Mention.entity_type == entity_type,
-                    Mention.entity_name == entity_name,
                     ScanRun.created_at >= start_date,
                     ScanRun.created_at <= end_date,
                     ScanRun.status == 'done'
                 )
             )
+            .subquery('period_mentions')
+        )
+        
+        query = (
+            select(
+                entities.c.entity_type,
+                entities.c.entity_name,
+                func.count(mentions.c.id).label('mention_count'),
+                func.avg(mentions.c.sentiment).label('avg_sentiment'),
+                func.avg(mentions.c.position_index).label('avg_position'),
+                func.avg(mentions.c.confidence).label('avg_confidence'),
+                # Grand total over all groups, computed alongside the per-entity counts
+                func.sum(func.count(mentions.c.id)).over().label('grand_total')
+            )
+            .select_from(entities)
+            .outerjoin(
+                mentions,
+                and_(
+                    mentions.c.entity_type == entities.c.entity_type,
+                    mentions.c.entity_name == entities.c.entity_name
+                )
+            )
+            .group_by(entities.c.entity_type, entities.c.entity_name)
         )
         
         result = await self.db.execute(query)
-        row = result.first()
+        rows = result.all()
+        
+        # Every row carries the same grand total
+        total_mentions = int(rows[0].grand_total) if rows else 0
+        
+        brand_metrics = None
+        competitors_data = []
+        for row in rows:
+            metrics = self._format_metrics(row.entity_name, row)
+            if row.entity_type == EntityType.BRAND:
+                brand_metrics = metrics
+            else:
+                competitors_data.append(metrics)
         
-        if not row or row.mention_count == 0:
+        return brand_metrics, competitors_data, total_mentions
+    
+    @staticmethod
+    def _ranking(rows: List[Tuple], column: int, reverse: bool = False) -> List[Dict]:
+        """Rank (name, mentions, sentiment, position) rows by one column."""
+        return [
+            {"name": row[0], "value": row[column]}
+            for row in sorted(rows, key=itemgetter(column), reverse=reverse)
+        ]
+    
+    @staticmethod
+    def _format_metrics(entity_name: str, row=None) -> Dict:
+        """Build an entity's metrics dict from an aggregate row (zeros if none)."""
+        if row is None or row.mention_count == 0:
             return {
                 "name": entity_name,
                 "mentions": 0,
@@ -194,35 +269,6 @@ class CompetitorAnalyzer:
             "avg_confidence": round(float(row.avg_confidence) if row.avg_confidence else 0.0, 3)
         }
     
-    async def _get_all_competitors_metrics(
-        self,
-        brand_id: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> List[Dict]:
-        """Get metrics for all competitors."""
-        # Get list of competitors
-        query = select(Competitor).where(Competitor.brand_id == brand_id)
-        result = await self.db.execute(query)
-        competitors = result.scalars().all()
-        
-        # Get metrics for each competitor
-        competitors_data = []
-        for competitor in competitors:
-            metrics = await self._get_entity_metrics(
-                brand_id=brand_id,
-                entity_type="competitor",
-                entity_name=competitor.name,
-                start_date=start_date,
-                end_date=end_date
-            )
-            competitors_data.append(metrics)
-        
-        # Sort by mentions (descending)
-        competitors_data.sort(key=lambda x: x["mentions"], reverse=True)
-        
-        return competitors_data
-    
     async def get_competitive_positioning(
         self,
         brand_id: str,
@@ -245,8 +291,10 @@ class CompetitorAnalyzer:
                 "insights": []
             }
         
-        avg_mentions = sum(e["mentions"] for e in all_entities) / len(all_entities)
-        avg_sentiment = sum(e["avg_sentiment"] for e in all_entities) / len(all_entities)
+        # Read each entity's fields once
+        rows = [(e["name"], e["mentions"], e["avg_sentiment"]) for e in all_entities]
+        avg_mentions = sum(row[1] for row in rows) / len(rows)
+        avg_sentiment = sum(row[2] for row in rows) / len(rows)
         
         # Classify entities into quadrants
         quadrants = {
@@ -256,18 +304,18 @@ class CompetitorAnalyzer:
             "emerging": []  # Low mentions, low sentiment
         }
         
-        for entity in all_entities:
-            high_mentions = entity["mentions"] >= avg_mentions
-            high_sentiment = entity["avg_sentiment"] >= avg_sentiment
+        for name, mentions, sentiment in rows:
+            high_mentions = mentions >= avg_mentions
+            high_sentiment = sentiment >= avg_sentiment
             
             if high_mentions and high_sentiment:
-                quadrants["leaders"].append(entity["name"])
+                quadrants["leaders"].append(name)
             elif high_mentions and not high_sentiment:
-                quadrants["challengers"].append(entity["name"])
+                quadrants["challengers"].append(name)
             elif not high_mentions and high_sentiment:
-                quadrants["niche_positive"].append(entity["name"])
+                quadrants["niche_positive"].append(name)
             else:
-                quadrants["emerging"].append(entity["name"])
+                quadrants["emerging"].append(name)
         
         # Determine brand position
         brand_name = analysis["brand"]["name"]
@@ -315,19 +363,26 @@ class CompetitorAnalyzer:
         
         # Competitive insights
         if competitors:
-            top_competitor = max(competitors, key=lambda x: x["mentions"])
+            # Track top mentions and best sentiment in one pass (first wins on ties, like max())
+            top_competitor = best_sentiment = competitors[0]
+            for competitor in competitors[1:]:
+                if competitor["mentions"] > top_competitor["mentions"]:
+                    top_competitor = competitor
+                if competitor["avg_sentiment"] > best_sentiment["avg_sentiment"]:
+                    best_sentiment = competitor
+            
             if top_competitor["mentions"] > brand["mentions"]:
                 gap = top_competitor["mentions"] - brand["mentions"]
                 insights.append(f"Top competitor '{top_competitor['name']}' has {gap} more mentions. Consider increasing content presence.")
             
-            best_sentiment = max(competitors, key=lambda x: x["avg_sentiment"])
             if best_sentiment["avg_sentiment"] > brand["avg_sentiment"]:
                 insights.append(f"'{best_sentiment['name']}' has better sentiment. Analyze their messaging and positioning.")
         
         # Market share insights
-        if brand.get("market_share_pct", 0) < 25:
+        market_share = brand.get("market_share_pct", 0)
+        if market_share < 25:
             insights.append("Market share below 25%. Focus on increasing AI visibility through optimized content.")
-        elif brand.get("market_share_pct", 0) > 50:
+        elif market_share > 50:
             insights.append("Strong market dominance with >50% share. Maintain and defend your position.")
         
         return insights
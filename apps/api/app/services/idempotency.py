@@ -1,9 +1,10 @@
 """Idempotency service for safe client retries."""
-import json
 from datetime import datetime
 from typing import Optional, Tuple
 
 from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.models.idempotency import IdempotencyKey
@@ -56,8 +57,7 @@ def check_idempotency_key(
     
     if existing:
         # Return cached response
-        response_body = json.loads(existing.response_body) if existing.response_body else {}
-        return (existing.status_code, response_body)
+        return (existing.status_code, existing.response_body or {})
     
     return None
 
@@ -85,50 +85,52 @@ def store_idempotency_key(
     if not idempotency_key:
         return
     
-    # Check if already exists (race condition protection)
-    existing = (
-        db.query(IdempotencyKey)
-        .filter(
-            IdempotencyKey.idempotency_key == idempotency_key,
-            IdempotencyKey.org_id == org_id,
-            IdempotencyKey.resource_type == resource_type
+    # Single round-trip; a concurrent request that stored the key first wins
+    stmt = (
+        insert(IdempotencyKey)
+        .values(
+            idempotency_key=idempotency_key,
+            org_id=org_id,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            response_body=response_body,
+            status_code=status_code,
         )
-        .first()
+        .on_conflict_do_nothing(constraint="uq_idempotency_key_scope")
     )
-    
-    if existing:
-        # Already stored (concurrent request beat us)
-        return
-    
-    # Store new key
-    key_record = IdempotencyKey(
-        idempotency_key=idempotency_key,
-        org_id=org_id,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        response_body=json.dumps(response_body),
-        status_code=status_code
-    )
-    db.add(key_record)
+    db.execute(stmt)
     db.commit()
 
 
-def cleanup_expired_keys(db: Session, batch_size: int = 1000) -> int:
+def cleanup_expired_keys(db: Session, batch_size: int = 10_000) -> int:
     """Delete expired idempotency keys (run as background job).
     
+    Deletes in batches, committing after each one, until no expired keys
+    remain. Each batch is picked with an index range scan on expires_at.
+    
     Args:
         db: Database session
-        batch_size: Max number of keys to delete per run
+        batch_size: Number of keys to delete per transaction
     
     Returns:
         Number of keys deleted
     """
-    deleted = (
-        db.query(IdempotencyKey)
-        .filter(IdempotencyKey.expires_at <= datetime.utcnow())
-        .limit(batch_size)
-        .delete(synchronize_session=False)
-    )
-    db.commit()
-    return deleted
+    now = datetime.utcnow()
+    total = 0
+    
+    while True:
+        expired_ids = (
+            select(IdempotencyKey.id)
+            .where(IdempotencyKey.expires_at <= now)
+            .limit(batch_size)
+        )
+        deleted = db.execute(
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
 
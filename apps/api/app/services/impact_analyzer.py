@@ -4,22 +4,57 @@ Impact Analyzer Service
 Analyzes the impact of published knowledge pages on brand visibility.
 """
 
-from typing import Dict, Optional
+import logging
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_
+
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy import select, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.knowledge_page import KnowledgePage
 from app.models.mention import Mention
 from app.models.scan import ScanResult, ScanRun
 
+logger = logging.getLogger(__name__)
+
+# Cache lifetime of an analysis whose after window is still open
+IMPACT_CACHE_TTL = 300  # 5 minutes
+# Settled analyses don't change; the TTL only bounds how long unused ones stay
+IMPACT_CACHE_TTL_SETTLED = 7 * 86400  # 7 days
+
+
+@dataclass(slots=True)
+class PeriodMetrics:
+    """Aggregated brand metrics for one side of the impact comparison."""
+    
+    mentions: int = 0
+    avg_sentiment: float = 0.0
+    avg_position: float = 0.0
+    median_position: float = 0.0
+    avg_confidence: float = 0.0
+    visibility_score: float = 0.0
+
+
+# Metrics compared between the periods, in response order
+_METRIC_NAMES = tuple(field.name for field in fields(PeriodMetrics))
+
 
 class ImpactAnalyzer:
     """Analyzes before/after impact of knowledge page publication."""
     
-    def __init__(self, db: AsyncSession):
-        """Initialize with database session."""
+    def __init__(self, db: AsyncSession, redis_client: Optional[Redis] = None):
+        """
+        Initialize with database session.
+        
+        Args:
+            db: Database session
+            redis_client: Optional Redis client for caching analyses
+        """
         self.db = db
+        self.redis_client = redis_client
     
     async def get_page_impact(
         self,
@@ -49,6 +84,7 @@ class ImpactAnalyzer:
                     "mentions": 50,
                     "avg_sentiment": 0.6,
                     "avg_position": 3.2,
+                    "median_position": 3.0,
                     "visibility_score": 45.5
                 },
                 "after": {
@@ -56,6 +92,7 @@ class ImpactAnalyzer:
                     "mentions": 75,
                     "avg_sentiment": 0.8,
                     "avg_position": 1.8,
+                    "median_position": 1.0,
                     "visibility_score": 68.3
                 },
                 "changes": {
@@ -105,45 +142,77 @@ class ImpactAnalyzer:
         
         # Don't analyze future dates
         now = datetime.utcnow()
+        # A window closed for an hour has no scans left to finish, so its
+        # analysis no longer changes
+        settled = after_end <= now - timedelta(hours=1)
         if after_end > now:
             after_end = now
             actual_after_days = (after_end - after_start).days
         else:
             actual_after_days = after_days
         
-        # Get metrics for before period
-        before_metrics = await self._get_period_metrics(
-            brand_id=page.brand_id,
-            start_date=before_start,
-            end_date=before_end
-        )
-        
-        # Get metrics for after period
-        after_metrics = await self._get_period_metrics(
-            brand_id=page.brand_id,
-            start_date=after_start,
-            end_date=after_end
-        )
-        
-        # Calculate changes
-        changes = self._calculate_changes(before_metrics, after_metrics)
-        
-        # Assess statistical significance
-        significance = self._assess_statistical_significance(
-            before_metrics,
-            after_metrics,
-            before_days,
-            actual_after_days
-        )
-        
-        # Generate insights
-        insights = self._generate_insights(
-            before_metrics,
-            after_metrics,
-            changes,
-            significance
+        cache_key = (
+            f"impact:{page.id}:{before_days}:{after_days}:{int(published_at.timestamp())}"
         )
+        analysis = await self._get_cached(cache_key)
+        
+        if analysis is None:
+            # Get metrics for both periods in one round-trip
+            before_metrics, after_metrics = await self._get_two_period_metrics(
+                brand_id=page.brand_id,
+                before_start=before_start,
+                before_end=before_end,
+                after_start=after_start,
+                after_end=after_end
+            )
+            
+            # Calculate changes
+            changes = self._calculate_changes(before_metrics, after_metrics)
+            
+            # Assess statistical significance
+            significance = self._assess_statistical_significance(
+                before_metrics,
+                after_metrics,
+                before_days,
+                actual_after_days
+            )
+            
+            # Generate insights
+            insights = self._generate_insights(
+                before_metrics,
+                after_metrics,
+                changes,
+                significance
+            )
+            
+            analysis = {
+                "before": {
+                    "period": {
+                        "start": before_start.isoformat(),
+                        "end": before_end.isoformat(),
+                        "days": before_days
+                    },
+                    **asdict(before_metrics)
+                },
+                "after": {
+                    "period": {
+                        "start": after_start.isoformat(),
+                        "end": after_end.isoformat(),
+                        "days": actual_after_days
+                    },
+                    **asdict(after_metrics)
+                },
+                "changes": changes,
+                "statistical_significance": significance,
+                "insights": insights
+            }
+            await self._set_cached(
+                cache_key,
+                analysis,
+                IMPACT_CACHE_TTL_SETTLED if settled else IMPACT_CACHE_TTL
+            )
         
+        # Page details are always current; only the analysis is cached
         return {
             "page": {
                 "id": page.id,
@@ -153,96 +222,151 @@ class ImpactAnalyzer:
                 "subdomain": page.subdomain,
                 "path": page.path
             },
-            "before": {
-                "period": {
-                    "start": before_start.isoformat(),
-                    "end": before_end.isoformat(),
-                    "days": before_days
-                },
-                **before_metrics
-            },
-            "after": {
-                "period": {
-                    "start": after_start.isoformat(),
-                    "end": after_end.isoformat(),
-                    "days": actual_after_days
-                },
-                **after_metrics
-            },
-            "changes": changes,
-            "statistical_significance": significance,
-            "insights": insights
+            **analysis
         }
     
+    async def _get_cached(self, cache_key: str) -> Optional[Dict]:
+        """Get a cached analysis, or None on a miss or cache error."""
+        if self.redis_client is None:
+            return None
+        
+        try:
+            cached = await self.redis_client.get(cache_key)
+        except Exception as e:
+            # Don't fail the analysis if the cache is unavailable
+            logger.warning(f"Impact cache get error: {e}")
+            return None
+        
+        return orjson.loads(cached) if cached else None
+    
+    async def _set_cached(self, cache_key: str, analysis: Dict, ttl: int) -> None:
+        """Cache an analysis for ttl seconds."""
+        if self.redis_client is None:
+            return
+        
+        try:
+            await self.redis_client.set(cache_key, orjson.dumps(analysis), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Impact cache set error: {e}")
+    
     async def _get_page(self, page_id: str) -> Optional[KnowledgePage]:
         """Get page by ID."""
         query = select(KnowledgePage).where(KnowledgePage.id == page_id)
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
-    async def _get_period_metrics(
+    async def _get_two_period_metrics(
         self,
         brand_id: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> Dict:
-        """Get aggregated metrics for a time period."""
+        before_start: datetime,
+        before_end: datetime,
+        after_start: datetime,
+        after_end: datetime
+    ) -> Tuple[PeriodMetrics, PeriodMetrics]:
+        """
+        Get aggregated metrics for the before and after periods with one query.
+        
+        Mentions across both ranges are scanned once and each period's
+        aggregates are filtered with CASE, so a scan on the shared boundary
+        still counts toward both periods.
+        
+        Returns:
+            Tuple of (before metrics, after metrics)
+        """
+        periods = {
+            "before": ScanRun.created_at.between(before_start, before_end),
+            "after": ScanRun.created_at.between(after_start, after_end),
+        }
+        
+        columns = []
+        for period, in_period in periods.items():
+            columns += [
+                func.count(case((in_period, Mention.id))).label(f'{period}_mention_count'),
+                func.avg(case((in_period, Mention.sentiment))).label(f'{period}_avg_sentiment'),
+                func.avg(case((in_period, Mention.position_index))).label(f'{period}_avg_position'),
+                # Median ignores the NULLs CASE yields outside the period
+                func.percentile_cont(0.5).within_group(
+                    case((in_period, Mention.position_index))
+                ).label(f'{period}_median_position'),
+                func.avg(case((in_period, Mention.confidence))).label(f'{period}_avg_confidence')
+            ]
+        
         # Query mentions for brand
         query = (
-            select(
-                func.count(Mention.id).label('mention_count'),
-                func.avg(Mention.sentiment).label('avg_sentiment'),
-                func.avg(Mention.position_index).label('avg_position'),
-                func.avg(Mention.confidence).label('avg_confidence')
-            )
+            select(*columns)
+            .select_from(Mention)
             .join(ScanResult, Mention.scan_result_id == ScanResult.id)
             .join(ScanRun, ScanResult.scan_run_id == ScanRun.id)
             .where(
-                and_(
-                    ScanRun.brand_id == brand_id,
-                    Mention.entity_type == 'brand',
-                    ScanRun.created_at >= start_date,
-                    ScanRun.created_at <= end_date,
-                    ScanRun.status == 'done'
-                )
+                # Served by ix_scan_runs_brand_status_created
+                ScanRun.brand_id == brand_id,
+                ScanRun.status == 'done',
+                ScanRun.created_at.between(
+                    min(before_start, after_start), max(before_end, after_end)
+                ),
+                Mention.entity_type == 'brand'
             )
         )
         
         result = await self.db.execute(query)
-        row = result.first()
-        
-        if not row or row.mention_count == 0:
-            return {
-                "mentions": 0,
-                "avg_sentiment": 0.0,
-                "avg_position": 0.0,
-                "avg_confidence": 0.0,
-                "visibility_score": 0.0
-            }
+        row = result.one()
+        
+        return tuple(
+            self._format_period_metrics(
+                mention_count=getattr(row, f'{period}_mention_count'),
+                avg_sentiment=getattr(row, f'{period}_avg_sentiment'),
+                avg_position=getattr(row, f'{period}_avg_position'),
+                median_position=getattr(row, f'{period}_median_position'),
+                avg_confidence=getattr(row, f'{period}_avg_confidence')
+            )
+            for period in periods
+        )
+    
+    def _format_period_metrics(
+        self,
+        mention_count: int,
+        avg_sentiment: Optional[float],
+        avg_position: Optional[float],
+        median_position: Optional[float],
+        avg_confidence: Optional[float]
+    ) -> PeriodMetrics:
+        """Build one period's metrics from its aggregates."""
+        if not mention_count:
+            return PeriodMetrics()
         
         # Calculate visibility score (simplified version)
         # In production, use the full visibility score calculator
         visibility_score = self._calculate_simple_visibility_score(
-            mentions=row.mention_count,
-            avg_position=float(row.avg_position) if row.avg_position else 0.0,
-            avg_sentiment=float(row.avg_sentiment) if row.avg_sentiment else 0.0
+            mentions=mention_count,
+            avg_position=float(avg_position) if avg_position is not None else None,
+            avg_sentiment=float(avg_sentiment) if avg_sentiment else 0.0,
+            median_position=float(median_position) if median_position is not None else None
         )
         
-        return {
-            "mentions": row.mention_count,
-            "avg_sentiment": round(float(row.avg_sentiment) if row.avg_sentiment else 0.0, 3),
-            "avg_position": round(float(row.avg_position) if row.avg_position else 0.0, 2),
-            "avg_confidence": round(float(row.avg_confidence) if row.avg_confidence else 0.0, 3),
-            "visibility_score": round(visibility_score, 2)
-        }
+        return PeriodMetrics(
+            mentions=mention_count,
+            avg_sentiment=round(float(avg_sentiment) if avg_sentiment else 0.0, 3),
+            avg_position=round(float(avg_position) if avg_position else 0.0, 2),
+            median_position=round(float(median_position) if median_position else 0.0, 2),
+            avg_confidence=round(float(avg_confidence) if avg_confidence else 0.0, 3),
+            visibility_score=round(visibility_score, 2)
+        )
     
     def _calculate_simple_visibility_score(
         self,
         mentions: int,
-        avg_position: float,
-        avg_sentiment: float
+        avg_position: Optional[float],
+        avg_sentiment: float,
+        median_position: Optional[float] = None
     ) -> float:
-        """Calculate a simplified visibility score for impact analysis."""
+        """
+        Calculate a simplified visibility score for impact analysis.
+        
+        The position component uses the median position when given, so a
+        few mentions deep in long lists don't drag the score down. Position
+        0 is a first mention and earns the full 30 points; with no position
+        data at all the component is 0.
+        """
         if mentions == 0:
             return 0.0
         
@@ -250,7 +374,8 @@ class ImpactAnalyzer:
         mention_score = min(mentions / 100.0, 1.0) * 40
         
         # Position score (lower is better, scale 0-10 range to 0-30)
-        position_score = max(0, 30 - (avg_position * 3)) if avg_position > 0 else 0
+        position = median_position if median_position is not None else avg_position
+        position_score = max(0, 30 - (position * 3)) if position is not None else 0
         
         # Sentiment score (-1 to 1 range to 0-30)
         sentiment_score = ((avg_sentiment + 1) / 2) * 30
@@ -259,15 +384,15 @@ class ImpactAnalyzer:
     
     def _calculate_changes(
         self,
-        before: Dict,
-        after: Dict
+        before: PeriodMetrics,
+        after: PeriodMetrics
     ) -> Dict:
         """Calculate changes between before and after periods."""
         changes = {}
         
-        for metric in ["mentions", "avg_sentiment", "avg_position", "avg_confidence", "visibility_score"]:
-            before_val = before.get(metric, 0)
-            after_val = after.get(metric, 0)
+        for metric in _METRIC_NAMES:
+            before_val = getattr(before, metric)
+            after_val = getattr(after, metric)
             
             delta = after_val - before_val
             
@@ -286,8 +411,8 @@ class ImpactAnalyzer:
     
     def _assess_statistical_significance(
         self,
-        before: Dict,
-        after: Dict,
+        before: PeriodMetrics,
+        after: PeriodMetrics,
         before_days: int,
         after_days: int
     ) -> Dict:
@@ -300,14 +425,14 @@ class ImpactAnalyzer:
         # Check sample size
         min_mentions = 30  # Minimum for reasonable confidence
         sample_size_sufficient = (
-            before["mentions"] >= min_mentions and 
-            after["mentions"] >= min_mentions
+            before.mentions >= min_mentions and 
+            after.mentions >= min_mentions
         )
         
         # Simple significance check based on magnitude of change
         visibility_change_pct = abs(
-            after["visibility_score"] - before["visibility_score"]
-        ) / max(before["visibility_score"], 1) * 100
+            after.visibility_score - before.visibility_score
+        ) / max(before.visibility_score, 1) * 100
         
         # Consider significant if change > 20% and sample size sufficient
         is_significant = visibility_change_pct > 20 and sample_size_sufficient
@@ -329,8 +454,8 @@ class ImpactAnalyzer:
     
     def _generate_insights(
         self,
-        before: Dict,
-        after: Dict,
+        before: PeriodMetrics,
+        after: PeriodMetrics,
         changes: Dict,
         significance: Dict
     ) -> list[str]:
@@ -354,8 +479,8 @@ class ImpactAnalyzer:
             insights.append(f"Decrease in mentions ({mentions_change:.1f}%). May need content refresh.")
         
         # Position insights
-        pos_before = before["avg_position"]
-        pos_after = after["avg_position"]
+        pos_before = before.avg_position
+        pos_after = after.avg_position
         if pos_before > 0 and pos_after > 0:
             if pos_after < pos_before:
                 improvement = pos_before - pos_after
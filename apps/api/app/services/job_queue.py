@@ -1,8 +1,8 @@
 """Job queue service with idempotency support."""
-import hashlib
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import xxhash
 from redis import Redis
 from rq import Queue
 from rq.job import Job
@@ -11,6 +11,9 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# How long an idempotency key blocks re-enqueuing the same job
+IDEMPOTENCY_TTL = 86400  # 24 hours
+
 
 class JobQueueService:
     """
@@ -54,8 +57,9 @@ class JobQueueService:
         if idempotency_key is None:
             idempotency_key = f"scan:{scan_run_id}"
 
-        # Check if job already exists
-        if self._check_idempotency(idempotency_key):
+        # Claim the key before enqueuing; fails if the job already exists
+        job_id = self._generate_job_id(idempotency_key)
+        if not self._claim_idempotency(idempotency_key, job_id):
             logger.info(
                 f"Duplicate scan job detected: {idempotency_key}",
                 extra={"request_id": request_id, "scan_run_id": scan_run_id},
@@ -64,22 +68,24 @@ class JobQueueService:
 
         # Enqueue job
         queue = Queue("scans", connection=self.redis)
-        job = queue.enqueue(
-            "app.jobs.scan_executor.execute_scan_run",
-            scan_run_id,
-            job_id=self._generate_job_id(idempotency_key),
-            meta={
-                "idempotency_key": idempotency_key,
-                "request_id": request_id,
-                "user_id": user_id,
-                "org_id": org_id,
-                "retry_count": 0,
-            },
-            timeout="30m",  # 30 minute timeout
-        )
-
-        # Store idempotency key
-        self._store_idempotency(idempotency_key, job.id)
+        try:
+            job = queue.enqueue(
+                "app.jobs.scan_executor.execute_scan_run",
+                scan_run_id,
+                job_id=job_id,
+                meta={
+                    "idempotency_key": idempotency_key,
+                    "request_id": request_id,
+                    "user_id": user_id,
+                    "org_id": org_id,
+                    "retry_count": 0,
+                },
+                timeout="30m",  # 30 minute timeout
+            )
+        except Exception:
+            # Release the key so a retry can enqueue the job
+            self._release_idempotency(idempotency_key)
+            raise
 
         logger.info(
             f"Scan job enqueued: {job.id} (scan_run_id={scan_run_id})",
@@ -115,8 +121,9 @@ class JobQueueService:
         if idempotency_key is None:
             idempotency_key = f"page_gen:{page_id}"
 
-        # Check if job already exists
-        if self._check_idempotency(idempotency_key):
+        # Claim the key before enqueuing; fails if the job already exists
+        job_id = self._generate_job_id(idempotency_key)
+        if not self._claim_idempotency(idempotency_key, job_id):
             logger.info(
                 f"Duplicate page generation job detected: {idempotency_key}",
                 extra={"request_id": request_id, "page_id": page_id},
@@ -125,23 +132,25 @@ class JobQueueService:
 
         # Enqueue job
         queue = Queue("pages", connection=self.redis)
-        job = queue.enqueue(
-            "app.jobs.page_generator_job.generate_page_content",
-            page_id,
-            urls_to_crawl,
-            job_id=self._generate_job_id(idempotency_key),
-            meta={
-                "idempotency_key": idempotency_key,
-                "request_id": request_id,
-                "user_id": user_id,
-                "org_id": org_id,
-                "retry_count": 0,
-            },
-            timeout="10m",  # 10 minute timeout
-        )
-
-        # Store idempotency key
-        self._store_idempotency(idempotency_key, job.id)
+        try:
+            job = queue.enqueue(
+                "app.jobs.page_generator_job.generate_page_content",
+                page_id,
+                urls_to_crawl,
+                job_id=job_id,
+                meta={
+                    "idempotency_key": idempotency_key,
+                    "request_id": request_id,
+                    "user_id": user_id,
+                    "org_id": org_id,
+                    "retry_count": 0,
+                },
+                timeout="10m",  # 10 minute timeout
+            )
+        except Exception:
+            # Release the key so a retry can enqueue the job
+            self._release_idempotency(idempotency_key)
+            raise
 
         logger.info(
             f"Page generation job enqueued: {job.id} (page_id={page_id})",
@@ -150,35 +159,112 @@ class JobQueueService:
 
         return job
 
-    def _check_idempotency(self, idempotency_key: str) -> bool:
+    def enqueue_scans_bulk(
+        self,
+        scan_run_ids: List[int],
+        request_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        org_id: Optional[int] = None,
+    ) -> List[Optional[Job]]:
         """
-        Check if a job with this idempotency key already exists.
-        
+        Enqueue several scan jobs with idempotency in two Redis round-trips.
+
+        All idempotency keys are claimed in one pipeline, then the jobs for
+        the claimed keys are enqueued together in a second one.
+
+        Args:
+            scan_run_ids: IDs of scan runs to execute
+            request_id: Request ID for tracing
+            user_id: User who initiated the scans
+            org_id: Organization ID for context
+
         Returns:
-            True if duplicate, False if new
+            Job objects aligned with scan_run_ids, None for duplicates
         """
-        redis_key = f"idempotency:{idempotency_key}"
-        return self.redis.exists(redis_key) > 0
+        idempotency_keys = [f"scan:{scan_run_id}" for scan_run_id in scan_run_ids]
+        job_ids = [self._generate_job_id(key) for key in idempotency_keys]
+
+        # Claim every key at once (SET NX EX per key)
+        pipe = self.redis.pipeline(transaction=False)
+        for idempotency_key, job_id in zip(idempotency_keys, job_ids):
+            pipe.set(f"idempotency:{idempotency_key}", job_id, nx=True, ex=IDEMPOTENCY_TTL)
+        claimed = pipe.execute()
+
+        job_datas = [
+            Queue.prepare_data(
+                "app.jobs.scan_executor.execute_scan_run",
+                args=(scan_run_id,),
+                job_id=job_id,
+                meta={
+                    "idempotency_key": idempotency_key,
+                    "request_id": request_id,
+                    "user_id": user_id,
+                    "org_id": org_id,
+                    "retry_count": 0,
+                },
+                timeout="30m",  # 30 minute timeout
+            )
+            for scan_run_id, idempotency_key, job_id, ok in zip(
+                scan_run_ids, idempotency_keys, job_ids, claimed
+            )
+            if ok
+        ]
 
-    def _store_idempotency(self, idempotency_key: str, job_id: str, ttl: int = 86400):
+        # Enqueue the claimed jobs in one pipeline
+        queue = Queue("scans", connection=self.redis)
+        try:
+            jobs = iter(queue.enqueue_many(job_datas) if job_datas else [])
+        except Exception:
+            # Release the keys so a retry can enqueue the jobs
+            self.redis.delete(
+                *(f"idempotency:{key}" for key, ok in zip(idempotency_keys, claimed) if ok)
+            )
+            raise
+
+        results = [next(jobs) if ok else None for ok in claimed]
+
+        logger.info(
+            f"Scan jobs enqueued: {len(job_datas)} of {len(scan_run_ids)}",
+            extra={"request_id": request_id},
+        )
+
+        return results
+
+    def _claim_idempotency(
+        self, idempotency_key: str, job_id: str, ttl: int = IDEMPOTENCY_TTL
+    ) -> bool:
         """
-        Store idempotency key in Redis.
-        
+        Atomically claim an idempotency key in Redis (SET NX EX).
+
+        One round-trip, and concurrent callers can't both see the key as new.
+        RQ's own job hash (keyed by the same deterministic job id) isn't used
+        for this: checking it is a separate EXISTS before the enqueue, and it
+        only lives for the job's result_ttl rather than the full window.
+
         Args:
             idempotency_key: Idempotency key
             job_id: Job ID
             ttl: Time-to-live in seconds (default: 24 hours)
+
+        Returns:
+            True if claimed, False if duplicate
         """
         redis_key = f"idempotency:{idempotency_key}"
-        self.redis.setex(redis_key, ttl, job_id)
+        return bool(self.redis.set(redis_key, job_id, nx=True, ex=ttl))
+
+    def _release_idempotency(self, idempotency_key: str) -> None:
+        """Release a claimed idempotency key so the job can be enqueued again."""
+        self.redis.delete(f"idempotency:{idempotency_key}")
 
     def _generate_job_id(self, idempotency_key: str) -> str:
         """
         Generate deterministic job ID from idempotency key.
         
         This ensures the same idempotency key always generates the same job ID.
+        A fast non-cryptographic 64-bit hash (16 hex chars) is enough here;
+        duplicates are caught by the idempotency key itself.
         """
-        return hashlib.sha256(idempotency_key.encode()).hexdigest()[:16]
+        return xxhash.xxh3_64_hexdigest(idempotency_key.encode())
 
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -202,3 +288,35 @@ class JobQueueService:
             logger.error(f"Failed to fetch job {job_id}: {e}")
             return None
 
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statuses of many jobs.
+
+        All job hashes are read in one pipeline (Job.fetch_many). Results are
+        left out to keep it to that one round trip; use get_job_status for a
+        single job's result.
+
+        Args:
+            job_ids: IDs of jobs to look up
+
+        Returns:
+            Job status dicts keyed by job ID; jobs that don't exist are left out
+        """
+        try:
+            jobs = [job for job in Job.fetch_many(job_ids, connection=self.redis) if job]
+
+            statuses = {}
+            for job in jobs:
+                statuses[job.id] = {
+                    "id": job.id,
+                    # Already loaded with the hash; don't re-read it
+                    "status": job.get_status(refresh=False),
+                    "created_at": job.created_at,
+                    "started_at": job.started_at,
+                    "ended_at": job.ended_at,
+                    "meta": job.meta,
+                }
+            return statuses
+        except Exception as e:
+            logger.error(f"Failed to fetch {len(job_ids)} jobs: {e}")
+            return {}
@@ -1,8 +1,11 @@
 """Mention extraction service - extract brand mentions from LLM responses."""
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import ahocorasick
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.brand import Brand, Competitor
@@ -14,6 +17,41 @@ logger = logging.getLogger(__name__)
 # Update this when changing the calculation logic to maintain historical accuracy
 VISIBILITY_SCORE_VERSION = "1.0.0"
 
+# Cited URLs near a mention; compiled once rather than per call
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Trailing company forms dropped to build an entity's alias
+_CORP_SUFFIX_RE = re.compile(r",?\s+(?:Inc|LLC|Ltd|Corp(?:oration)?)\.?\s*$", re.IGNORECASE)
+
+# Sentiment keywords, matched as substrings of the lowercased context
+POSITIVE_WORDS = (
+    "best",
+    "excellent",
+    "great",
+    "recommend",
+    "top",
+    "leading",
+    "superior",
+    "innovative",
+    "powerful",
+    "reliable",
+    "trusted",
+    "popular",
+)
+
+NEGATIVE_WORDS = (
+    "worst",
+    "poor",
+    "bad",
+    "avoid",
+    "inferior",
+    "lacking",
+    "disappointing",
+    "unreliable",
+    "buggy",
+    "expensive",
+)
+
 
 class MentionExtractor:
     """Extract brand and competitor mentions from text."""
@@ -33,43 +71,37 @@ class MentionExtractor:
         self.entity_map: Dict[str, Tuple[str, EntityType]] = {}
         self._build_entity_map()
 
+        # One automaton over every entity key, so a response is scanned once
+        # rather than once per key. A str.find loop per key is only faster
+        # for a handful of keys, and falls well behind past about ten
+        self.automaton = ahocorasick.Automaton()
+        for entity_key, (entity_name, entity_type) in self.entity_map.items():
+            if entity_key:
+                self.automaton.add_word(entity_key, (entity_key, entity_name, entity_type))
+        if len(self.automaton):
+            self.automaton.make_automaton()
+
     def _build_entity_map(self) -> None:
         """Build map of entity names to their types."""
         # Add brand
-        brand_name_lower = self.brand.name.lower()
-        self.entity_map[brand_name_lower] = (self.brand.name, EntityType.BRAND)
-
-        # Add brand aliases (simple variations)
-        brand_words = self.brand.name.split()
-        if len(brand_words) > 1:
-            # Add variations without common suffixes
-            for suffix in ["Inc", "Inc.", "LLC", "Ltd", "Corporation", "Corp"]:
-                name_without_suffix = self.brand.name.replace(suffix, "").strip()
-                if name_without_suffix:
-                    self.entity_map[name_without_suffix.lower()] = (
-                        self.brand.name,
-                        EntityType.BRAND,
-                    )
-
-        # Add competitors
-        competitors = (
-            self.db.query(Competitor).filter(Competitor.brand_id == self.brand.id).all()
-        )
-
-        for competitor in competitors:
-            comp_name_lower = competitor.name.lower()
-            self.entity_map[comp_name_lower] = (competitor.name, EntityType.COMPETITOR)
-
-            # Add competitor aliases
-            comp_words = competitor.name.split()
-            if len(comp_words) > 1:
-                for suffix in ["Inc", "Inc.", "LLC", "Ltd", "Corporation", "Corp"]:
-                    name_without_suffix = competitor.name.replace(suffix, "").strip()
-                    if name_without_suffix:
-                        self.entity_map[name_without_suffix.lower()] = (
-                            competitor.name,
-                            EntityType.COMPETITOR,
-                        )
+        self._add_entity(self.brand.name, EntityType.BRAND)
+
+        # Add competitors (names only; no ORM objects needed)
+        competitor_names = self.db.execute(
+            select(Competitor.name).where(Competitor.brand_id == self.brand.id)
+        ).scalars().all()
+
+        for competitor_name in competitor_names:
+            self._add_entity(competitor_name, EntityType.COMPETITOR)
+
+    def _add_entity(self, name: str, entity_type: EntityType) -> None:
+        """Map an entity's name, and its name without a company suffix, to the entity."""
+        self.entity_map[name.lower()] = (name, entity_type)
+
+        # Alias without the company form, e.g. "Acme, Inc." -> "Acme"
+        alias = _CORP_SUFFIX_RE.sub("", name).strip()
+        if alias and alias != name:
+            self.entity_map[alias.lower()] = (name, entity_type)
 
     def extract_mentions(
         self, text: str
@@ -84,87 +116,84 @@ class MentionExtractor:
             List of mention dictionaries
         """
         mentions = []
-        text_lower = text.lower()
-
-        # Find all entity mentions
-        for entity_key, (entity_name, entity_type) in self.entity_map.items():
-            # Find all occurrences
-            pattern = r'\b' + re.escape(entity_key) + r'\b'
-            matches = list(re.finditer(pattern, text_lower))
-
-            for match in matches:
-                # Calculate position index (which mention number is this?)
-                position_index = len([m for m in mentions if m["entity_name"] == entity_name])
-
-                # Extract context around mention for sentiment analysis
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
+        if not len(self.automaton):
+            return mentions
 
-                # Simple sentiment analysis based on keywords
-                sentiment = self._analyze_sentiment(context)
-
-                # Extract any URLs from context
-                urls = self._extract_urls(context)
-
-                mention = {
-                    "entity_name": entity_name,
-                    "entity_type": entity_type,
-                    "position_index": position_index,
-                    "sentiment": sentiment,
-                    "confidence": 0.8,  # High confidence for exact matches
-                    "cited_urls": urls,
-                }
+        # Lowercased once; the scan, boundaries and sentiment all reuse it
+        text_lower = text.lower()
 
-                mentions.append(mention)
+        # End of the last accepted match per key; like re.finditer, a key's
+        # matches don't overlap each other
+        last_end: Dict[str, int] = {}
+        # Mentions found so far per entity
+        counts: Dict[str, int] = defaultdict(int)
+
+        # Find all entity mentions, in text order
+        for end_idx, (entity_key, entity_name, entity_type) in self.automaton.iter(text_lower):
+            match_start = end_idx - len(entity_key) + 1
+            match_end = end_idx + 1
+
+            # Same word boundaries as the \b...\b regex this replaces
+            if not self._is_boundary(text_lower, match_start) or not self._is_boundary(
+                text_lower, match_end
+            ):
+                continue
+            if match_start < last_end.get(entity_key, 0):
+                continue
+            last_end[entity_key] = match_end
+
+            # Calculate position index (which mention number is this?)
+            position_index = counts[entity_name]
+            counts[entity_name] += 1
+
+            # Extract context around mention for sentiment analysis
+            start = max(0, match_start - 100)
+            end = min(len(text), match_end + 100)
+            context = text[start:end]
+
+            # Simple sentiment analysis based on keywords, on the already-lowercased text
+            sentiment = self._analyze_sentiment(text_lower[start:end])
+
+            # Extract any URLs from context (case-sensitive, so the original text)
+            urls = self._extract_urls(context)
+
+            mention = {
+                "entity_name": entity_name,
+                "entity_type": entity_type,
+                "position_index": position_index,
+                "sentiment": sentiment,
+                "confidence": 0.8,  # High confidence for exact matches
+                "cited_urls": urls,
+            }
+
+            mentions.append(mention)
 
         # Also check for fuzzy matches (simple Levenshtein-like approach)
         # For production, consider using more sophisticated NER or embeddings
 
         return mentions
 
-    def _analyze_sentiment(self, context: str) -> float:
+    @staticmethod
+    def _is_boundary(text: str, index: int) -> bool:
+        """Whether a regex \\b word boundary falls before text[index]."""
+        before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+        after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+        return before != after
+
+    def _analyze_sentiment(self, context_lower: str) -> float:
         """
         Analyze sentiment of context.
 
         Args:
-            context: Text context
+            context_lower: Lowercased text context
 
         Returns:
             Sentiment score (-1.0 to 1.0)
         """
-        context_lower = context.lower()
-
-        positive_words = [
-            "best",
-            "excellent",
-            "great",
-            "recommend",
-            "top",
-            "leading",
-            "superior",
-            "innovative",
-            "powerful",
-            "reliable",
-            "trusted",
-            "popular",
-        ]
-
-        negative_words = [
-            "worst",
-            "poor",
-            "bad",
-            "avoid",
-            "inferior",
-            "lacking",
-            "disappointing",
-            "unreliable",
-            "buggy",
-            "expensive",
-        ]
-
-        positive_count = sum(1 for word in positive_words if word in context_lower)
-        negative_count = sum(1 for word in negative_words if word in context_lower)
+        # Plain substring tests beat a compiled alternation here, even as an
+        # "any keyword?" pre-check, on ~200-char contexts
+        positive_count = sum(1 for word in POSITIVE_WORDS if word in context_lower)
+        negative_count = sum(1 for word in NEGATIVE_WORDS if word in context_lower)
 
         total = positive_count + negative_count
         if total == 0:
@@ -184,8 +213,7 @@ class MentionExtractor:
         Returns:
             List of URLs
         """
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, text)
+        urls = _URL_RE.findall(text)
         return urls[:5]  # Limit to 5 URLs
 
 
@@ -287,11 +315,52 @@ def calculate_visibility_score(
     Returns:
         Visibility score (0-100)
     """
-    result = calculate_visibility_score_with_breakdown(
-        brand_mention_count,
-        competitor_mention_counts,
-        brand_positions,
-        brand_sentiments
-    )
-    return result["score"]
+    return calculate_visibility_scores_batch(
+        [brand_mention_count],
+        [sum(competitor_mention_counts)],
+        [sum(brand_positions) / len(brand_positions) if brand_positions else None],
+        [sum(brand_sentiments) / len(brand_sentiments) if brand_sentiments else None],
+    )[0]
+
+
+def calculate_visibility_scores_batch(
+    brand_counts: Sequence[int],
+    competitor_total_counts: Sequence[int],
+    avg_positions: Sequence[Optional[float]],
+    avg_sentiments: Sequence[Optional[float]],
+) -> List[float]:
+    """
+    Calculate visibility scores for many (brand, scan run) pairs at once.
+
+    Same formula as calculate_visibility_score, over pre-aggregated inputs
+    and in a single loop, for backfill and aggregation jobs that would
+    otherwise build per-pair lists and breakdown dicts.
+
+    Args:
+        brand_counts: Brand mention count per pair
+        competitor_total_counts: Total competitor mention count per pair
+        avg_positions: Average brand position per pair, None if unknown
+        avg_sentiments: Average brand sentiment per pair, None if unknown
+
+    Returns:
+        Visibility scores (0-100), aligned with the inputs
+    """
+    scores = []
+    for brand_count, competitor_count, avg_position, avg_sentiment in zip(
+        brand_counts, competitor_total_counts, avg_positions, avg_sentiments
+    ):
+        total_mentions = brand_count + competitor_count
+        if total_mentions == 0:
+            scores.append(0.0)
+            continue
+
+        total_score = brand_count / total_mentions * 40
+        if avg_position is not None:
+            total_score += max(0, 30 - (avg_position * 2))
+        if avg_sentiment is not None:
+            total_score += (avg_sentiment + 1) * 15
+
+        scores.append(min(100.0, max(0.0, total_score)))
+
+    return scores
 
@@ -4,12 +4,40 @@ Page Cache Service
 Redis-based caching for rendered pages to improve performance.
 """
 
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+import asyncio
+import gzip
 import json
+import uuid
+from weakref import WeakValueDictionary
 import redis.asyncio as redis
-from app.config import get_settings
+import xxhash
+from cachetools import TTLCache
+from app.config import settings
 
-settings = get_settings()
+# One pool shared by every PageCache, so connections are reused across
+# instances rather than set up per client. Raw bytes: page bodies are
+# stored compressed. Connections are only opened on first use.
+_POOL = redis.ConnectionPool.from_url(settings.REDIS_URL, max_connections=50)
+
+# Pages are stored gzip-compressed and served as-is to clients that accept
+# gzip. Entries written before compression are plain HTML; gzip's magic
+# bytes tell the two apart.
+PAGE_COMPRESS_LEVEL = 6
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Keys per SCAN batch when invalidating a subdomain
+INVALIDATE_SCAN_COUNT = 1000
+
+# In-process layer in front of Redis for hot pages. Invalidation only clears
+# this process's copy, so other workers may serve a page for up to the TTL.
+LOCAL_CACHE_SIZE = 1024
+LOCAL_CACHE_TTL = 60  # seconds
+
+# Single-flight fills: how long the cluster-wide fill sentinel lives, and how
+# long other requests wait for the filler before rendering themselves
+FILL_LOCK_TTL_MS = 10000
+FILL_WAIT_SECONDS = 5.0
 
 
 class PageCache:
@@ -19,20 +47,19 @@ class PageCache:
         """Initialize Redis connection."""
         self.redis_client: Optional[redis.Redis] = None
         self.ttl = 3600  # 1 hour cache TTL
+        self._local: TTLCache = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL)
+        self._fill_locks: WeakValueDictionary = WeakValueDictionary()
     
     async def connect(self):
-        """Connect to Redis."""
+        """Connect to Redis through the shared pool."""
         if not self.redis_client:
-            self.redis_client = await redis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True
-            )
+            self.redis_client = redis.Redis(connection_pool=_POOL)
     
     async def disconnect(self):
-        """Disconnect from Redis."""
+        """Release this instance's client; the shared pool stays open."""
         if self.redis_client:
             await self.redis_client.close()
+            self.redis_client = None
     
     async def get_page(self, subdomain: str, path: str) -> Optional[str]:
         """
@@ -45,18 +72,185 @@ class PageCache:
         Returns:
             Cached HTML or None if not found
         """
-        if not self.redis_client:
-            await self.connect()
+        body = await self.get_page_gzip(subdomain, path)
+        return gzip.decompress(body).decode() if body is not None else None
+    
+    async def get_page_gzip(self, subdomain: str, path: str) -> Optional[bytes]:
+        """
+        Get cached page HTML, gzip-compressed.
         
+        Args:
+            subdomain: Page subdomain
+            path: Page path
+            
+        Returns:
+            Compressed HTML, ready to send with Content-Encoding: gzip, or
+            None if not found
+        """
         cache_key = self._build_cache_key(subdomain, path)
         
+        # Hot pages are served without a Redis round-trip
+        body = self._local.get(cache_key)
+        if body is not None:
+            return body
+        
+        if not self.redis_client:
+            await self.connect()
+        
         try:
-            cached_html = await self.redis_client.get(cache_key)
-            return cached_html
+            body = await self.redis_client.get(cache_key)
         except Exception as e:
             # Log error but don't fail - just skip cache
             print(f"Cache get error: {e}")
             return None
+        
+        if body is None:
+            return None
+        return self._remember_body(cache_key, body)
+    
+    async def get_pages(self, pages: Sequence[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Get many cached pages' HTML in one Redis round-trip.
+        
+        Args:
+            pages: (subdomain, path) pairs
+            
+        Returns:
+            Cached HTML or None per page, in the order given
+        """
+        bodies = await self.get_pages_gzip(pages)
+        return [gzip.decompress(body).decode() if body is not None else None for body in bodies]
+    
+    async def get_pages_gzip(self, pages: Sequence[Tuple[str, str]]) -> List[Optional[bytes]]:
+        """
+        Get many cached pages' HTML, gzip-compressed, in one Redis round-trip.
+        
+        Args:
+            pages: (subdomain, path) pairs
+            
+        Returns:
+            Compressed HTML or None per page, in the order given
+        """
+        cache_keys = [self._build_cache_key(subdomain, path) for subdomain, path in pages]
+        bodies = [self._local.get(cache_key) for cache_key in cache_keys]
+        
+        # Only pages missing from the local layer go to Redis, as one MGET
+        missing = [i for i, body in enumerate(bodies) if body is None]
+        if not missing:
+            return bodies
+        
+        if not self.redis_client:
+            await self.connect()
+        
+        try:
+            fetched = await self.redis_client.mget([cache_keys[i] for i in missing])
+        except Exception as e:
+            # Log error but don't fail - just skip cache
+            print(f"Cache get many error: {e}")
+            return bodies
+        
+        for i, body in zip(missing, fetched):
+            if body is not None:
+                bodies[i] = self._remember_body(cache_keys[i], body)
+        return bodies
+    
+    def _remember_body(self, cache_key: str, body: bytes) -> bytes:
+        """Keep a page body read from Redis in the local layer, compressed."""
+        if not body.startswith(_GZIP_MAGIC):
+            # Plain HTML cached before pages were compressed
+            body = gzip.compress(body, compresslevel=PAGE_COMPRESS_LEVEL, mtime=0)
+        self._local[cache_key] = body
+        return body
+    
+    async def get_or_set_page(
+        self,
+        subdomain: str,
+        path: str,
+        producer: Callable[[], Awaitable[Optional[bytes]]],
+        ttl: Optional[int] = None,
+    ) -> Optional[bytes]:
+        """
+        Get cached page HTML, producing and caching it once on a miss.
+        
+        Concurrent misses for the same page are single-flighted: within this
+        process they queue on a lock, and across processes only the holder
+        of a Redis fill sentinel (SET NX PX) calls the producer while the
+        others poll the cache. A waiter that outlasts FILL_WAIT_SECONDS
+        renders the page itself rather than fail.
+        
+        Args:
+            subdomain: Page subdomain
+            path: Page path
+            producer: Coroutine function returning the UTF-8 encoded HTML, or
+                None to skip caching (e.g. page not found)
+            ttl: Time to live in seconds (defaults to 1 hour)
+            
+        Returns:
+            Page HTML gzip-compressed, or None if the producer returned None
+        """
+        body = await self.get_page_gzip(subdomain, path)
+        if body is not None:
+            return body
+        
+        cache_key = self._build_cache_key(subdomain, path)
+        # Every request queued on the lock holds a reference to it, so the
+        # weak map drops it only once no request is holding or awaiting it
+        lock = self._fill_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            # Filled while this request queued on the lock
+            body = await self.get_page_gzip(subdomain, path)
+            if body is not None:
+                return body
+            
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + FILL_WAIT_SECONDS
+            delay = 0.05
+            while True:
+                token = await self._acquire_fill_lock(cache_key)
+                if token is not None or loop.time() >= deadline:
+                    break
+                # Another process is filling; wait for its result
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                body = await self.get_page_gzip(subdomain, path)
+                if body is not None:
+                    return body
+            
+            try:
+                html = await producer()
+                if html is None:
+                    return None
+                body = self._compress_page(html)
+                await self._set_page_body(cache_key, body, self._hash_page(html), ttl)
+                return body
+            finally:
+                if token is not None:
+                    await self._release_fill_lock(cache_key, token)
+    
+    async def _acquire_fill_lock(self, cache_key: str) -> Optional[str]:
+        """Take the fill sentinel for a key; returns its token, or None if held."""
+        if not self.redis_client:
+            await self.connect()
+        
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis_client.set(
+                f"lock:{cache_key}", token, nx=True, px=FILL_LOCK_TTL_MS
+            )
+        except Exception as e:
+            # Without Redis there is nothing to coordinate; fill locally
+            print(f"Cache fill lock error: {e}")
+            return token
+        return token if acquired else None
+    
+    async def _release_fill_lock(self, cache_key: str, token: str):
+        """Release the fill sentinel if this request still holds it."""
+        try:
+            lock_key = f"lock:{cache_key}"
+            if await self.redis_client.get(lock_key) == token.encode():
+                await self.redis_client.delete(lock_key)
+        except Exception as e:
+            print(f"Cache fill unlock error: {e}")
     
     async def set_page(self, subdomain: str, path: str, html: str, ttl: Optional[int] = None):
         """
@@ -68,18 +262,111 @@ class PageCache:
             html: Rendered HTML to cache
             ttl: Time to live in seconds (defaults to 1 hour)
         """
+        cache_key = self._build_cache_key(subdomain, path)
+        html_bytes = html.encode()
+        
+        # Re-rendering a page usually produces the same HTML; then only the
+        # TTL is refreshed instead of rewriting (and replicating) the value
+        content_hash = self._hash_page(html_bytes)
+        if await self._refresh_if_unchanged(cache_key, content_hash, ttl):
+            # Redis holds this HTML; a local copy may predate it
+            self._local.pop(cache_key, None)
+            return
+        
+        await self._set_page_body(cache_key, self._compress_page(html_bytes), content_hash, ttl)
+    
+    async def _refresh_if_unchanged(
+        self, cache_key: str, content_hash: str, ttl: Optional[int] = None
+    ) -> bool:
+        """Extend a cached page's TTL if its stored hash matches; returns whether it did."""
         if not self.redis_client:
             await self.connect()
         
-        cache_key = self._build_cache_key(subdomain, path)
         ttl = ttl or self.ttl
+        hash_key = self._build_hash_key(cache_key)
         
         try:
-            await self.redis_client.setex(cache_key, ttl, html)
+            if await self.redis_client.get(hash_key) != content_hash.encode():
+                return False
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.expire(cache_key, ttl)
+            pipe.expire(hash_key, ttl)
+            # The page itself may have been invalidated or evicted since
+            page_refreshed, _ = await pipe.execute()
+        except Exception as e:
+            print(f"Cache hash check error: {e}")
+            return False
+        return bool(page_refreshed)
+    
+    async def set_pages(self, pages: Sequence[Tuple[str, str, str]], ttl: Optional[int] = None):
+        """
+        Cache many pages' HTML in one Redis round-trip.
+        
+        Args:
+            pages: (subdomain, path, html) triples
+            ttl: Time to live in seconds (defaults to 1 hour)
+        """
+        if not pages:
+            return
+        
+        if not self.redis_client:
+            await self.connect()
+        
+        ttl = ttl or self.ttl
+        
+        # Pipelined, not MULTI: the pages are independent of each other
+        pipe = self.redis_client.pipeline(transaction=False)
+        for subdomain, path, html in pages:
+            cache_key = self._build_cache_key(subdomain, path)
+            html_bytes = html.encode()
+            body = self._compress_page(html_bytes)
+            self._local[cache_key] = body
+            pipe.setex(cache_key, ttl, body)
+            pipe.setex(self._build_hash_key(cache_key), ttl, self._hash_page(html_bytes))
+        
+        try:
+            await pipe.execute()
+        except Exception as e:
+            # Log error but don't fail - just skip caching
+            print(f"Cache set many error: {e}")
+    
+    async def _set_page_body(
+        self,
+        cache_key: str,
+        body: bytes,
+        content_hash: str,
+        ttl: Optional[int] = None,
+    ):
+        """
+        Cache a compressed page body in both layers.
+        
+        The content hash is written with it: set_page trusts a matching hash
+        to mean Redis already holds this HTML, so no writer may leave an
+        older hash behind.
+        """
+        if not self.redis_client:
+            await self.connect()
+        
+        ttl = ttl or self.ttl
+        self._local[cache_key] = body
+        
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.setex(cache_key, ttl, body)
+            pipe.setex(self._build_hash_key(cache_key), ttl, content_hash)
+            await pipe.execute()
         except Exception as e:
             # Log error but don't fail - just skip caching
             print(f"Cache set error: {e}")
     
+    def _hash_page(self, html: bytes) -> str:
+        """Hash encoded page HTML to detect unchanged re-renders."""
+        return xxhash.xxh3_64_hexdigest(html)
+    
+    def _compress_page(self, html: bytes) -> bytes:
+        """Compress encoded page HTML for storage (mtime=0 keeps output deterministic)."""
+        return gzip.compress(html, compresslevel=PAGE_COMPRESS_LEVEL, mtime=0)
+    
     async def invalidate_page(self, subdomain: str, path: str):
         """
         Invalidate cached page.
@@ -92,9 +379,10 @@ class PageCache:
             await self.connect()
         
         cache_key = self._build_cache_key(subdomain, path)
+        self._local.pop(cache_key, None)
         
         try:
-            await self.redis_client.delete(cache_key)
+            await self.redis_client.delete(cache_key, self._build_hash_key(cache_key))
         except Exception as e:
             print(f"Cache invalidate error: {e}")
     
@@ -110,15 +398,29 @@ class PageCache:
         
         pattern = f"page:{subdomain}:*"
         
+        prefix = pattern[:-1]
+        for cache_key in [key for key in self._local if key.startswith(prefix)]:
+            self._local.pop(cache_key, None)
+        
         try:
-            # Find all keys matching pattern
-            keys = []
-            async for key in self.redis_client.scan_iter(match=pattern):
-                keys.append(key)
-            
-            # Delete all matching keys
-            if keys:
-                await self.redis_client.delete(*keys)
+            # Scan in large batches and unlink matches once a full batch has
+            # built up: SCAN may return only a few matches per call when the
+            # subdomain's pages are sparse in the keyspace. UNLINK frees the
+            # values off Redis's main thread. The pages' content hashes go
+            # too, so a later set_page can't mistake them for live pages.
+            for match in (pattern, self._build_hash_key(pattern)):
+                pending = []
+                cursor = 0
+                while True:
+                    cursor, keys = await self.redis_client.scan(
+                        cursor, match=match, count=INVALIDATE_SCAN_COUNT
+                    )
+                    pending.extend(keys)
+                    if len(pending) >= INVALIDATE_SCAN_COUNT or (cursor == 0 and pending):
+                        await self.redis_client.unlink(*pending)
+                        pending = []
+                    if cursor == 0:
+                        break
         except Exception as e:
             print(f"Cache invalidate subdomain error: {e}")
     
@@ -131,6 +433,10 @@ class PageCache:
         
         return f"page:{subdomain}:{path}"
     
+    def _build_hash_key(self, cache_key: str) -> str:
+        """Build the Redis key holding a cached page's content hash."""
+        return f"hash:{cache_key}"
+    
     async def get_sitemap(self, subdomain: str) -> Optional[str]:
         """
         Get cached sitemap XML.
@@ -147,7 +453,8 @@ class PageCache:
         cache_key = f"sitemap:{subdomain}"
         
         try:
-            return await self.redis_client.get(cache_key)
+            xml = await self.redis_client.get(cache_key)
+            return xml.decode() if xml is not None else None
         except Exception as e:
             print(f"Sitemap cache get error: {e}")
             return None
@@ -1,5 +1,6 @@
 """Quota management and enforcement service."""
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
 from typing import Optional, Tuple
 from dateutil.relativedelta import relativedelta
 
@@ -35,27 +36,33 @@ def get_billing_period(org: Org, reference_date: Optional[datetime] = None) -> T
     if reference_date is None:
         reference_date = datetime.utcnow()
     
-    anchor_day = org.billing_cycle_anchor
+    # Periods start at midnight, so the period depends only on the day
+    return _compute_billing_period(
+        org.billing_cycle_anchor, reference_date.date(), reference_date.tzinfo
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compute_billing_period(
+    anchor_day: int, reference_day: date, tz: Optional[tzinfo]
+) -> Tuple[datetime, datetime]:
+    """
+    Calculate the billing period containing a day, cached per anchor and day.
+    
+    Called on every quota check; the period only changes once a month.
+    """
+    reference_date = datetime(
+        reference_day.year, reference_day.month, reference_day.day, tzinfo=tz
+    )
     
     # Start with the anchor day in the current month
     try:
-        period_start = reference_date.replace(
-            day=anchor_day,
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0
-        )
+        period_start = reference_date.replace(day=anchor_day)
     except ValueError:
         # Handle months that don't have the anchor day (e.g., Feb 30)
         # Use the last day of the month instead
         next_month = reference_date.replace(day=1) + relativedelta(months=1)
-        period_start = (next_month - timedelta(days=1)).replace(
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0
-        )
+        period_start = next_month - timedelta(days=1)
     
     # If we're before the anchor day this month, the period started last month
     if reference_date < period_start:
@@ -118,31 +125,49 @@ def get_or_create_usage(db: Session, org: Org, lock_for_update: bool = False) ->
     # Get current billing period
     period_start, period_end = get_billing_period(org)
     
-    # Find or create usage record for this period
-    query = db.query(OrgMonthlyUsage).filter(
-        OrgMonthlyUsage.org_id == org.id,
-        OrgMonthlyUsage.period_start == period_start
+    # Find or create usage record for this period, safe against concurrent creators
+    return OrgMonthlyUsage.get_or_create(
+        db, org.id, period_start, period_end, lock_for_update=lock_for_update
     )
+
+
+def increment_usage(
+    db: Session,
+    org: Org,
+    *,
+    scans: int = 0,
+    prompts: int = 0,
+    pages: int = 0,
+) -> OrgMonthlyUsage:
+    """
+    Add to the org's current billing period usage in a single round-trip.
     
-    if lock_for_update:
-        # Lock the row to prevent concurrent modifications
-        query = query.with_for_update()
-    
-    usage = query.first()
+    The usage row stays locked until the caller commits or rolls back, so a
+    caller can check the returned totals and roll back to release the
+    reservation.
     
-    if not usage:
-        usage = OrgMonthlyUsage(
-            org_id=org.id,
-            period_start=period_start,
-            period_end=period_end,
-            scans_used=0,
-            prompts_used=0,
-            ai_pages_generated=0,
-        )
-        db.add(usage)
-        db.flush()  # Flush to get ID without committing
+    Args:
+        db: Database session
+        org: Organization
+        scans: Scan credits to add
+        prompts: Prompts to add
+        pages: AI pages to add
+        
+    Returns:
+        OrgMonthlyUsage record with post-increment totals
+    """
+    initialize_billing_period(org, db)
+    period_start, period_end = get_billing_period(org)
     
-    return usage
+    return OrgMonthlyUsage.bump(
+        db,
+        org.id,
+        period_start,
+        period_end,
+        scans=scans,
+        prompts=prompts,
+        pages=pages,
+    )
 
 
 def assert_within_limit(current: int, limit: Optional[int], resource: str) -> None:
@@ -6,7 +6,8 @@ Validates and generates JSON-LD structured data for knowledge pages.
 
 from typing import Dict, List, Optional
 from datetime import datetime
-import json
+
+import orjson
 
 
 class SchemaValidator:
@@ -302,10 +303,10 @@ class SchemaValidator:
                 if field not in schema:
                     errors.append(f"Missing required field for Product: {field}")
         
-        # Check if schema is valid JSON
+        # Check if schema is valid JSON, with the serializer the renderer uses
         try:
-            json.dumps(schema)
-        except (TypeError, ValueError) as e:
+            orjson.dumps(schema)
+        except orjson.JSONEncodeError as e:
             errors.append(f"Schema is not valid JSON: {str(e)}")
         
         return {
@@ -73,6 +73,7 @@ def redis_client() -> Generator[Redis, None, None]:
         # Fall back to mock if fakeredis not available
         redis = MagicMock(spec=Redis)
         redis.exists.return_value = False
+        redis.set.return_value = True
         redis.setex.return_value = True
         redis.expire.return_value = True
     
@@ -0,0 +1,27 @@
+"""Test billing period calculation."""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.services.quotas import get_billing_period
+
+
+def test_billing_period_depends_only_on_the_day():
+    """Any time of day maps to the same midnight-anchored period."""
+    org = SimpleNamespace(billing_cycle_anchor=15)
+
+    morning = get_billing_period(org, datetime(2025, 11, 20, 0, 0, 1))
+    evening = get_billing_period(org, datetime(2025, 11, 20, 23, 59, 59))
+    before_anchor = get_billing_period(org, datetime(2025, 11, 14, 12, 0))
+
+    assert morning == evening == (datetime(2025, 11, 15), datetime(2025, 12, 15))
+    assert before_anchor == (datetime(2025, 10, 15), datetime(2025, 11, 15))
+
+
+def test_billing_period_short_month_and_timezone():
+    """A missing anchor day falls back to month end; tz-aware input stays aware."""
+    org = SimpleNamespace(billing_cycle_anchor=31)
+
+    start, end = get_billing_period(org, datetime(2025, 2, 28, 9, tzinfo=timezone.utc))
+
+    assert start == datetime(2025, 2, 28, tzinfo=timezone.utc)
+    assert end == datetime(2025, 3, 28, tzinfo=timezone.utc)
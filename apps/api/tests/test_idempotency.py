@@ -1,5 +1,6 @@
 """Tests for idempotency key handling."""
 import pytest
+from rq import Queue
 from sqlalchemy.orm import Session
 
 from app.services.job_queue import JobQueueService
@@ -140,6 +141,55 @@ class TestIdempotencyKeys:
         )
         assert job2 is None
 
+    def test_failed_enqueue_releases_key(self, redis_client, monkeypatch):
+        """Test that a failed enqueue releases the idempotency key for retries."""
+        from rq import Queue
+
+        job_service = JobQueueService(redis_conn=redis_client)
+
+        def fail_enqueue(*args, **kwargs):
+            raise ConnectionError("queue unavailable")
+
+        monkeypatch.setattr(Queue, "enqueue", fail_enqueue)
+        with pytest.raises(ConnectionError):
+            job_service.enqueue_scan(scan_run_id=555)
+        monkeypatch.undo()
+
+        # Key was released, so the retry is not treated as a duplicate
+        job = job_service.enqueue_scan(scan_run_id=555)
+        assert job is not None
+
+    def test_bulk_scan_enqueue_skips_duplicates(self, redis_client):
+        """Test that bulk enqueue returns None for already-queued scans, in input order."""
+        job_service = JobQueueService(redis_conn=redis_client)
+
+        existing = job_service.enqueue_scan(scan_run_id=301)
+        assert existing is not None
+
+        jobs = job_service.enqueue_scans_bulk([300, 301, 302, 300])
+
+        assert [job is not None for job in jobs] == [True, False, True, False]
+        assert jobs[0].args == (300,)
+        assert jobs[2].args == (302,)
+
+    def test_get_job_statuses(self):
+        """Test batch status lookup skips missing jobs and leaves out results."""
+        fakeredis = pytest.importorskip("fakeredis")
+        # RQ stores pickled job data, so this needs a bytes connection
+        redis_conn = fakeredis.FakeRedis()
+        job_service = JobQueueService(redis_conn=redis_conn)
+
+        finished = Queue("scans", is_async=False, connection=redis_conn).enqueue(len, [1, 2, 3])
+        queued = job_service.enqueue_scan(scan_run_id=400)
+
+        statuses = job_service.get_job_statuses([finished.id, "missing", queued.id])
+
+        assert set(statuses) == {finished.id, queued.id}
+        assert statuses[finished.id]["status"] == "finished"
+        assert "result" not in statuses[finished.id]
+        assert statuses[queued.id]["status"] == "queued"
+        assert statuses[queued.id]["meta"]["idempotency_key"] == "scan:400"
+
     def test_job_metadata_propagation(self, db: Session, redis_client):
         """Test that request context is propagated to job metadata."""
         job_service = JobQueueService(redis_conn=redis_client)
@@ -0,0 +1,95 @@
+"""Test page impact analysis caching."""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.impact_analyzer import (
+    IMPACT_CACHE_TTL,
+    IMPACT_CACHE_TTL_SETTLED,
+    ImpactAnalyzer,
+    PeriodMetrics,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _make_analyzer(published_at: datetime):
+    """Analyzer over a fake page whose metric queries are counted."""
+    page = SimpleNamespace(
+        id=1,
+        brand_id=1,
+        title="Product Guide",
+        status="published",
+        published_at=published_at,
+        subdomain="acme",
+        path="/product-guide",
+    )
+    analyzer = ImpactAnalyzer(db=None, redis_client=fakeredis.FakeAsyncRedis())
+    calls = []
+
+    async def get_page(page_id):
+        return page
+
+    async def get_two_period_metrics(**kwargs):
+        calls.append(kwargs)
+        return (
+            PeriodMetrics(mentions=40, avg_sentiment=0.5, visibility_score=50.0),
+            PeriodMetrics(mentions=60, avg_sentiment=0.7, visibility_score=65.0),
+        )
+
+    analyzer._get_page = get_page
+    analyzer._get_two_period_metrics = get_two_period_metrics
+    return analyzer, page, calls
+
+
+def test_settled_impact_is_served_from_cache():
+    """A settled window is computed once, with fresh page details on each hit."""
+    published_at = datetime.utcnow() - timedelta(days=90)
+    analyzer, page, calls = _make_analyzer(published_at)
+
+    async def run():
+        first = await analyzer.get_page_impact("1")
+        page.title = "Renamed Guide"
+        second = await analyzer.get_page_impact("1")
+        key = f"impact:1:30:30:{int(published_at.timestamp())}"
+        return first, second, await analyzer.redis_client.ttl(key)
+
+    first, second, ttl = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert second["page"]["title"] == "Renamed Guide"
+    assert {k: v for k, v in second.items() if k != "page"} == {
+        k: v for k, v in first.items() if k != "page"
+    }
+    assert IMPACT_CACHE_TTL < ttl <= IMPACT_CACHE_TTL_SETTLED
+
+
+def test_open_window_uses_short_ttl():
+    """An after window that is still open is only cached briefly."""
+    published_at = datetime.utcnow() - timedelta(days=5)
+    analyzer, _, _ = _make_analyzer(published_at)
+
+    async def run():
+        await analyzer.get_page_impact("1")
+        key = f"impact:1:30:30:{int(published_at.timestamp())}"
+        return await analyzer.redis_client.ttl(key)
+
+    assert 0 < asyncio.run(run()) <= IMPACT_CACHE_TTL
+
+
+def test_first_position_earns_full_position_score():
+    """A median position of 0 (mentioned first) scores highest, not lowest."""
+    analyzer = ImpactAnalyzer(db=None)
+
+    def score(median_position):
+        return analyzer._calculate_simple_visibility_score(
+            mentions=50, avg_position=0.4, avg_sentiment=0.0, median_position=median_position
+        )
+
+    assert score(0.0) == 20 + 30 + 15
+    assert score(0.0) > score(1.0) > score(5.0)
+    assert analyzer._calculate_simple_visibility_score(
+        mentions=50, avg_position=None, avg_sentiment=0.0
+    ) == 20 + 15
@@ -4,7 +4,12 @@ from sqlalchemy.orm import Session
 
 from app.models.brand import Brand, Competitor
 from app.models.org import Org, PlanTier
-from app.services.mention_extractor import MentionExtractor, calculate_visibility_score
+from app.services.mention_extractor import (
+    MentionExtractor,
+    calculate_visibility_score,
+    calculate_visibility_score_with_breakdown,
+    calculate_visibility_scores_batch,
+)
 
 
 def test_mention_extraction(db: Session):
@@ -84,3 +89,24 @@ def test_visibility_score_calculation():
     )
     assert score == 0.0
 
+
+
+def test_visibility_scores_batch_matches_scalar():
+    """Batch scoring gives the same scores as one call per pair."""
+    cases = [
+        (10, [5, 3, 2], [0, 1, 0, 2, 1], [0.8, 0.6, 0.7]),
+        (2, [10, 8, 7], [5, 8], [0.2, 0.1]),
+        (0, [5, 3], [], []),
+        (4, [], [], [-0.5]),
+    ]
+
+    scores = calculate_visibility_scores_batch(
+        [count for count, _, _, _ in cases],
+        [sum(competitors) for _, competitors, _, _ in cases],
+        [sum(positions) / len(positions) if positions else None for _, _, positions, _ in cases],
+        [sum(sentiments) / len(sentiments) if sentiments else None for _, _, _, sentiments in cases],
+    )
+
+    assert scores == [
+        calculate_visibility_score_with_breakdown(*case)["score"] for case in cases
+    ]
@@ -0,0 +1,239 @@
+"""Test rendered page caching."""
+import asyncio
+import gzip
+
+import pytest
+
+from app.services.page_cache import PageCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def test_invalidate_subdomain_removes_only_its_pages():
+    """Invalidating a subdomain drops every cached page under it and nothing else."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+
+    async def run():
+        for i in range(2500):
+            await cache.set_page("acme", f"/guide-{i}", "<html></html>")
+        await cache.set_page("other", "/guide-0", "<html></html>")
+        await cache.set_sitemap("acme", "<urlset></urlset>")
+
+        await cache.invalidate_subdomain("acme")
+
+        return (
+            [key async for key in cache.redis_client.scan_iter(match="*acme:*")],
+            await cache.get_page("other", "/guide-0"),
+            await cache.get_sitemap("acme"),
+        )
+
+    remaining, other_page, sitemap = asyncio.run(run())
+
+    assert remaining == []
+    assert other_page == "<html></html>"
+    assert sitemap == "<urlset></urlset>"
+
+
+def test_local_layer_serves_hot_pages_and_follows_invalidation():
+    """Repeat reads skip Redis; invalidation clears the in-process copy too."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+
+    async def run():
+        await cache.set_page("acme", "/guide", "<html>v1</html>")
+        # Changed behind this process's back: the local copy still answers
+        await cache.redis_client.set("page:acme:guide", "<html>v2</html>")
+        hot = await cache.get_page("acme", "/guide")
+
+        await cache.invalidate_page("acme", "/guide")
+        after_invalidate = await cache.get_page("acme", "/guide")
+
+        await cache.redis_client.set("page:acme:guide", "<html>v3</html>")
+        refetched = await cache.get_page("acme", "/guide")
+        await cache.invalidate_subdomain("acme")
+        after_subdomain = await cache.get_page("acme", "/guide")
+
+        return hot, after_invalidate, refetched, after_subdomain
+
+    assert asyncio.run(run()) == ("<html>v1</html>", None, "<html>v3</html>", None)
+
+
+def test_concurrent_misses_render_once():
+    """Concurrent misses for one page call the producer once and share its HTML."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+    calls = []
+
+    async def render():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return b"<html>rendered</html>"
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_set_page("acme", "/guide", render) for _ in range(10))
+        )
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert [gzip.decompress(body) for body in results] == [b"<html>rendered</html>"] * 10
+    assert len(cache._fill_locks) == 0
+
+
+def test_waiter_picks_up_page_filled_by_another_process():
+    """A request that loses the fill sentinel waits for the holder's result."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+
+    async def render():
+        raise AssertionError("should not render while another process fills")
+
+    async def run():
+        # Another process holds the sentinel and fills the page shortly
+        await cache.redis_client.set("lock:page:acme:guide", "other", px=10000)
+
+        async def other_process_fill():
+            await asyncio.sleep(0.1)
+            await cache.redis_client.set("page:acme:guide", "<html>theirs</html>")
+
+        filler = asyncio.create_task(other_process_fill())
+        html = await cache.get_or_set_page("acme", "/guide", render)
+        await filler
+        return html
+
+    assert gzip.decompress(asyncio.run(run())) == b"<html>theirs</html>"
+
+
+def test_pages_are_stored_gzipped_and_legacy_entries_still_read():
+    """Pages are cached compressed; plain HTML cached earlier still reads back."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+    html = "<html>" + "<p>guide</p>" * 200 + "</html>"
+
+    async def run():
+        await cache.set_page("acme", "/guide", html)
+        stored = await cache.redis_client.get("page:acme:guide")
+
+        await cache.redis_client.set("page:acme:legacy", html)
+        legacy = await cache.get_page("acme", "/legacy")
+        legacy_gzip = await cache.get_page_gzip("acme", "/legacy")
+
+        return stored, await cache.get_page("acme", "/guide"), legacy, legacy_gzip
+
+    stored, page, legacy, legacy_gzip = asyncio.run(run())
+
+    assert len(stored) < len(html) / 10
+    assert gzip.decompress(stored).decode() == html
+    assert page == html
+    assert legacy == html
+    assert gzip.decompress(legacy_gzip).decode() == html
+
+
+def test_get_pages_reads_many_pages_in_one_round_trip():
+    """Bulk reads return pages in order, with None for misses."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+    mget_calls = []
+    mget = cache.redis_client.mget
+
+    async def counting_mget(keys):
+        mget_calls.append(keys)
+        return await mget(keys)
+
+    cache.redis_client.mget = counting_mget
+
+    async def run():
+        await cache.set_pages([("acme", "/a", "<html>a</html>"), ("acme", "/b", "<html>b</html>")])
+        # Only pages missing from the local layer go to Redis
+        cache._local.pop("page:acme:b")
+        return await cache.get_pages([("acme", "/a"), ("acme", "/missing"), ("acme", "/b")])
+
+    pages = asyncio.run(run())
+
+    assert pages == ["<html>a</html>", None, "<html>b</html>"]
+    assert mget_calls == [["page:acme:missing", "page:acme:b"]]
+
+
+def test_set_page_skips_rewrite_when_html_is_unchanged():
+    """Unchanged HTML only refreshes the TTL; changed or invalidated pages are written."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+    writes = []
+    set_page_body = cache._set_page_body
+
+    async def counting_set_page_body(cache_key, *args):
+        writes.append(cache_key)
+        await set_page_body(cache_key, *args)
+
+    cache._set_page_body = counting_set_page_body
+
+    async def run():
+        await cache.set_page("acme", "/guide", "<html>v1</html>", ttl=60)
+        await cache.set_page("acme", "/guide", "<html>v1</html>", ttl=600)
+        ttl = await cache.redis_client.ttl("page:acme:guide")
+        unchanged_writes = len(writes)
+
+        await cache.set_page("acme", "/guide", "<html>v2</html>")
+        await cache.invalidate_page("acme", "/guide")
+        await cache.set_page("acme", "/guide", "<html>v2</html>")
+        return ttl, unchanged_writes, await cache.get_page("acme", "/guide")
+
+    ttl, unchanged_writes, page = asyncio.run(run())
+
+    assert ttl > 60
+    assert unchanged_writes == 1
+    assert len(writes) == 3
+    assert page == "<html>v2</html>"
+
+
+def test_set_page_rewrites_page_replaced_by_another_writer():
+    """A fill or bulk write in between leaves no stale hash for set_page to trust."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+
+    async def render():
+        return b"<html>B</html>"
+
+    async def run():
+        await cache.set_page("acme", "/guide", "<html>A</html>")
+        await cache.invalidate_page("acme", "/guide")
+        await cache.get_or_set_page("acme", "/guide", render)
+        await cache.set_page("acme", "/guide", "<html>A</html>")
+        after_fill = await cache.redis_client.get("page:acme:guide")
+
+        await cache.set_pages([("acme", "/guide", "<html>B</html>")])
+        await cache.set_page("acme", "/guide", "<html>A</html>")
+        after_bulk = await cache.redis_client.get("page:acme:guide")
+        return after_fill, after_bulk
+
+    after_fill, after_bulk = asyncio.run(run())
+
+    assert gzip.decompress(after_fill) == b"<html>A</html>"
+    assert gzip.decompress(after_bulk) == b"<html>A</html>"
+
+
+def test_fill_lock_outlives_holder_while_requests_wait():
+    """The fill lock stays registered while queued requests still need it."""
+    cache = PageCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+    seen_locks = []
+
+    async def render_missing():
+        lock = cache._fill_locks.get("page:acme:guide")
+        seen_locks.append(id(lock) if lock is not None else None)
+        await asyncio.sleep(0.01)
+        return None  # e.g. page not found: nothing is cached
+
+    async def run():
+        await asyncio.gather(
+            *(cache.get_or_set_page("acme", "/guide", render_missing) for _ in range(3))
+        )
+
+    asyncio.run(run())
+
+    assert len(seen_locks) == 3
+    assert seen_locks[0] is not None
+    assert seen_locks == [seen_locks[0]] * 3
+    assert len(cache._fill_locks) == 0
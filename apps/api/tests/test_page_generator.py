@@ -0,0 +1,111 @@
+"""Test knowledge page generation helpers."""
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from app.services.page_generator import FETCH_BYTE_BUDGET, PageGenerator
+
+
+def test_mdx_to_html_converts_every_header_and_list():
+    """Each ##/### line becomes its own closed header; lists are wrapped."""
+    generator = PageGenerator(SimpleNamespace(name="Acme", website="https://acme.com"))
+    mdx = "## Summary\nAcme is a CRM.\n### Key Features\n- Fast\n- Cheap\n## FAQ\n### Is it good?\nYes."
+
+    html = generator._mdx_to_html(mdx)
+
+    assert html == (
+        "<div class='prose'><h2>Summary</h2>\n"
+        "Acme is a CRM.\n"
+        "<h3>Key Features</h3>\n"
+        "<ul>\n<li>Fast</li>\n<li>Cheap</li>\n</ul>\n"
+        "<h2>FAQ</h2>\n"
+        "<h3>Is it good?</h3>\n"
+        "Yes.</div>"
+    )
+
+
+def test_extract_facts_crawls_concurrently_and_skips_failures(monkeypatch):
+    """URLs are fetched together; failed ones are dropped and order is kept."""
+    in_flight = []
+    peak = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.pop()
+        if request.url.path == "/broken":
+            return httpx.Response(500)
+        return httpx.Response(200, html=f"<p>{request.url.path}</p><script>x</script>")
+
+    generator = PageGenerator(SimpleNamespace(name="Acme", website="https://acme.com"))
+    transport = httpx.MockTransport(handler)
+    original_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        return original_client(transport=transport, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", client_factory)
+    facts = asyncio.run(
+        generator._extract_facts(
+            ["https://acme.com/a", "https://acme.com/broken", "https://acme.com/b"]
+        )
+    )
+
+    assert [fact["content"] for fact in facts] == ["/a", "/b"]
+    assert max(peak) == 3
+
+
+def test_fetch_fact_strips_chrome_and_keeps_surrounding_text():
+    """Script/style/nav/footer are dropped; text around them and XHTML pages are kept."""
+    page = (
+        "<?xml version='1.0' encoding='utf-8'?>"
+        "<html><head><style>p {}</style></head><body>"
+        "<nav>Home</nav>Intro  text\n<p>Café <b>bold</b></p><footer>(c)</footer>\ntail"
+        "</body></html>"
+    )
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, html=page))
+    generator = PageGenerator(SimpleNamespace(name="Acme", website="https://acme.com"))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await generator._fetch_fact(client, "https://acme.com/")
+
+    fact = asyncio.run(run())
+
+    assert fact["content"] == "Intro text Café bold tail"
+
+
+def test_fetch_fact_stops_reading_at_byte_budget():
+    """Only the first FETCH_BYTE_BUDGET bytes of a large page are downloaded."""
+    sent = []
+
+    async def body():
+        yield b"<html><body><p>Intro</p>"
+        for _ in range(1000):
+            sent.append(1)
+            yield b"<p>" + b"x" * 1024 + b"</p>"
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    generator = PageGenerator(SimpleNamespace(name="Acme", website="https://acme.com"))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await generator._fetch_fact(client, "https://acme.com/")
+
+    fact = asyncio.run(run())
+
+    assert fact["content"].startswith("Intro")
+    assert len(fact["content"]) == 5000
+    assert len(sent) * 1024 < 2 * FETCH_BYTE_BUDGET
+
+
+def test_calculate_page_score_counts_headers_and_lists():
+    """Headers and lists each add 25 points, whichever tag provides them."""
+    generator = PageGenerator(SimpleNamespace(name="Acme", website="https://acme.com"))
+    schema = {"@type": "Product"}
+
+    assert generator._calculate_page_score("<h3>A</h3><ol><li>b</li></ol>", schema) == 75.0
+    assert generator._calculate_page_score("<h2>A</h2><p>b</p>", schema) == 50.0
+    assert generator._calculate_page_score("<h4>A</h4><p>b</p>", {}) == 0.0
@@ -1,4 +1,6 @@
 """Tests for cursor-based pagination."""
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -6,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.models.brand import Brand
 from app.models.org import Org, OrgMember, OrgRole
 from app.models.user import User
+from app.schemas.pagination import decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -136,3 +139,30 @@ class TestCursorPagination:
         response = client.get(f"/v1/brands?org_id={org_id}&limit=100")
         assert response.status_code == 200
 
+
+class TestCursorEncoding:
+    """Test the binary cursor format."""
+
+    def test_roundtrip_with_created_at(self):
+        """Test id and microsecond timestamp survive a round trip."""
+        created_at = datetime(2025, 11, 11, 8, 30, 15, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor(42, created_at)
+
+        assert decode_cursor(cursor) == {"id": 42, "created_at": created_at}
+        assert len(cursor) == 22  # 16 bytes, unpadded URL-safe base64
+
+    def test_naive_created_at_is_utc(self):
+        """Test naive timestamps are treated as UTC."""
+        cursor = encode_cursor(7, datetime(2025, 1, 1, 12, 0))
+
+        assert decode_cursor(cursor)["created_at"] == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_roundtrip_id_only(self):
+        """Test cursors without a timestamp."""
+        assert decode_cursor(encode_cursor(99)) == {"id": 99}
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors decode to None."""
+        assert decode_cursor("invalid") is None
+        assert decode_cursor("") is None
+        assert decode_cursor(None) is None
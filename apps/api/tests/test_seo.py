@@ -0,0 +1,14 @@
+"""Test public page serving helpers."""
+from app.api.v1.endpoints.seo import accepts_gzip
+
+
+def test_accepts_gzip_honours_q_values():
+    """gzip is sent only when the client gives it a non-zero quality."""
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, GZIP;q=0.5")
+    assert accepts_gzip("*")
+    assert not accepts_gzip("")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("gzip;q=0.000, *;q=1")
+    assert not accepts_gzip("*;q=0")
+    assert not accepts_gzip("deflate, br")
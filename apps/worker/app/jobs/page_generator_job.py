@@ -45,7 +45,7 @@ async def generate_page_content_async(
         logger.info(f"Generating content for page {page_id}: {page.title}")
 
         # Get brand
-        brand = db.query(Brand).filter(Brand.id == page.brand_id).first()
+        brand = db.get(Brand, page.brand_id)
 
         # Generate page
         generator = PageGenerator(brand)
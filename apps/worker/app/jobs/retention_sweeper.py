@@ -91,23 +91,17 @@ def delete_old_scans(db: Session, org: Org, retention_days: int, max_deletions:
     )
     
     for scan_run in old_scan_runs:
-        # Count and delete related mentions
-        mention_count = db.query(Mention).filter(
-            Mention.scan_result.has(scan_run_id=scan_run.id)
-        ).count()
+        # Delete related mentions (counts come from the run's rollup columns)
         db.query(Mention).filter(
             Mention.scan_result.has(scan_run_id=scan_run.id)
         ).delete(synchronize_session=False)
-        mentions_deleted += mention_count
+        mentions_deleted += scan_run.mention_count
         
-        # Count and delete scan results
-        result_count = db.query(ScanResult).filter(
-            ScanResult.scan_run_id == scan_run.id
-        ).count()
+        # Delete scan results
         db.query(ScanResult).filter(
             ScanResult.scan_run_id == scan_run.id
         ).delete(synchronize_session=False)
-        results_deleted += result_count
+        results_deleted += scan_run.result_count
         
         # Delete scan run
         db.delete(scan_run)
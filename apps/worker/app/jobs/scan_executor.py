@@ -10,7 +10,7 @@ from typing import List
 # Add parent directory to path to import from api
 sys.path.append(os.path.join(os.path.dirname(__file__), "../../../api"))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
@@ -53,7 +53,7 @@ async def execute_scan_run_async(scan_run_id: int) -> None:
         logger.info(f"Executing scan run {scan_run_id}")
 
         # Get brand
-        brand = db.query(Brand).filter(Brand.id == scan_run.brand_id).first()
+        brand = db.get(Brand, scan_run.brand_id)
 
         # Get prompt set
         prompt_set = (
@@ -79,6 +79,10 @@ async def execute_scan_run_async(scan_run_id: int) -> None:
                 logger.error(f"Failed to get provider for {model_key}: {e}")
                 continue
 
+            # Results for this model are written in one batch once all prompts ran
+            result_rows = []
+            result_mentions = []
+
             for prompt_item in prompt_items:
                 try:
                     # Get prompt text
@@ -100,37 +104,20 @@ Do not fabricate URLs or sources. If you don't know something, say so."""
                         max_tokens=2000,
                     )
 
-                    # Save result
-                    scan_result = ScanResult(
-                        scan_run_id=scan_run.id,
-                        model_name=model_key,
-                        prompt_text=prompt_text,
-                        raw_response=response.text,
-                        parsed_json=response.raw_response,
-                    )
-
-                    db.add(scan_result)
-                    db.commit()
-                    db.refresh(scan_result)
-
                     # Extract mentions
                     extractor = MentionExtractor(db, brand)
                     mentions = extractor.extract_mentions(response.text)
 
-                    # Save mentions
-                    for mention_data in mentions:
-                        mention = Mention(
-                            scan_result_id=scan_result.id,
-                            entity_name=mention_data["entity_name"],
-                            entity_type=mention_data["entity_type"],
-                            sentiment=mention_data.get("sentiment"),
-                            position_index=mention_data.get("position_index"),
-                            confidence=mention_data.get("confidence"),
-                            cited_urls_json=mention_data.get("cited_urls"),
-                        )
-                        db.add(mention)
-
-                    db.commit()
+                    result_rows.append(
+                        {
+                            "scan_run_id": scan_run.id,
+                            "model_name": model_key,
+                            "prompt_text": prompt_text,
+                            "raw_response": response.text,
+                            "parsed_json": response.raw_response,
+                        }
+                    )
+                    result_mentions.append(mentions)
 
                     logger.info(
                         f"Processed prompt for {model_key}, found {len(mentions)} mentions"
@@ -140,6 +127,25 @@ Do not fabricate URLs or sources. If you don't know something, say so."""
                     logger.error(f"Error processing prompt with {model_key}: {e}")
                     continue
 
+            # Save results and their mentions
+            result_ids = ScanResult.bulk_create(db, result_rows)
+            mention_rows = [
+                {
+                    "scan_result_id": result_id,
+                    "entity_name": mention_data["entity_name"],
+                    "entity_type": mention_data["entity_type"],
+                    "sentiment": mention_data.get("sentiment"),
+                    "position_index": mention_data.get("position_index"),
+                    "confidence": mention_data.get("confidence"),
+                    "cited_urls_json": mention_data.get("cited_urls"),
+                }
+                for result_id, mentions in zip(result_ids, result_mentions)
+                for mention_data in mentions
+            ]
+            if mention_rows:
+                db.execute(insert(Mention), mention_rows)
+            db.commit()
+
         # Update scan run status
         scan_run.status = ScanStatus.DONE
         scan_run.finished_at = datetime.utcnow()